@@ -1,14 +1,21 @@
 import argparse
+import contextlib
+import io
+import json
 import multiprocessing
 import os
-import subprocess
 import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
 from functools import partial
-from typing import Dict, Literal
+from typing import Dict, List, Literal, Optional
 
 # Add project root to the Python path
 sys.path.insert(0, ".")
 
+from src.game_engine import GameEngine  # noqa: E402
+
 # Define result types
 ResultType = Literal["win", "loss", "timeout", "crash"]
 
@@ -18,76 +25,120 @@ for d in [LOG_DIR, CRASH_LOG_DIR]:
     if not os.path.exists(d):
         os.makedirs(d)
 
+# Same map size as `src/main.py --debug`
+MAP_WIDTH = 30
+MAP_HEIGHT = 15
+
+
+@dataclass
+class GameResult:
+    """Outcome of one benchmark game."""
+
+    seed: int
+    result: ResultType
+    turns: int = 0
+    seconds: float = 0.0
+    floors_visited: List[int] = field(default_factory=list)
+    cause_of_death: Optional[str] = None
+
+
+def find_cause_of_death(messages: List[str]) -> str:
+    """Returns what killed the player, judging by the final messages."""
+    for message in reversed(messages):
+        if message.startswith("The ") and " attacks you " in message:
+            return message[len("The ") : message.index(" attacks you ")]
+        if "cursed" in message.lower():
+            return "cursed item"
+    return "unknown"
+
+
+def write_game_log(directory: str, name: str, output: str) -> None:
+    """Writes the captured output of a game."""
+    with open(os.path.join(directory, name), "w") as f:
+        f.write(output)
 
-def run_game_with_timeout(
+
+def floors_visited(engine: GameEngine) -> List[int]:
+    """Returns the floors the player has seen any part of."""
+    return sorted(
+        floor_id
+        for floor_id, visible_map in engine.visible_maps.items()
+        if any(tile.is_explored for row in visible_map.grid for tile in row)
+    )
+
+
+def run_game(
     seed: int,
-    timeout_seconds: int = 1,
+    timeout_seconds: float = 1,
+    max_turns: int = 5000,
     log_limit: int = 1000,
-) -> tuple[ResultType, int]:
+) -> GameResult:
     """
-    Runs the game in a separate process with a timeout.
+    Plays one AI game in this process.
+
+    The game stops as a timeout once it has played `max_turns` turns or
+    used `timeout_seconds` of wall-clock time, checked between turns.
 
     Args:
         seed: The seed for the random number generator.
-        timeout_seconds: The timeout in seconds.
-        log_limit: The maximum number of logs to save for losses and timeouts.
+        timeout_seconds: Wall-clock budget for the game in seconds.
+        max_turns: Turn budget for the game.
+        log_limit: Only seeds below this write logs for losses, timeouts and
+                   crashes.
 
     Returns:
-        A tuple containing the result of the game run and the seed.
+        The GameResult of the game.
     """
-    command = [
-        "uv",
-        "run",
-        "python",
-        "src/main.py",
-        "--ai",
-        "--seed",
-        str(seed),
-        "--debug",
-        "--verbose",
-    ]
-    try:
-        process = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-            check=False,
-        )
-        output = process.stdout
-        error = process.stderr
-
-        if error:
+    started = time.perf_counter()
+    engine: Optional[GameEngine] = None
+    # Debug mode prints the map and final screen; keep it for the logs only.
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            engine = GameEngine(
+                map_width=MAP_WIDTH,
+                map_height=MAP_HEIGHT,
+                debug_mode=True,
+                ai_active=True,
+                ai_sleep_duration=0,
+                seed=seed,
+            )
+            run_result = engine.run(max_turns=max_turns, max_seconds=timeout_seconds)
+        except Exception:
             if seed < log_limit:
-                log_file = f"crash_seed_{seed}.log"
-                with open(os.path.join(CRASH_LOG_DIR, log_file), "w") as f:
-                    f.write("--- STDOUT ---\n")
-                    f.write(output)
-                    f.write("\n--- STDERR ---\n")
-                    f.write(error)
-            return "crash", seed
-
-        if "You win!" in output:
-            return "win", seed
-
-        if "Game Over" in output:
-            if seed < log_limit:
-                with open(os.path.join(LOG_DIR, f"loss_seed_{seed}.log"), "w") as f:
-                    f.write(output)
-            return "loss", seed
-
-        return "loss", seed
-    except subprocess.TimeoutExpired as e:
-        if seed < log_limit:
-            if e.stdout:
-                output = e.stdout.decode("utf-8", "ignore")
-            else:
-                output = "No output captured before timeout."
-
-            log_file = f"timeout_seed_{seed}.log"
-            with open(os.path.join(LOG_DIR, log_file), "w") as f:
-                f.write(output)
-        return "timeout", seed
+                write_game_log(
+                    CRASH_LOG_DIR,
+                    f"crash_seed_{seed}.log",
+                    f"--- STDOUT ---\n{output.getvalue()}\n"
+                    f"--- TRACEBACK ---\n{traceback.format_exc()}",
+                )
+            return GameResult(
+                seed=seed,
+                result="crash",
+                turns=engine.turn_count if engine else 0,
+                seconds=time.perf_counter() - started,
+                floors_visited=floors_visited(engine) if engine else [],
+            )
+
+    game_result = GameResult(
+        seed=seed,
+        result="loss",
+        turns=run_result.turns,
+        seconds=time.perf_counter() - started,
+        floors_visited=floors_visited(engine),
+    )
+    if run_result.limit_reached:
+        game_result.result = "timeout"
+    elif run_result.player_won:
+        game_result.result = "win"
+    elif run_result.player_health <= 0:
+        game_result.cause_of_death = find_cause_of_death(engine.message_log.messages)
+
+    if game_result.result != "win" and seed < log_limit:
+        write_game_log(
+            LOG_DIR, f"{game_result.result}_seed_{seed}.log", output.getvalue()
+        )
+    return game_result
 
 
 def main():
@@ -103,10 +154,21 @@ def main():
     )
     parser.add_argument(
         "--timeout",
-        type=int,
+        type=float,
         default=1,
         help="Timeout per game in seconds (default: 1).",
     )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=5000,
+        help="Turn budget per game (default: 5000).",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Also write the per-seed results to PATH as JSON.",
+    )
     args = parser.parse_args()
 
     num_seeds = args.seeds
@@ -114,25 +176,33 @@ def main():
 
     print(
         f"Running benchmark with Utility AI on {num_seeds} seeds "
-        f"(timeout={timeout_seconds}s)..."
+        f"(timeout={timeout_seconds}s, max turns={args.max_turns})..."
     )
 
     results: Dict[ResultType, int] = {"win": 0, "loss": 0, "timeout": 0, "crash": 0}
     timeout_seeds = []
     crash_seeds = []
 
-    # Create a partial function with the timeout
-    run_func = partial(run_game_with_timeout, timeout_seconds=timeout_seconds)
+    # Create a partial function with the budgets
+    run_func = partial(
+        run_game, timeout_seconds=timeout_seconds, max_turns=args.max_turns
+    )
 
+    started = time.perf_counter()
     with multiprocessing.Pool() as pool:
         run_results = pool.map(run_func, range(num_seeds))
-
-    for result, seed in run_results:
-        results[result] += 1
-        if result == "timeout":
-            timeout_seeds.append(seed)
-        elif result == "crash":
-            crash_seeds.append(seed)
+    elapsed = time.perf_counter() - started
+
+    causes_of_death: Dict[str, int] = {}
+    for game_result in run_results:
+        results[game_result.result] += 1
+        if game_result.result == "timeout":
+            timeout_seeds.append(game_result.seed)
+        elif game_result.result == "crash":
+            crash_seeds.append(game_result.seed)
+        if game_result.cause_of_death:
+            cause = game_result.cause_of_death
+            causes_of_death[cause] = causes_of_death.get(cause, 0) + 1
 
     if timeout_seeds:
         with open("timeout_seeds.txt", "w") as f:
@@ -146,8 +216,14 @@ def main():
                 f.write(f"{seed}\n")
         print(f"Saved {len(crash_seeds)} crash seeds to crash_seeds.txt")
 
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(game_result) for game_result in run_results], f, indent=1)
+        print(f"Saved per-seed results to {args.json}")
+
     total_runs = sum(results.values())
     win_percentage = (results["win"] / total_runs) * 100 if total_runs > 0 else 0
+    win_turns = [r.turns for r in run_results if r.result == "win"]
 
     print("\n--- AI Benchmark Results (Utility AI) ---")
     print(f"Total runs: {total_runs}")
@@ -156,6 +232,11 @@ def main():
     print(f"Timeouts: {results['timeout']}")
     print(f"Crashes: {results['crash']}")
     print(f"Win percentage: {win_percentage:.2f}%")
+    if win_turns:
+        print(f"Average turns per win: {sum(win_turns) / len(win_turns):.1f}")
+    for cause, count in sorted(causes_of_death.items(), key=lambda c: -c[1]):
+        print(f"Killed by {cause}: {count}")
+    print(f"Total time: {elapsed:.1f}s")
 
 
 if __name__ == "__main__":
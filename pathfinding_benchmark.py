@@ -0,0 +1,174 @@
+"""
+Micro-benchmark for the PathFinder.a_star_search engines.
+
+Builds one map per size, either a dungeon from SingleFloorBuilder or a single
+open room scattered with pillars (--layout open), picks random start/goal pairs
+on floor tiles and times every engine on the same queries. Paths returned by
+each engine are checked against the first engine so a speedup can never come
+from returning different routes. Engines that may pick other routes (any
+not in PathFinder.EXACT_ENGINES) must reach exactly the same goals, and the
+difference in total path length is reported instead.
+
+Engines that cache per-map data (e.g. "hpa") build it on their first query,
+which is timed separately as "setup".
+
+Usage:
+    python pathfinding_benchmark.py
+    python pathfinding_benchmark.py --sizes 30x15 80x40 --queries 200
+    python pathfinding_benchmark.py --layout open --engines astar jps
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Add project root to the Python path
+sys.path.insert(0, ".")
+
+from src.map_algorithms.pathfinding import PathFinder  # noqa: E402
+from src.map_builders.single_floor_builder import SingleFloorBuilder  # noqa: E402
+from src.world_map import WorldMap  # noqa: E402
+
+DEFAULT_SIZES = ["30x15", "80x40", "150x150", "300x300", "500x500"]
+LAYOUTS = ("dungeon", "open")
+
+
+def parse_size(size: str) -> Tuple[int, int]:
+    """Parses a "WIDTHxHEIGHT" string into a (width, height) tuple."""
+    width, height = size.lower().split("x")
+    return int(width), int(height)
+
+
+def build_open_room(width: int, height: int, rng: random.Random) -> WorldMap:
+    """A walled room, about a tenth of it covered by 1x1 to 3x3 pillars."""
+    world_map = WorldMap(width, height)
+    for y, x in world_map.iter_coords():
+        if x in (0, width - 1) or y in (0, height - 1):
+            world_map.set_tile_type(x, y, "wall")
+    for _ in range(width * height // 40):
+        pillar_x, pillar_y = rng.randrange(width), rng.randrange(height)
+        size = rng.randint(1, 3)
+        for y in range(pillar_y, min(pillar_y + size, height)):
+            for x in range(pillar_x, min(pillar_x + size, width)):
+                world_map.set_tile_type(x, y, "wall")
+    return world_map
+
+
+def build_queries(
+    world_map: WorldMap, count: int, rng: random.Random
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Returns `count` random (start, goal) pairs of floor tiles."""
+    floor_tiles = [
+        (x, y)
+        for y, x in world_map.iter_coords()
+        if (tile := world_map.get_tile(x, y)) and tile.type == "floor"
+    ]
+    return [(rng.choice(floor_tiles), rng.choice(floor_tiles)) for _ in range(count)]
+
+
+def time_engine(
+    engine: str,
+    world_map: WorldMap,
+    queries: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+) -> Tuple[float, float, List]:
+    """Runs every query with one engine. Returns (setup s, query s, paths)."""
+    path_finder = PathFinder(engine=engine)
+    width, height = world_map.width, world_map.height
+    started = time.perf_counter()
+    path_finder.a_star_search(world_map, queries[0][0], queries[0][1], width, height)
+    setup_seconds = time.perf_counter() - started
+
+    paths = []
+    started = time.perf_counter()
+    for start, goal in queries:
+        paths.append(path_finder.a_star_search(world_map, start, goal, width, height))
+    return setup_seconds, time.perf_counter() - started, paths
+
+
+def compare_paths(engine: str, paths: List, baseline_paths: List) -> Optional[str]:
+    """
+    Checks paths against the baseline engine's. Returns a description of the
+    mismatch, or None if they agree.
+    """
+    if engine in PathFinder.EXACT_ENGINES:
+        return None if paths == baseline_paths else "returned different paths!"
+    if [p is None for p in paths] != [p is None for p in baseline_paths]:
+        return "reached different goals!"
+    return None
+
+
+def extra_length(paths: List, baseline_paths: List) -> float:
+    """Total path length over the baseline's, as a fraction."""
+    found = [(p, b) for p, b in zip(paths, baseline_paths) if p and b]
+    baseline_length = sum(len(b) - 1 for _, b in found)
+    if not baseline_length:
+        return 0.0
+    return sum(len(p) - 1 for p, _ in found) / baseline_length - 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark A* pathfinding engines.")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Map sizes as WIDTHxHEIGHT (default: 30x15 up to 500x500).",
+    )
+    parser.add_argument(
+        "--queries", type=int, default=50, help="Start/goal pairs per map size."
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        default=["reference"] + [e for e in PathFinder.ENGINES if e != "reference"],
+        choices=PathFinder.ENGINES,
+        help="Engines to compare. Paths and speedups are relative to the first.",
+    )
+    parser.add_argument(
+        "--layout",
+        default="dungeon",
+        choices=LAYOUTS,
+        help="Dungeon maps from SingleFloorBuilder, or one open room.",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Map and query seed.")
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>9} {'engine':>10} {'setup ms':>9} {'total ms':>10} "
+        f"{'per query':>10} {'speedup':>8} {'length':>7}"
+    )
+    mismatches = 0
+    for size in args.sizes:
+        width, height = parse_size(size)
+        rng = random.Random(args.seed)
+        if args.layout == "open":
+            world_map = build_open_room(width, height, rng)
+        else:
+            world_map, _, _ = SingleFloorBuilder(width, height, rng).build()
+        queries = build_queries(world_map, args.queries, rng)
+
+        results: Dict[str, Tuple[float, float, List]] = {}
+        for engine in args.engines:
+            results[engine] = time_engine(engine, world_map, queries)
+
+        _, baseline_seconds, baseline_paths = results[args.engines[0]]
+        for engine, (setup_seconds, seconds, paths) in results.items():
+            mismatch = compare_paths(engine, paths, baseline_paths)
+            if mismatch:
+                mismatches += 1
+                print(f"{size:>9} {engine:>10} {mismatch}")
+            speedup = baseline_seconds / seconds if seconds else float("inf")
+            print(
+                f"{size:>9} {engine:>10} {setup_seconds * 1000:>9.1f} "
+                f"{seconds * 1000:>10.1f} "
+                f"{seconds * 1000 / len(queries):>8.2f}ms {speedup:>7.1f}x "
+                f"{extra_length(paths, baseline_paths):>+6.1%}"
+            )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
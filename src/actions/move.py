@@ -137,8 +137,7 @@ class MoveAction:
             elif target_tile and target_tile.player:
                 pass  # Monster bumps into player, do nothing
             else:
-                self.world_map.remove_monster(entity.x, entity.y)
-                self.world_map.place_monster(entity, new_x, new_y)
+                self.world_map.move_monster(entity, new_x, new_y)
 
         return {"game_over": current_game_over_state}
 
@@ -28,6 +28,8 @@ class AttackAction(AIAction):
     - 0.35: risky engagement (last resort)
     """
 
+    max_utility = 0.90
+
     @property
     def name(self) -> str:
         return "Attack"
@@ -143,6 +145,8 @@ class UseCombatItemAction(AIAction):
     - Facing 2+ adjacent monsters with fire potion (area damage)
     """
 
+    max_utility = 0.91
+
     @property
     def name(self) -> str:
         return "UseCombatItem"
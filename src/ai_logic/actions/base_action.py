@@ -30,8 +30,16 @@ class AIAction(ABC):
     IMPORTANT: Actions must NOT modify AIContext. They receive
     a mutable AILogic reference only in execute() for side effects
     like clearing paths or logging messages.
+
+    Attributes:
+        max_utility: Upper bound on what calculate_utility can return. The
+                     UtilityCalculator skips evaluating an action once a
+                     better-scoring action has been found, so the bound must
+                     never be exceeded.
     """
 
+    max_utility: float = 1.0
+
     @property
     @abstractmethod
     def name(self) -> str:
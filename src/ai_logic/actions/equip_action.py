@@ -32,6 +32,8 @@ class EquipAction(AIAction):
     Utility Score: 0.75
     """
 
+    max_utility = 0.75
+
     @property
     def name(self) -> str:
         return "Equip"
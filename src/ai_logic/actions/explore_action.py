@@ -7,7 +7,7 @@ and paths to them.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from .base_action import AIAction
 
@@ -24,6 +24,8 @@ class ExploreAction(AIAction):
     Utility Score: 0.30 (constant when unexplored tiles exist)
     """
 
+    max_utility = 0.50
+
     @property
     def name(self) -> str:
         return "Explore"
@@ -33,9 +35,7 @@ class ExploreAction(AIAction):
         if not ctx.explorer:
             return False
 
-        exploration_path = ctx.explorer.find_exploration_targets(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        exploration_path = self._exploration_path(ctx)
         return exploration_path is not None and len(exploration_path) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -51,9 +51,7 @@ class ExploreAction(AIAction):
         if not ctx.explorer:
             return 0.35
 
-        exploration_path = ctx.explorer.find_exploration_targets(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        exploration_path = self._exploration_path(ctx)
 
         if not exploration_path:
             return 0.0
@@ -78,14 +76,13 @@ class ExploreAction(AIAction):
         if not ctx.explorer:
             return None
 
-        exploration_path = ctx.explorer.find_exploration_targets(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        exploration_path = self._exploration_path(ctx)
 
         if not exploration_path:
             return None
 
-        ai_logic.current_path = exploration_path
+        # Copied: following the path pops from it, the cached result must stay intact
+        ai_logic.current_path = list(exploration_path)
         target_coord = exploration_path[-1]
         message_log.add_message(
             f"AI: Pathing to explore at ({target_coord[0]},{target_coord[1]}) "
@@ -94,6 +91,40 @@ class ExploreAction(AIAction):
 
         return self._follow_current_path(ctx, ai_logic, message_log)
 
+    def _exploration_path(
+        self, ctx: "AIContext"
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Returns the path to explore along this turn.
+
+        A path cached on an earlier turn is kept while its target is still a
+        frontier tile on the player's floor; otherwise the Explorer searches
+        for the nearest frontier and the new path is cached. The plan is
+        memoized under its own key, so ctx.find_exploration_targets() keeps
+        returning the Explorer's own result.
+        """
+        return ctx.cached_query("explore_plan", lambda: self._plan_path(ctx))
+
+    def _plan_path(self, ctx: "AIContext") -> Optional[List[Tuple[int, int, int]]]:
+        if ctx.path_cache is not None and ctx.explorer:
+            frontier = ctx.explorer.get_frontier(ctx.player_floor_id)
+            for target in ctx.path_cache.targets("explore"):
+                x, y, floor_id = target
+                if floor_id != ctx.player_floor_id or (x, y) not in frontier:
+                    continue
+                path = ctx.path_cache.get(
+                    ctx.visible_maps, ctx.player_pos_3d, target, "explore"
+                )
+                if path:
+                    return path
+
+        exploration_path = ctx.find_exploration_targets()
+        if exploration_path and ctx.path_cache is not None:
+            ctx.path_cache.store(
+                ctx.visible_maps, exploration_path[-1], "explore", exploration_path
+            )
+        return exploration_path
+
     def _follow_current_path(
         self,
         ctx: "AIContext",
@@ -6,19 +6,29 @@ This action mirrors the flee logic from SurvivalState including:
 - _get_safe_moves()
 - Threat centroid calculation
 - Dead-end avoidance
+
+With a DistanceFieldCache on the context, the distance from the threats is
+read off a safety map (see safety_field) instead of the threat centroid, so
+walls between the player and a threat are taken into account.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from src.map_algorithms.distance_field import SAFETY_SCALE
+
 from .base_action import AIAction
 
 if TYPE_CHECKING:
     from src.ai_logic.context import AIContext
     from src.ai_logic.main import AILogic
+    from src.map_algorithms.distance_field import DistanceField
     from src.message_log import MessageLog
 
+# Weight of the threat distances in the flee safety map, see safety_field
+SAFETY_COEFFICIENT = -1.2
+
 
 class FleeAction(AIAction):
     """
@@ -27,6 +37,8 @@ class FleeAction(AIAction):
     Utility Score: 0.95 when low health and can flee (not cornered)
     """
 
+    max_utility = 0.95
+
     @property
     def name(self) -> str:
         return "Flee"
@@ -60,8 +72,9 @@ class FleeAction(AIAction):
         Execute flee by moving in the best direction away from threats.
 
         Prefers directions that:
-        1. Maximize distance from threat centroid
+        1. Maximize distance from threats (safety map, or threat centroid)
         2. Avoid dead ends (prefer more exits)
+        3. Do not end next to other monsters (see AIContext.get_danger)
         """
         # Try intelligent flee direction first
         best_flee = self._get_best_flee_direction(ctx)
@@ -127,6 +140,7 @@ class FleeAction(AIAction):
         threat_x = sum(m.x for m in ctx.adjacent_monsters) / len(ctx.adjacent_monsters)
         threat_y = sum(m.y for m in ctx.adjacent_monsters) / len(ctx.adjacent_monsters)
 
+        safety = self._get_safety_field(ctx)
         best_direction = None
         best_score = float("-inf")
 
@@ -142,6 +156,10 @@ class FleeAction(AIAction):
             if self._is_safe_move(ctx, new_x, new_y):
                 # Calculate distance from threat center (higher is better)
                 dist = abs(new_x - threat_x) + abs(new_y - threat_y)
+                safety_value = safety.distance(new_x, new_y) if safety else None
+                if safety_value is not None:
+                    # Walking distance, favouring ways out over dead ends
+                    dist = safety_value / (SAFETY_COEFFICIENT * SAFETY_SCALE)
 
                 # Count exits from the new position
                 exits = self._count_exits(ctx, new_x, new_y)
@@ -154,10 +172,22 @@ class FleeAction(AIAction):
                 else:
                     exit_bonus = exits  # Open areas are good
 
-                score = dist + exit_bonus
+                # Stepping next to another monster is worth avoiding too
+                score = dist + exit_bonus - ctx.get_danger(new_x, new_y)
 
                 if score > best_score:
                     best_score = score
                     best_direction = ("move", direction)
 
         return best_direction
+
+    def _get_safety_field(self, ctx: "AIContext") -> Optional["DistanceField"]:
+        """Safety map away from the adjacent monsters, if fields are cached."""
+        current_ai_map = ctx.get_current_ai_map()
+        if ctx.distance_fields is None or not current_ai_map:
+            return None
+        return ctx.distance_fields.get_safety(
+            current_ai_map,
+            [(monster.x, monster.y) for monster in ctx.adjacent_monsters],
+            SAFETY_COEFFICIENT,
+        )
@@ -28,6 +28,8 @@ class HealAction(AIAction):
     - 0.00: healthy or no healing available
     """
 
+    max_utility = 1.0
+
     @property
     def name(self) -> str:
         return "Heal"
@@ -35,6 +35,72 @@ def apply_distance_modifier(base_utility: float, distance: int) -> float:
 class PathActionBase(AIAction):
     """Base class for path-finding actions."""
 
+    def _find_path(
+        self,
+        ctx: "AIContext",
+        target: Tuple[int, int, int],
+        risk_aware: bool = False,
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Returns a path from the player to target through explored tiles.
+
+        The path planned on an earlier turn is reused (and repaired if
+        needed) from ctx.path_cache; a new one is planned only when nothing
+        usable is cached.
+
+        Args:
+            ctx: The current game state context.
+            target: The (x, y, floor_id) to reach.
+            risk_aware: Plan with find_path_risk_aware, which keeps away from
+                        monsters, instead of a plain BFS.
+
+        Returns:
+            A list of (x, y, floor_id) steps, or None if target is unreachable.
+        """
+        mode = "risk_aware" if risk_aware else "bfs"
+        if ctx.path_cache is not None:
+            path = ctx.path_cache.get(ctx.visible_maps, ctx.player_pos_3d, target, mode)
+            if path:
+                return path
+        if not ctx.path_finder:
+            return None
+
+        if target[2] != ctx.player_floor_id:
+            # Route over the portal graph rather than flooding every floor
+            path = ctx.path_finder.find_path_hierarchical(
+                ctx.visible_maps,
+                ctx.player_pos,
+                ctx.player_floor_id,
+                (target[0], target[1]),
+                target[2],
+                require_explored=True,
+                player_health_ratio=ctx.health_ratio if risk_aware else None,
+                danger_grids=ctx.danger_grids,
+            )
+        elif risk_aware:
+            path = ctx.path_finder.find_path_risk_aware(
+                ctx.visible_maps,
+                ctx.player_pos,
+                ctx.player_floor_id,
+                (target[0], target[1]),
+                target[2],
+                player_health_ratio=ctx.health_ratio,
+                require_explored=True,
+                danger_grids=ctx.danger_grids,
+            )
+        else:
+            path = ctx.path_finder.find_path_bfs(
+                ctx.visible_maps,
+                ctx.player_pos,
+                ctx.player_floor_id,
+                (target[0], target[1]),
+                target[2],
+                require_explored=True,
+            )
+        if path and ctx.path_cache is not None:
+            ctx.path_cache.store(ctx.visible_maps, target, mode, path)
+        return path
+
     def _follow_current_path(
         self,
         ctx: "AIContext",
@@ -82,6 +148,8 @@ class PathToHealthAction(PathActionBase):
     Utility Score: 0.70 (base), modified by distance
     """
 
+    max_utility = 0.70
+
     @property
     def name(self) -> str:
         return "PathToHealth"
@@ -93,9 +161,7 @@ class PathToHealthAction(PathActionBase):
         if not ctx.target_finder:
             return False
 
-        targets = ctx.target_finder.find_health_potions(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_health_potions()
         return len(targets) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -106,9 +172,7 @@ class PathToHealthAction(PathActionBase):
         if not ctx.target_finder:
             return 0.0
 
-        targets = ctx.target_finder.find_health_potions(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_health_potions()
         if not targets:
             return 0.0
 
@@ -126,36 +190,20 @@ class PathToHealthAction(PathActionBase):
         if not ctx.target_finder or not ctx.path_finder:
             return None
 
-        targets = ctx.target_finder.find_health_potions(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_health_potions()
         if not targets:
             return None
 
         # Sort by distance
-        targets.sort(key=lambda t: t[4])
+        targets = sorted(targets, key=lambda t: t[4])
 
         # Use risk-aware pathfinding when low health
         for target_x, target_y, target_floor_id, target_type, _ in targets:
-            if ctx.health_ratio < 0.7:
-                path = ctx.path_finder.find_path_risk_aware(
-                    ctx.visible_maps,
-                    ctx.player_pos,
-                    ctx.player_floor_id,
-                    (target_x, target_y),
-                    target_floor_id,
-                    player_health_ratio=ctx.health_ratio,
-                    require_explored=True,
-                )
-            else:
-                path = ctx.path_finder.find_path_bfs(
-                    ctx.visible_maps,
-                    ctx.player_pos,
-                    ctx.player_floor_id,
-                    (target_x, target_y),
-                    target_floor_id,
-                    require_explored=True,
-                )
+            path = self._find_path(
+                ctx,
+                (target_x, target_y, target_floor_id),
+                risk_aware=ctx.health_ratio < 0.7,
+            )
 
             if path:
                 message_log.add_message(
@@ -175,6 +223,8 @@ class PathToWeaponAction(PathActionBase):
     Utility Score: 0.65 (base), modified by distance
     """
 
+    max_utility = 0.65
+
     @property
     def name(self) -> str:
         return "PathToWeapon"
@@ -183,7 +233,7 @@ class PathToWeaponAction(PathActionBase):
         """Available when better weapons are visible."""
         if not ctx.target_finder:
             return False
-        targets = ctx.target_finder.find_weapons(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_weapons()
         return len(targets) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -194,7 +244,7 @@ class PathToWeaponAction(PathActionBase):
         if not ctx.target_finder:
             return 0.0
 
-        targets = ctx.target_finder.find_weapons(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_weapons()
         if not targets:
             return 0.0
 
@@ -211,21 +261,14 @@ class PathToWeaponAction(PathActionBase):
         if not ctx.target_finder or not ctx.path_finder:
             return None
 
-        targets = ctx.target_finder.find_weapons(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_weapons()
         if not targets:
             return None
 
-        targets.sort(key=lambda t: t[4])
+        targets = sorted(targets, key=lambda t: t[4])
 
         for target_x, target_y, target_floor_id, target_type, _ in targets:
-            path = ctx.path_finder.find_path_bfs(
-                ctx.visible_maps,
-                ctx.player_pos,
-                ctx.player_floor_id,
-                (target_x, target_y),
-                target_floor_id,
-                require_explored=True,
-            )
+            path = self._find_path(ctx, (target_x, target_y, target_floor_id))
 
             if path:
                 message_log.add_message(
@@ -245,6 +288,8 @@ class PathToArmorAction(PathActionBase):
     Utility Score: 0.60 (base), modified by distance
     """
 
+    max_utility = 0.60
+
     @property
     def name(self) -> str:
         return "PathToArmor"
@@ -253,7 +298,7 @@ class PathToArmorAction(PathActionBase):
         """Available when armor is visible."""
         if not ctx.target_finder:
             return False
-        targets = ctx.target_finder.find_armor(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_armor()
         return len(targets) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -264,7 +309,7 @@ class PathToArmorAction(PathActionBase):
         if not ctx.target_finder:
             return 0.0
 
-        targets = ctx.target_finder.find_armor(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_armor()
         if not targets:
             return 0.0
 
@@ -281,21 +326,14 @@ class PathToArmorAction(PathActionBase):
         if not ctx.target_finder or not ctx.path_finder:
             return None
 
-        targets = ctx.target_finder.find_armor(ctx.player_pos, ctx.player_floor_id)
+        targets = ctx.find_armor()
         if not targets:
             return None
 
-        targets.sort(key=lambda t: t[4])
+        targets = sorted(targets, key=lambda t: t[4])
 
         for target_x, target_y, target_floor_id, target_type, _ in targets:
-            path = ctx.path_finder.find_path_bfs(
-                ctx.visible_maps,
-                ctx.player_pos,
-                ctx.player_floor_id,
-                (target_x, target_y),
-                target_floor_id,
-                require_explored=True,
-            )
+            path = self._find_path(ctx, (target_x, target_y, target_floor_id))
 
             if path:
                 message_log.add_message(
@@ -316,6 +354,8 @@ class PathToQuestAction(PathActionBase):
     Utility Score: 0.55 (base), modified by distance
     """
 
+    max_utility = 0.55
+
     @property
     def name(self) -> str:
         return "PathToQuest"
@@ -324,9 +364,7 @@ class PathToQuestAction(PathActionBase):
         """Available when quest items are visible."""
         if not ctx.target_finder:
             return False
-        targets = ctx.target_finder.find_quest_items(
-            ctx.player_pos, ctx.player_floor_id, same_floor_only=False
-        )
+        targets = ctx.find_quest_items()
         return len(targets) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -337,9 +375,7 @@ class PathToQuestAction(PathActionBase):
         if not ctx.target_finder:
             return 0.0
 
-        targets = ctx.target_finder.find_quest_items(
-            ctx.player_pos, ctx.player_floor_id, same_floor_only=False
-        )
+        targets = ctx.find_quest_items()
         if not targets:
             return 0.0
 
@@ -356,35 +392,19 @@ class PathToQuestAction(PathActionBase):
         if not ctx.target_finder or not ctx.path_finder:
             return None
 
-        targets = ctx.target_finder.find_quest_items(
-            ctx.player_pos, ctx.player_floor_id, same_floor_only=False
-        )
+        targets = ctx.find_quest_items()
         if not targets:
             return None
 
-        targets.sort(key=lambda t: t[4])
+        targets = sorted(targets, key=lambda t: t[4])
 
         for target_x, target_y, target_floor_id, target_type, _ in targets:
             # Use risk-aware pathfinding when health is below 70%
-            if ctx.health_ratio < 0.7:
-                path = ctx.path_finder.find_path_risk_aware(
-                    ctx.visible_maps,
-                    ctx.player_pos,
-                    ctx.player_floor_id,
-                    (target_x, target_y),
-                    target_floor_id,
-                    player_health_ratio=ctx.health_ratio,
-                    require_explored=True,
-                )
-            else:
-                path = ctx.path_finder.find_path_bfs(
-                    ctx.visible_maps,
-                    ctx.player_pos,
-                    ctx.player_floor_id,
-                    (target_x, target_y),
-                    target_floor_id,
-                    require_explored=True,
-                )
+            path = self._find_path(
+                ctx,
+                (target_x, target_y, target_floor_id),
+                risk_aware=ctx.health_ratio < 0.7,
+            )
 
             if path:
                 message_log.add_message(
@@ -405,6 +425,8 @@ class PathToPortalAction(PathActionBase):
     Higher utility when current floor is mostly explored.
     """
 
+    max_utility = 0.55
+
     @property
     def name(self) -> str:
         return "PathToPortal"
@@ -414,12 +436,8 @@ class PathToPortalAction(PathActionBase):
         if not ctx.explorer:
             return False
 
-        unvisited = ctx.explorer.find_unvisited_portals(
-            ctx.player_pos, ctx.player_floor_id
-        )
-        portal_to_unexplored = ctx.explorer.find_portal_to_unexplored_floor(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        unvisited = ctx.find_unvisited_portals()
+        portal_to_unexplored = ctx.find_portal_to_unexplored_floor()
         return len(unvisited) > 0 or len(portal_to_unexplored) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -437,22 +455,14 @@ class PathToPortalAction(PathActionBase):
 
         # Combine both portal types and find nearest
         targets: List[Tuple[int, int, int, str, int]] = []
-        targets.extend(
-            ctx.explorer.find_unvisited_portals(ctx.player_pos, ctx.player_floor_id)
-        )
-        targets.extend(
-            ctx.explorer.find_portal_to_unexplored_floor(
-                ctx.player_pos, ctx.player_floor_id
-            )
-        )
+        targets.extend(ctx.find_unvisited_portals())
+        targets.extend(ctx.find_portal_to_unexplored_floor())
 
         if not targets:
             return 0.0
 
         # Higher base utility if current floor is mostly explored
-        exploration_ratio = ctx.explorer.get_floor_exploration_ratio(
-            ctx.player_floor_id
-        )
+        exploration_ratio = ctx.get_floor_exploration_ratio()
         if exploration_ratio > 0.8:
             base_utility = 0.55  # Prioritize portal usage when floor is mostly done
         else:
@@ -473,14 +483,8 @@ class PathToPortalAction(PathActionBase):
 
         # Combine both portal types
         targets: List[Tuple[int, int, int, str, int]] = []
-        targets.extend(
-            ctx.explorer.find_unvisited_portals(ctx.player_pos, ctx.player_floor_id)
-        )
-        targets.extend(
-            ctx.explorer.find_portal_to_unexplored_floor(
-                ctx.player_pos, ctx.player_floor_id
-            )
-        )
+        targets.extend(ctx.find_unvisited_portals())
+        targets.extend(ctx.find_portal_to_unexplored_floor())
 
         if not targets:
             return None
@@ -493,14 +497,7 @@ class PathToPortalAction(PathActionBase):
         targets.sort(key=sort_key)
 
         for target_x, target_y, target_floor_id, target_type, _ in targets:
-            path = ctx.path_finder.find_path_bfs(
-                ctx.visible_maps,
-                ctx.player_pos,
-                ctx.player_floor_id,
-                (target_x, target_y),
-                target_floor_id,
-                require_explored=True,
-            )
+            path = self._find_path(ctx, (target_x, target_y, target_floor_id))
 
             if path:
                 message_log.add_message(
@@ -520,6 +517,8 @@ class PathToLootAction(PathActionBase):
     Utility Score: 0.40 (base), modified by distance
     """
 
+    max_utility = 0.40
+
     @property
     def name(self) -> str:
         return "PathToLoot"
@@ -528,9 +527,7 @@ class PathToLootAction(PathActionBase):
         """Available when other items are visible."""
         if not ctx.target_finder:
             return False
-        targets = ctx.target_finder.find_other_items(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_other_items()
         return len(targets) > 0
 
     def calculate_utility(self, ctx: "AIContext") -> float:
@@ -541,9 +538,7 @@ class PathToLootAction(PathActionBase):
         if not ctx.target_finder:
             return 0.0
 
-        targets = ctx.target_finder.find_other_items(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_other_items()
         if not targets:
             return 0.0
 
@@ -560,23 +555,14 @@ class PathToLootAction(PathActionBase):
         if not ctx.target_finder or not ctx.path_finder:
             return None
 
-        targets = ctx.target_finder.find_other_items(
-            ctx.player_pos, ctx.player_floor_id
-        )
+        targets = ctx.find_other_items()
         if not targets:
             return None
 
-        targets.sort(key=lambda t: t[4])
+        targets = sorted(targets, key=lambda t: t[4])
 
         for target_x, target_y, target_floor_id, target_type, _ in targets:
-            path = ctx.path_finder.find_path_bfs(
-                ctx.visible_maps,
-                ctx.player_pos,
-                ctx.player_floor_id,
-                (target_x, target_y),
-                target_floor_id,
-                require_explored=True,
-            )
+            path = self._find_path(ctx, (target_x, target_y, target_floor_id))
 
             if path:
                 message_log.add_message(
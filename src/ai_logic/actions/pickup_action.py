@@ -25,6 +25,8 @@ class PickupItemAction(AIAction):
     - 0.80: Regular item on current tile
     """
 
+    max_utility = 0.99
+
     @property
     def name(self) -> str:
         return "PickupItem"
@@ -28,6 +28,8 @@ class RandomMoveAction(AIAction):
     - 0.10: default fallback action
     """
 
+    max_utility = 0.99
+
     @property
     def name(self) -> str:
         return "RandomMove"
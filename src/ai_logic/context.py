@@ -7,21 +7,29 @@ to AILogic in action classes, making them pure functions of state.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 if TYPE_CHECKING:
     from random import Random
 
     from src.items import Item
+    from src.map_algorithms.danger_grid import DangerGrid
+    from src.map_algorithms.distance_field import DistanceFieldCache
     from src.map_algorithms.pathfinding import PathFinder
     from src.world_map import WorldMap
 
     from .ai_monster_view import AIMonsterView
     from .bestiary import Bestiary
     from .explorer import Explorer
+    from .path_cache import PathCache
     from .target_finder import TargetFinder
 
+T = TypeVar("T")
+
+# (x, y, floor_id, target_type, distance_estimate), as returned by TargetFinder
+Target = Tuple[int, int, int, str, int]
+
 
 @dataclass
 class AIContext:
@@ -33,6 +41,11 @@ class AIContext:
 
     All fields are read-only and should not be modified after creation.
     The context is rebuilt each turn from the current game state.
+
+    Target queries (find_health_potions, find_exploration_targets, ...) are
+    memoized in query_cache, so each map scan or search runs at most once per
+    turn however many actions ask for it. Results are shared between callers
+    and must not be mutated.
     """
 
     # Player state
@@ -77,6 +90,16 @@ class AIContext:
     explorer: Optional["Explorer"]
     target_finder: Optional["TargetFinder"]
     random: Optional["Random"]
+    path_cache: Optional["PathCache"] = None
+    # Danger around visible monsters by floor_id, see DangerGrid
+    danger_grids: Optional[Dict[int, "DangerGrid"]] = None
+    # Distance fields over the visible maps, kept across turns
+    distance_fields: Optional["DistanceFieldCache"] = None
+
+    # Turn-scoped memo of target queries, see cached_query
+    query_cache: Dict[Tuple[Any, ...], Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @property
     def player_pos(self) -> Tuple[int, int]:
@@ -92,6 +115,11 @@ class AIContext:
         """Get the AI visible map for the current floor."""
         return self.visible_maps.get(self.player_floor_id)
 
+    def get_danger(self, x: int, y: int) -> float:
+        """Danger of (x, y) on the current floor, 0 without a danger grid."""
+        grid = (self.danger_grids or {}).get(self.player_floor_id)
+        return grid.danger(x, y) if grid else 0.0
+
     def is_low_health(self) -> bool:
         """Check if player health is below survival threshold."""
         return self.health_ratio <= self.survival_threshold
@@ -107,3 +135,117 @@ class AIContext:
         from src.items import QuestItem
 
         return isinstance(self.current_tile_item, QuestItem)
+
+    def cached_query(self, kind: str, compute: Callable[[], T]) -> T:
+        """
+        Return the result of a query, calling `compute` only the first time.
+
+        Args:
+            kind: Name of the query.
+            compute: Computes the result on a cache miss.
+
+        Returns:
+            The (shared) query result for the current player position.
+        """
+        key = (kind, self.player_x, self.player_y, self.player_floor_id)
+        if key not in self.query_cache:
+            self.query_cache[key] = compute()
+        return self.query_cache[key]
+
+    def find_health_potions(self) -> List[Target]:
+        """Health potions on the known maps (see TargetFinder)."""
+        if not self.target_finder:
+            return []
+        finder = self.target_finder
+        return self.cached_query(
+            "health_potions",
+            lambda: finder.find_health_potions(self.player_pos, self.player_floor_id),
+        )
+
+    def find_weapons(self) -> List[Target]:
+        """Weapons better than the equipped one (see TargetFinder)."""
+        if not self.target_finder:
+            return []
+        finder = self.target_finder
+        return self.cached_query(
+            "weapons",
+            lambda: finder.find_weapons(self.player_pos, self.player_floor_id),
+        )
+
+    def find_armor(self) -> List[Target]:
+        """Armor for empty or weaker slots (see TargetFinder)."""
+        if not self.target_finder:
+            return []
+        finder = self.target_finder
+        return self.cached_query(
+            "armor",
+            lambda: finder.find_armor(self.player_pos, self.player_floor_id),
+        )
+
+    def find_quest_items(self) -> List[Target]:
+        """Quest items on any floor (see TargetFinder)."""
+        if not self.target_finder:
+            return []
+        finder = self.target_finder
+        return self.cached_query(
+            "quest_items",
+            lambda: finder.find_quest_items(
+                self.player_pos, self.player_floor_id, same_floor_only=False
+            ),
+        )
+
+    def find_other_items(self) -> List[Target]:
+        """Items no other query covers (see TargetFinder)."""
+        if not self.target_finder:
+            return []
+        finder = self.target_finder
+        return self.cached_query(
+            "other_items",
+            lambda: finder.find_other_items(self.player_pos, self.player_floor_id),
+        )
+
+    def find_unvisited_portals(self) -> List[Target]:
+        """Portals not used yet (see Explorer)."""
+        if not self.explorer:
+            return []
+        explorer = self.explorer
+        return self.cached_query(
+            "unvisited_portals",
+            lambda: explorer.find_unvisited_portals(
+                self.player_pos, self.player_floor_id
+            ),
+        )
+
+    def find_portal_to_unexplored_floor(self) -> List[Target]:
+        """Portals leading to floors not fully explored (see Explorer)."""
+        if not self.explorer:
+            return []
+        explorer = self.explorer
+        return self.cached_query(
+            "portals_to_unexplored",
+            lambda: explorer.find_portal_to_unexplored_floor(
+                self.player_pos, self.player_floor_id
+            ),
+        )
+
+    def get_floor_exploration_ratio(self) -> float:
+        """Explored fraction of the current floor (see Explorer)."""
+        if not self.explorer:
+            return 0.0
+        explorer = self.explorer
+        return self.cached_query(
+            "exploration_ratio",
+            lambda: explorer.get_floor_exploration_ratio(self.player_floor_id),
+        )
+
+    def find_exploration_targets(self) -> Optional[List[Tuple[int, int, int]]]:
+        """Path to the nearest exploration frontier (see Explorer)."""
+        if not self.explorer:
+            return None
+        explorer = self.explorer
+        return self.cached_query(
+            "exploration_path",
+            lambda: explorer.find_exploration_targets(
+                self.player_pos, self.player_floor_id
+            ),
+        )
@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
-from src.map_algorithms.pathfinding import PathFinder
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS, PathFinder
 
 if TYPE_CHECKING:
     from src.world_map import WorldMap
@@ -8,6 +9,20 @@ if TYPE_CHECKING:
     from .ai_player_view import AIPlayerView
 
 
+@dataclass
+class _FloorStats:
+    """
+    Exploration counters of one AI map.
+
+    Unexplored tiles are counted as open: the AI map only learns a tile's
+    real type when the tile is explored.
+    """
+
+    open_tiles: int = 0  # Non-wall tiles, explored or not
+    explored_open_tiles: int = 0
+    portals: Set[Tuple[int, int]] = field(default_factory=set)  # Explored portals
+
+
 class Explorer:
     def __init__(
         self,
@@ -18,6 +33,115 @@ class Explorer:
         self.ai_visible_maps = ai_visible_maps
         self.path_finder = PathFinder()
         self.visited_portals: Set[Tuple[int, int, int]] = set()
+        # floor_id -> explored, non-wall tiles with an unexplored neighbour.
+        # Built on first use per floor, then kept current by on_tiles_explored.
+        self._frontiers: Dict[int, Set[Tuple[int, int]]] = {}
+        # floor_id -> exploration counters, kept current the same way.
+        self._floor_stats: Dict[int, _FloorStats] = {}
+
+    def on_tiles_explored(
+        self, floor_id: int, coords: Iterable[Tuple[int, int]]
+    ) -> None:
+        """
+        Updates the frontier and exploration stats of a floor after the given
+        tiles became explored.
+
+        Only the tiles themselves and their neighbours can change frontier
+        membership, so this costs O(len(coords)).
+        """
+        ai_map = self.ai_visible_maps.get(floor_id)
+        if not ai_map:
+            return
+        # Floors without cached state are built from a full scan when needed
+        frontier = self._frontiers.get(floor_id)
+        stats = self._floor_stats.get(floor_id)
+        for x, y in coords:
+            if stats is not None:
+                tile = ai_map.get_tile(x, y)
+                if tile:
+                    if tile.type == "wall":
+                        stats.open_tiles -= 1
+                    else:
+                        stats.explored_open_tiles += 1
+                    if tile.is_portal:
+                        stats.portals.add((x, y))
+            if frontier is not None:
+                self._refresh_frontier_tile(ai_map, frontier, x, y)
+                for dx, dy in NEIGHBOR_OFFSETS:
+                    self._refresh_frontier_tile(ai_map, frontier, x + dx, y + dy)
+
+    def invalidate_floor_state(self, floor_id: Optional[int] = None) -> None:
+        """
+        Drops the cached frontier and exploration stats of one floor (or all
+        floors), e.g. after the AI maps were edited without
+        on_tiles_explored being called.
+        """
+        if floor_id is None:
+            self._frontiers.clear()
+            self._floor_stats.clear()
+        else:
+            self._frontiers.pop(floor_id, None)
+            self._floor_stats.pop(floor_id, None)
+
+    def _get_floor_stats(self, floor_id: int) -> Optional[_FloorStats]:
+        """Returns the exploration stats of a floor, or None if it is unknown."""
+        stats = self._floor_stats.get(floor_id)
+        if stats is None:
+            ai_map = self.ai_visible_maps.get(floor_id)
+            if not ai_map:
+                return None
+            stats = _FloorStats()
+            for y, x in ai_map.iter_coords():
+                tile = ai_map.get_tile(x, y)
+                if not tile:
+                    continue
+                if tile.type != "wall":
+                    stats.open_tiles += 1
+                    if tile.is_explored:
+                        stats.explored_open_tiles += 1
+                if tile.is_explored and tile.is_portal:
+                    stats.portals.add((x, y))
+            self._floor_stats[floor_id] = stats
+        return stats
+
+    def _explored_portals(self, floor_id: int) -> List[Tuple[int, int]]:
+        """Returns the explored portals of a floor in row-major order."""
+        stats = self._get_floor_stats(floor_id)
+        if stats is None:
+            return []
+        return sorted(stats.portals, key=lambda pos: (pos[1], pos[0]))
+
+    def get_frontier(self, floor_id: int) -> Set[Tuple[int, int]]:
+        """Returns the (x, y) frontier tiles of a floor."""
+        frontier = self._frontiers.get(floor_id)
+        if frontier is None:
+            frontier = set()
+            ai_map = self.ai_visible_maps.get(floor_id)
+            if ai_map:
+                for y, x in ai_map.iter_coords():
+                    if self._is_frontier_tile(ai_map, x, y):
+                        frontier.add((x, y))
+            self._frontiers[floor_id] = frontier
+        return frontier
+
+    @staticmethod
+    def _is_frontier_tile(ai_map: "WorldMap", x: int, y: int) -> bool:
+        tile = ai_map.get_tile(x, y)
+        if not tile or not tile.is_explored or tile.type == "wall":
+            return False
+        for dx, dy in NEIGHBOR_OFFSETS:
+            adj_tile = ai_map.get_tile(x + dx, y + dy)
+            if adj_tile and not adj_tile.is_explored:
+                return True
+        return False
+
+    def _refresh_frontier_tile(
+        self, ai_map: "WorldMap", frontier: Set[Tuple[int, int]], x: int, y: int
+    ) -> None:
+        if self._is_frontier_tile(ai_map, x, y):
+            frontier.add((x, y))
+        else:
+            frontier.discard((x, y))
 
     def mark_portal_as_visited(self, x: int, y: int, floor_id: int):
         """Mark a portal as visited, including both ends of the portal."""
@@ -37,49 +161,31 @@ class Explorer:
         for floor_id, ai_map in self.ai_visible_maps.items():
             if not ai_map:
                 continue
-            for y, x in ai_map.iter_coords():
-                tile = ai_map.get_tile(x, y)
-                if (
-                    tile
-                    and tile.is_explored
-                    and tile.is_portal
-                    and (x, y, floor_id) not in self.visited_portals
-                    and (x, y) != player_pos_xy
-                ):
-                    dist = (
-                        abs(x - player_pos_xy[0])
-                        + abs(y - player_pos_xy[1])
-                        + abs(floor_id - player_floor_id) * 10
-                    )
-                    targets.append((x, y, floor_id, "unvisited_portal", dist))
+            for x, y in self._explored_portals(floor_id):
+                if (x, y) == player_pos_xy or (x, y, floor_id) in self.visited_portals:
+                    continue
+                dist = (
+                    abs(x - player_pos_xy[0])
+                    + abs(y - player_pos_xy[1])
+                    + abs(floor_id - player_floor_id) * 10
+                )
+                targets.append((x, y, floor_id, "unvisited_portal", dist))
         return targets
 
     def is_floor_fully_explored(self, floor_id: int) -> bool:
-        ai_map = self.ai_visible_maps.get(floor_id)
-        if not ai_map:
+        stats = self._get_floor_stats(floor_id)
+        if stats is None:
             return False  # Or True, depending on how we want to treat unknown maps
-        for y, x in ai_map.iter_coords():
-            tile = ai_map.get_tile(x, y)
-            if tile and tile.type != "wall" and not tile.is_explored:
-                return False
-        return True
+        return stats.explored_open_tiles >= stats.open_tiles
 
     def get_floor_exploration_ratio(self, floor_id: int) -> float:
         """Return the ratio of explored non-wall tiles on a floor (0.0 to 1.0)."""
-        ai_map = self.ai_visible_maps.get(floor_id)
-        if not ai_map:
+        stats = self._get_floor_stats(floor_id)
+        if stats is None:
             return 0.0
-        explored_count = 0
-        total_count = 0
-        for y, x in ai_map.iter_coords():
-            tile = ai_map.get_tile(x, y)
-            if tile and tile.type != "wall":
-                total_count += 1
-                if tile.is_explored:
-                    explored_count += 1
-        if total_count == 0:
+        if stats.open_tiles <= 0:
             return 1.0
-        return explored_count / total_count
+        return stats.explored_open_tiles / stats.open_tiles
 
     def find_portal_to_unexplored_floor(
         self, player_pos_xy: Tuple[int, int], player_floor_id: int
@@ -88,26 +194,20 @@ class Explorer:
         for floor_id, ai_map in self.ai_visible_maps.items():
             if not ai_map:
                 continue
-            for y, x in ai_map.iter_coords():
+            for x, y in self._explored_portals(floor_id):
+                if (x, y) == player_pos_xy or (x, y, floor_id) in self.visited_portals:
+                    continue
                 tile = ai_map.get_tile(x, y)
-                if (
-                    tile
-                    and tile.is_explored
-                    and tile.is_portal
-                    and not (x == player_pos_xy[0] and y == player_pos_xy[1])
-                    and (x, y, floor_id) not in self.visited_portals
+                portal_dest_floor_id = tile.portal_to_floor_id if tile else None
+                if portal_dest_floor_id is not None and not (
+                    self.is_floor_fully_explored(portal_dest_floor_id)
                 ):
-                    portal_dest_floor_id = tile.portal_to_floor_id
-                    if (
-                        portal_dest_floor_id is not None
-                        and not self.is_floor_fully_explored(portal_dest_floor_id)
-                    ):
-                        dist = (
-                            abs(x - player_pos_xy[0])
-                            + abs(y - player_pos_xy[1])
-                            + abs(floor_id - player_floor_id) * 10
-                        )
-                        targets.append((x, y, floor_id, "portal_to_unexplored", dist))
+                    dist = (
+                        abs(x - player_pos_xy[0])
+                        + abs(y - player_pos_xy[1])
+                        + abs(floor_id - player_floor_id) * 10
+                    )
+                    targets.append((x, y, floor_id, "portal_to_unexplored", dist))
         return targets
 
     def find_exploration_targets(
@@ -117,43 +217,24 @@ class Explorer:
         if not current_ai_map:
             return None
 
-        # Edge of known area on current floor
-        edge_exploration_targets_current_floor: List[Tuple[int, int]] = []
-        if current_ai_map:
-            for y_edge in range(current_ai_map.height):
-                for x_edge in range(current_ai_map.width):
-                    tile = current_ai_map.get_tile(x_edge, y_edge)
-                    if tile and tile.is_explored and tile.type != "wall":
-                        for dx_adj, dy_adj in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                            adj_x, adj_y = x_edge + dx_adj, y_edge + dy_adj
-                            adj_tile = current_ai_map.get_tile(adj_x, adj_y)
-                            if adj_tile and not adj_tile.is_explored:
-                                if (
-                                    x_edge,
-                                    y_edge,
-                                ) not in edge_exploration_targets_current_floor:
-                                    edge_exploration_targets_current_floor.append(
-                                        (x_edge, y_edge)
-                                    )
-                                break
-        if edge_exploration_targets_current_floor:
-            paths_to_edge_frontiers = []
-            for coord_xy in edge_exploration_targets_current_floor:
-                if coord_xy == player_pos_xy:
-                    continue
-                path = self.path_finder.find_path_bfs(
-                    self.ai_visible_maps,
-                    player_pos_xy,
-                    player_floor_id,
-                    coord_xy,
-                    player_floor_id,
-                    require_explored=True,
-                )
-                if path:
-                    paths_to_edge_frontiers.append(path)
-            if paths_to_edge_frontiers:
-                paths_to_edge_frontiers.sort(key=len)
-                return paths_to_edge_frontiers[0]
+        # Edge of known area on current floor: one BFS to the nearest frontier
+        # tile, ties going to the first in row-major order.
+        frontier_goals = [
+            (x, y, player_floor_id)
+            for x, y in self.get_frontier(player_floor_id)
+            if (x, y) != player_pos_xy
+        ]
+        if frontier_goals:
+            path = self.path_finder.find_nearest_path_bfs(
+                self.ai_visible_maps,
+                player_pos_xy,
+                player_floor_id,
+                frontier_goals,
+                require_explored=True,
+                goal_key=lambda node: (node[1], node[0]),
+            )
+            if path:
+                return path
 
         # Current floor fully explored - find a portal to an unexplored floor
         portals_to_unexplored = self.find_portal_to_unexplored_floor(
@@ -163,7 +244,7 @@ class Explorer:
             # Sort by distance and get closest portal
             portals_to_unexplored.sort(key=lambda t: t[4])  # Sort by dist
             for portal_x, portal_y, portal_floor, _, _ in portals_to_unexplored:
-                path = self.path_finder.find_path_bfs(
+                path = self.path_finder.find_path_hierarchical(
                     self.ai_visible_maps,
                     player_pos_xy,
                     player_floor_id,
@@ -179,7 +260,7 @@ class Explorer:
         if unvisited_portals:
             unvisited_portals.sort(key=lambda t: t[4])  # Sort by dist
             for portal_x, portal_y, portal_floor, _, _ in unvisited_portals:
-                path = self.path_finder.find_path_bfs(
+                path = self.path_finder.find_path_hierarchical(
                     self.ai_visible_maps,
                     player_pos_xy,
                     player_floor_id,
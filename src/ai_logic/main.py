@@ -1,17 +1,21 @@
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from src.map_algorithms.danger_grid import DangerGrid
+from src.map_algorithms.distance_field import DistanceFieldCache
 from src.map_algorithms.pathfinding import PathFinder
 
 from .ai_monster_view import AIMonsterView
 from .ai_player_view import AIPlayerView
 from .bestiary import Bestiary
 from .explorer import Explorer
+from .path_cache import PathCache
 from .target_finder import TargetFinder
 
 if TYPE_CHECKING:
     from random import Random
 
     from src.message_log import MessageLog
+    from src.monster import Monster
     from src.player import Player
     from src.world_map import WorldMap
 
@@ -43,6 +47,11 @@ class AILogic:
         self.verbose = verbose
         self.path_finder = PathFinder()
         self.current_path: Optional[List[Tuple[int, int, int]]] = None
+        self.path_cache = PathCache()
+        # Danger around visible monsters, per floor; see _update_danger_grids
+        self.danger_grids: Dict[int, DangerGrid] = {}
+        # Safety maps for fleeing, see FleeAction
+        self.distance_fields = DistanceFieldCache()
         self.last_move_command: Optional[Tuple[str, Optional[str]]] = None
         self.target_finder = TargetFinder(self.player_view, self.ai_visible_maps)
         self.explorer = Explorer(self.player_view, self.ai_visible_maps)
@@ -68,6 +77,7 @@ class AILogic:
         """
         from .context import AIContext
 
+        self._update_danger_grids()
         current_ai_map = self.ai_visible_maps.get(self.player_view.current_floor_id)
         current_tile = (
             current_ai_map.get_tile(self.player_view.x, self.player_view.y)
@@ -127,8 +137,32 @@ class AILogic:
             explorer=self.explorer,
             target_finder=self.target_finder,
             random=self.random,
+            path_cache=self.path_cache,
+            danger_grids=self.danger_grids,
+            distance_fields=self.distance_fields,
         )
 
+    def _update_danger_grids(self) -> None:
+        """
+        Syncs the danger grids with the monsters on the visible maps. Only
+        tiles around monsters that moved, appeared or vanished are redone.
+        """
+        for floor_id, ai_map in self.ai_visible_maps.items():
+            grid = self.danger_grids.get(floor_id)
+            size = (ai_map.width, ai_map.height)
+            if grid is None or (grid.width, grid.height) != size:
+                grid = self.danger_grids[floor_id] = DangerGrid(*size)
+            grid.sync(ai_map, self._monster_danger)
+
+    @staticmethod
+    def _monster_danger(monster: "Monster") -> float:
+        """
+        Weight of a monster in the danger grids: 1 for the weakest (danger
+        rating 1), rising by half per rating step.
+        """
+        rating = Bestiary.get_instance().get_danger_rating(monster.name)
+        return (rating + 1) / 2
+
     def _is_in_loop(self, lookback: int = 6) -> bool:
         if len(self.player_pos_history) < lookback:
             return False
@@ -150,6 +184,7 @@ class AILogic:
     def _break_loop(self) -> None:
         self.message_log.add_message("AI: Detected a loop, breaking.")
         self.current_path = None
+        self.path_cache.invalidate()
         self.loop_breaker_moves_left = 5  # Give 5 random moves to escape the loop
 
     def calculate_optimal_quest_route(
@@ -190,6 +225,7 @@ class AILogic:
                     quest_floor,
                     player_health_ratio=health_ratio,
                     require_explored=True,
+                    danger_grids=self.danger_grids,
                 )
             else:
                 path = self.path_finder.find_path_bfs(
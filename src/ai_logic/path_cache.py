@@ -0,0 +1,289 @@
+"""
+PathCache - Reuses and repairs AI paths between turns.
+
+Path actions plan a multi-floor path to their target and take one step along
+it. Planning again on the next turn usually gives the same path minus its
+first step, so PathCache keeps the planned paths, keyed by target and
+planning mode, together with the versions of the visible maps they were
+planned on.
+
+On lookup, a cached path is trimmed to the player's position and checked:
+the terrain along the whole path only if one of its maps changed version
+since, and monsters only on the next few steps (monsters further ahead will
+have moved by the time the player gets there). A blocked step is repaired
+with a small local search from the step before it back onto the path further
+on, in the spirit of D* Lite's local replanning. Only when repair fails, the
+player has left the path or the target changes does the caller plan from
+scratch.
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS
+from src.world_map import WorldMap
+
+# A path step: (x, y, floor_id)
+PathNode = Tuple[int, int, int]
+
+
+@dataclass
+class _CachedPath:
+    """A planned path and the map versions it was last checked against."""
+
+    path: List[PathNode]
+    versions: Dict[int, int]
+
+
+class PathCache:
+    """
+    Cache of planned AI paths with cheap per-turn validation and local repair.
+
+    Paths are expected to follow the rules of PathFinder.find_path_bfs with
+    require_explored=True: steps on a floor go between adjacent explored
+    tiles that can be walked, and a change of floor happens on a portal tile
+    leading to that floor.
+
+    Args:
+        lookahead: How many upcoming steps are checked for monsters.
+        repair_depth: How far along the path a repair may rejoin it, and the
+                      longest detour the local search tries.
+        max_entries: How many paths to keep before evicting the oldest.
+    """
+
+    # Repairs attempted per lookup before giving up and replanning
+    MAX_REPAIRS = 3
+
+    def __init__(
+        self, lookahead: int = 3, repair_depth: int = 12, max_entries: int = 8
+    ):
+        self.lookahead = lookahead
+        self.repair_depth = repair_depth
+        self.max_entries = max_entries
+        self._paths: "OrderedDict[Tuple[PathNode, str], _CachedPath]" = OrderedDict()
+
+    def get(
+        self,
+        world_maps: Dict[int, WorldMap],
+        start: PathNode,
+        target: PathNode,
+        mode: str,
+    ) -> Optional[List[PathNode]]:
+        """
+        Returns the cached path from start to target, checked and repaired.
+
+        Args:
+            world_maps: The maps the path was planned on.
+            start: The player's current (x, y, floor_id).
+            target: The (x, y, floor_id) the path leads to.
+            mode: How the path was planned (e.g. "bfs", "risk_aware"); paths
+                  planned differently are cached separately.
+
+        Returns:
+            A copy of the path, starting at start, or None if nothing usable
+            is cached. Unusable entries are dropped.
+        """
+        key = (target, mode)
+        entry = self._paths.get(key)
+        if entry is None:
+            return None
+        path = self._checked_path(world_maps, entry, start)
+        if path is None:
+            del self._paths[key]
+            return None
+        entry.path = path
+        entry.versions = _map_versions(world_maps, path)
+        self._paths.move_to_end(key)
+        return list(path)
+
+    def store(
+        self,
+        world_maps: Dict[int, WorldMap],
+        target: PathNode,
+        mode: str,
+        path: List[PathNode],
+    ) -> None:
+        """Caches a freshly planned path (copied) to target."""
+        key = (target, mode)
+        self._paths[key] = _CachedPath(list(path), _map_versions(world_maps, path))
+        self._paths.move_to_end(key)
+        if len(self._paths) > self.max_entries:
+            self._paths.popitem(last=False)
+
+    def targets(self, mode: str) -> List[PathNode]:
+        """Returns the targets with a path cached for mode, newest first."""
+        return [
+            target for target, key_mode in reversed(self._paths) if key_mode == mode
+        ]
+
+    def invalidate(self) -> None:
+        """Forgets every cached path."""
+        self._paths.clear()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def _checked_path(
+        self,
+        world_maps: Dict[int, WorldMap],
+        entry: _CachedPath,
+        start: PathNode,
+    ) -> Optional[List[PathNode]]:
+        """Trims the path to start, then checks and repairs it."""
+        try:
+            path = entry.path[entry.path.index(start) :]
+        except ValueError:
+            return None  # The player left the path
+        if len(path) < 2:
+            return None  # Already at the target
+
+        terrain_changed = any(
+            floor_id not in world_maps or world_maps[floor_id].version != version
+            for floor_id, version in entry.versions.items()
+        )
+        for _ in range(self.MAX_REPAIRS + 1):
+            check_until = (
+                len(path) if terrain_changed else min(len(path), self.lookahead + 1)
+            )
+            blocked = self._first_blocked_step(world_maps, path, check_until)
+            if blocked is None:
+                return path
+            repaired = self._repair(world_maps, path, blocked)
+            if repaired is None:
+                return None
+            path = repaired
+        return None
+
+    def _first_blocked_step(
+        self,
+        world_maps: Dict[int, WorldMap],
+        path: List[PathNode],
+        check_until: int,
+    ) -> Optional[int]:
+        """Returns the index of the first step in path[1:check_until] that
+        cannot be taken, or None."""
+        last = len(path) - 1
+        for index in range(1, check_until):
+            # A monster may stand on the target itself (e.g. an attack target)
+            check_monster = index <= self.lookahead and index != last
+            if not _can_step(world_maps, path[index - 1], path[index], check_monster):
+                return index
+        return None
+
+    def _repair(
+        self,
+        world_maps: Dict[int, WorldMap],
+        path: List[PathNode],
+        blocked: int,
+    ) -> Optional[List[PathNode]]:
+        """
+        Replaces the blocked step with a detour from the step before it to a
+        later step on the same floor. Returns the repaired path, or None if
+        no detour within repair_depth exists.
+        """
+        anchor = path[blocked - 1]
+        floor_id = anchor[2]
+        world_map = world_maps.get(floor_id)
+        if world_map is None:
+            return None
+
+        # Later steps the detour may rejoin, by position
+        rejoin: Dict[Tuple[int, int], int] = {}
+        for index in range(blocked + 1, min(len(path), blocked + self.repair_depth)):
+            x, y, node_floor_id = path[index]
+            if node_floor_id != floor_id:
+                break
+            rejoin.setdefault((x, y), index)
+        if not rejoin:
+            return None
+
+        detour = self._local_search(world_map, anchor, rejoin, path[-1])
+        if detour is None:
+            return None
+        rejoin_index = rejoin[detour[-1]]
+        return (
+            path[: blocked - 1]
+            + [(x, y, floor_id) for x, y in detour]
+            + path[rejoin_index + 1 :]
+        )
+
+    def _local_search(
+        self,
+        world_map: WorldMap,
+        anchor: PathNode,
+        goals: Dict[Tuple[int, int], int],
+        target: PathNode,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """BFS from anchor to the nearest goal, at most repair_depth steps."""
+        start = (anchor[0], anchor[1])
+        parents: Dict[Tuple[int, int], Tuple[int, int]] = {start: start}
+        queue = deque([(start, 0)])
+        while queue:
+            (x, y), depth = queue.popleft()
+            if (x, y) in goals and (x, y) != start:
+                detour = [(x, y)]
+                while detour[-1] != start:
+                    detour.append(parents[detour[-1]])
+                detour.reverse()
+                return detour
+            if depth >= self.repair_depth:
+                continue
+            for dx, dy in NEIGHBOR_OFFSETS:
+                next_pos = (x + dx, y + dy)
+                if next_pos in parents or not world_map.is_valid_move(*next_pos):
+                    continue
+                tile = world_map.get_tile(*next_pos)
+                if not tile or not tile.is_explored:
+                    continue
+                if tile.monster and next_pos != (target[0], target[1]):
+                    continue
+                parents[next_pos] = (x, y)
+                queue.append((next_pos, depth + 1))
+        return None
+
+
+def _can_step(
+    world_maps: Dict[int, WorldMap],
+    previous: PathNode,
+    node: PathNode,
+    check_monster: bool,
+) -> bool:
+    """Whether the path may go from previous to node."""
+    x, y, floor_id = node
+    world_map = world_maps.get(floor_id)
+    tile = world_map.get_tile(x, y) if world_map else None
+    if not tile:
+        return False
+    if check_monster and tile.monster:
+        return False
+
+    prev_x, prev_y, prev_floor_id = previous
+    if prev_floor_id == floor_id:
+        return (
+            abs(prev_x - x) + abs(prev_y - y) == 1
+            and tile.is_explored
+            and (tile.type != "wall" or tile.is_portal)
+        )
+
+    # Taking a portal: same position, landing on anything but a wall
+    prev_map = world_maps.get(prev_floor_id)
+    prev_tile = prev_map.get_tile(prev_x, prev_y) if prev_map else None
+    return (
+        (prev_x, prev_y) == (x, y)
+        and prev_tile is not None
+        and prev_tile.is_portal
+        and prev_tile.portal_to_floor_id == floor_id
+        and tile.type != "wall"
+    )
+
+
+def _map_versions(
+    world_maps: Dict[int, WorldMap], path: List[PathNode]
+) -> Dict[int, int]:
+    """Returns the current version of each floor the path crosses."""
+    return {
+        floor_id: world_maps[floor_id].version
+        for floor_id in {node[2] for node in path}
+        if floor_id in world_maps
+    }
@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from src.items import categories as item_categories
+from src.world_map import WorldMap
 
 if TYPE_CHECKING:
     from src.items import Item
-    from src.world_map import WorldMap
 
     from .ai_player_view import AIPlayerView
 
@@ -21,16 +23,33 @@ class TargetFinder:
         item_filter: Callable[["Item"], bool],
         target_type: str,
         same_floor_only: bool = False,
+        categories: Sequence[str] = (),
     ) -> List[Tuple[int, int, int, str, int]]:
+        """
+        Finds explored items accepted by item_filter on the AI maps.
+
+        With `categories`, only the items the map has bucketed under those
+        categories (see src.items.categories) are considered, instead of
+        scanning every tile. Items are reported per floor in row-major order
+        either way.
+        """
         targets = []
         for floor_id, ai_map in self.ai_visible_maps.items():
             if not ai_map:
                 continue
             if same_floor_only and floor_id != player_floor_id:
                 continue
-            for y, x in ai_map.iter_coords():
+            if categories and isinstance(ai_map, WorldMap):
+                candidates = ai_map.get_items_in_categories(*categories)
+            else:
+                candidates = [
+                    (x, y, tile.item)
+                    for y, x in ai_map.iter_coords()
+                    if (tile := ai_map.get_tile(x, y)) and tile.item
+                ]
+            for x, y, item in candidates:
                 tile = ai_map.get_tile(x, y)
-                if tile and tile.is_explored and tile.item and item_filter(tile.item):
+                if tile and tile.is_explored and item_filter(item):
                     dist_est = (
                         abs(x - player_pos_xy[0])
                         + abs(y - player_pos_xy[1])
@@ -53,6 +72,7 @@ class TargetFinder:
             lambda item: isinstance(item, QuestItem),
             "quest_item",
             same_floor_only,
+            categories=(item_categories.QUEST,),
         )
 
     def find_health_potions(
@@ -76,6 +96,7 @@ class TargetFinder:
             item_filter,
             "health_potion",
             same_floor_only,
+            categories=(item_categories.HEALING,),
         )
 
     def find_weapons(
@@ -107,6 +128,7 @@ class TargetFinder:
             item_filter,
             "weapon",
             same_floor_only,
+            categories=(item_categories.equipment_category("main_hand"),),
         )
 
     def find_armor(
@@ -141,6 +163,9 @@ class TargetFinder:
             item_filter,
             "armor",
             same_floor_only,
+            categories=tuple(
+                item_categories.equipment_category(slot) for slot in armor_slots
+            ),
         )
 
     def find_other_items(
@@ -169,7 +194,12 @@ class TargetFinder:
             return True
 
         return self._find_items(
-            player_pos_xy, player_floor_id, item_filter, "other_item", same_floor_only
+            player_pos_xy,
+            player_floor_id,
+            item_filter,
+            "other_item",
+            same_floor_only,
+            categories=(item_categories.OTHER,),
         )
 
     def find_monsters(
@@ -2,13 +2,18 @@
 UtilityCalculator - Selects and executes the highest-utility available action.
 
 This is the core decision-making component of the Utility-Based AI system.
-It evaluates all available actions, calculates their utility scores,
+It evaluates available actions, calculates their utility scores,
 and selects the best one to execute.
+
+Actions are evaluated lazily in order of their max_utility bound: once no
+unevaluated action could outscore the best one found so far, the remaining
+(often pathfinding-backed) actions are never evaluated.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple
+import heapq
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.ai_logic.actions.base_action import AIAction
@@ -35,13 +40,56 @@ class UtilityCalculator:
         """
         self.actions = actions
 
+    def ranked_actions(self, ctx: "AIContext") -> Iterator[Tuple["AIAction", float]]:
+        """
+        Yield (action, utility) for actions worth taking, best first.
+
+        The order is utility descending, then name, as if every action had
+        been evaluated and sorted. Actions that are unavailable or score 0
+        are left out. An action is only evaluated once an action yielded
+        before it could not have been outscored by it, judging by its
+        max_utility, so consumers that stop early skip the low-priority
+        actions entirely.
+
+        Args:
+            ctx: The current game state context.
+
+        Yields:
+            Tuples of action and utility score.
+        """
+        # Visit in the order the bounds could place the actions
+        pending = sorted(self.actions, key=lambda a: (-a.max_utility, a.name))
+        candidates: List[Tuple[float, str, int, "AIAction"]] = []
+        next_index = 0
+        while True:
+            while next_index < len(pending):
+                action = pending[next_index]
+                # Stop once the best candidate beats every pending bound
+                if candidates and (-action.max_utility, action.name) > (
+                    candidates[0][0],
+                    candidates[0][1],
+                ):
+                    break
+                next_index += 1
+                if not action.is_available(ctx):
+                    continue
+                utility = action.calculate_utility(ctx)
+                if utility > 0:
+                    heapq.heappush(
+                        candidates, (-utility, action.name, next_index, action)
+                    )
+            if not candidates:
+                return
+            negative_utility, _, _, action = heapq.heappop(candidates)
+            yield action, -negative_utility
+
     def select_action(self, ctx: "AIContext") -> Optional["AIAction"]:
         """
         Return the highest-utility available action.
 
         Filters actions by availability, then selects the one with
         the highest utility score. If utilities tie, actions are
-        sorted by name for determinism.
+        sorted by name for determinism. See ranked_actions.
 
         Args:
             ctx: The current game state context.
@@ -49,24 +97,9 @@ class UtilityCalculator:
         Returns:
             The best AIAction to execute, or None if no actions available.
         """
-        available = [
-            (action, action.calculate_utility(ctx))
-            for action in self.actions
-            if action.is_available(ctx)
-        ]
-
-        if not available:
-            return None
-
-        # Sort by utility descending, then by name for determinism
-        available.sort(key=lambda x: (-x[1], x[0].name))
-
-        # Return the action with highest utility (if utility > 0)
-        best_action, best_utility = available[0]
-        if best_utility <= 0:
-            return None
-
-        return best_action
+        for action, _ in self.ranked_actions(ctx):
+            return action
+        return None
 
     def get_action_scores(self, ctx: "AIContext") -> List[Tuple[str, float, bool]]:
         """
@@ -106,23 +139,8 @@ class UtilityCalculator:
         Returns:
             The command tuple from the executed action, or None.
         """
-        # Get all available actions sorted by utility
-        available = [
-            (action, action.calculate_utility(ctx))
-            for action in self.actions
-            if action.is_available(ctx)
-        ]
-
-        if not available:
-            return None
-
-        # Sort by utility descending, then by name for determinism
-        available.sort(key=lambda x: (-x[1], x[0].name))
-
         # Try each action in order until one succeeds
-        for action, utility in available:
-            if utility <= 0:
-                break
+        for action, _ in self.ranked_actions(ctx):
             result = action.execute(ctx, ai_logic, message_log)
             if result is not None:
                 return result
@@ -0,0 +1,343 @@
+"""
+Array-backed WorldMap storage.
+
+ArrayWorldMap keeps every per-cell attribute in a flat buffer indexed by
+``y * width + x`` (a structure-of-arrays layout) instead of allocating one
+Tile object per cell. Hot loops can read the buffers directly, while
+``get_tile`` keeps returning Tile-compatible proxies for existing callers.
+"""
+
+from array import array
+from itertools import compress
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.tile import Tile
+from src.world_map import WorldMap
+
+if TYPE_CHECKING:
+    from src.items import Item
+    from src.monster import Monster
+    from src.player import Player
+
+# Compact codes stored in ArrayWorldMap.tile_types. Unknown tile type names are
+# assigned new codes on first use by tile_type_code().
+TILE_TYPE_NAMES: List[str] = ["floor", "wall", "portal", "potential_floor"]
+TILE_TYPE_CODES: Dict[str, int] = {
+    name: code for code, name in enumerate(TILE_TYPE_NAMES)
+}
+FLOOR_CODE = TILE_TYPE_CODES["floor"]
+WALL_CODE = TILE_TYPE_CODES["wall"]
+PORTAL_CODE = TILE_TYPE_CODES["portal"]
+
+# Bit flags stored in ArrayWorldMap.occupancy.
+OCCUPANT_MONSTER = 1
+OCCUPANT_ITEM = 2
+OCCUPANT_PLAYER = 4
+
+# Sentinel stored in ArrayWorldMap.portal_dest for "no destination".
+NO_PORTAL_DEST = -1
+
+
+def tile_type_code(tile_type: str) -> int:
+    """Return the buffer code for a tile type name, registering it if new."""
+    code = TILE_TYPE_CODES.get(tile_type)
+    if code is None:
+        code = len(TILE_TYPE_NAMES)
+        if code > 255:
+            raise ValueError(f"Too many tile types to encode: {tile_type!r}")
+        TILE_TYPE_NAMES.append(tile_type)
+        TILE_TYPE_CODES[tile_type] = code
+    return code
+
+
+class TileView(Tile):
+    """
+    Lightweight Tile proxy for one cell of an ArrayWorldMap.
+
+    Reading or assigning an attribute (``type``, ``monster``, ``is_explored``,
+    ...) goes straight to the owning map's buffers, so a TileView never holds
+    state of its own and can be created and dropped freely.
+    """
+
+    __slots__ = ("_map", "_index")
+
+    def __init__(self, world_map: "ArrayWorldMap", index: int):
+        # Tile.__init__ is intentionally not called: all state lives in the map.
+        self._map = world_map
+        self._index = index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TileView):
+            return self._map is other._map and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._map), self._index))
+
+    def __repr__(self) -> str:
+        x, y = self._index % self._map.width, self._index // self._map.width
+        return f"TileView(x={x}, y={y}, type={self.type!r})"
+
+    @property  # type: ignore[override]
+    def type(self) -> str:
+        return TILE_TYPE_NAMES[self._map.tile_types[self._index]]
+
+    @type.setter
+    def type(self, value: str) -> None:
+        self._map.tile_types[self._index] = tile_type_code(value)
+
+    @property  # type: ignore[override]
+    def is_explored(self) -> bool:
+        return bool(self._map.explored[self._index])
+
+    @is_explored.setter
+    def is_explored(self, value: bool) -> None:
+        self._map.explored[self._index] = 1 if value else 0
+
+    @property  # type: ignore[override]
+    def is_currently_visible(self) -> bool:
+        return bool(self._map.visible[self._index])
+
+    @is_currently_visible.setter
+    def is_currently_visible(self, value: bool) -> None:
+        self._map.visible[self._index] = 1 if value else 0
+
+    @property  # type: ignore[override]
+    def is_portal(self) -> bool:
+        return bool(self._map.portal_flags[self._index])
+
+    @is_portal.setter
+    def is_portal(self, value: bool) -> None:
+        self._map.portal_flags[self._index] = 1 if value else 0
+
+    @property  # type: ignore[override]
+    def portal_to_floor_id(self) -> Optional[int]:
+        dest = self._map.portal_dest[self._index]
+        return None if dest == NO_PORTAL_DEST else dest
+
+    @portal_to_floor_id.setter
+    def portal_to_floor_id(self, value: Optional[int]) -> None:
+        self._map.portal_dest[self._index] = NO_PORTAL_DEST if value is None else value
+
+    @property  # type: ignore[override]
+    def monster(self) -> "Optional[Monster]":
+        return self._map._monsters.get(self._index)
+
+    @monster.setter
+    def monster(self, value: "Optional[Monster]") -> None:
+        self._map._set_occupant(
+            self._map._monsters, OCCUPANT_MONSTER, self._index, value
+        )
+
+    @property  # type: ignore[override]
+    def item(self) -> "Optional[Item]":
+        return self._map._items.get(self._index)
+
+    @item.setter
+    def item(self, value: "Optional[Item]") -> None:
+        self._map._set_occupant(self._map._items, OCCUPANT_ITEM, self._index, value)
+
+    @property  # type: ignore[override]
+    def player(self) -> "Optional[Player]":
+        return self._map._players.get(self._index)
+
+    @player.setter
+    def player(self, value: "Optional[Player]") -> None:
+        self._map._set_occupant(self._map._players, OCCUPANT_PLAYER, self._index, value)
+
+
+class ArrayWorldMap(WorldMap):
+    """
+    WorldMap backend that stores tile state in flat buffers.
+
+    All buffers are indexed by ``y * width + x`` (see ``index``).
+
+    Attributes:
+        tile_types (bytearray): Tile type code per cell (see TILE_TYPE_CODES).
+        explored (bytearray): 1 if the cell has been explored, else 0.
+        visible (bytearray): 1 if the cell is currently visible, else 0.
+        portal_flags (bytearray): 1 if the cell is a portal, else 0.
+        portal_dest (array): Destination floor id per cell, or NO_PORTAL_DEST.
+        occupancy (bytearray): OCCUPANT_* bit flags per cell, so entity
+                               presence can be tested without a dict lookup.
+    """
+
+    def __init__(self, width: int, height: int, tile_type: str = "floor"):
+        """
+        Initializes an ArrayWorldMap of the given dimensions.
+
+        Args:
+            width: The width of the map.
+            height: The height of the map.
+            tile_type: The type every cell starts with. Defaults to "floor"
+                       to match WorldMap.
+        """
+        self.width = width
+        self.height = height
+        size = width * height
+        self.tile_types = bytearray([tile_type_code(tile_type)]) * size
+        self.explored = bytearray(size)
+        self.visible = bytearray(size)
+        self.portal_flags = bytearray(size)
+        self.portal_dest = array("i", [NO_PORTAL_DEST]) * size
+        self.occupancy = bytearray(size)
+        self._monsters: Dict[int, "Monster"] = {}
+        self._items: Dict[int, "Item"] = {}
+        self._players: Dict[int, "Player"] = {}
+        self._init_change_tracking()
+        self._init_entity_index()
+
+    @classmethod
+    def from_world_map(cls, world_map: WorldMap) -> "ArrayWorldMap":
+        """Build an ArrayWorldMap holding the same cell state as world_map."""
+        array_map = cls(world_map.width, world_map.height)
+        for y, x in world_map.iter_coords():
+            source = world_map.get_tile(x, y)
+            if source is None:
+                continue
+            target = TileView(array_map, array_map.index(x, y))
+            target.type = source.type
+            target.is_explored = source.is_explored
+            target.is_currently_visible = source.is_currently_visible
+            target.is_portal = source.is_portal
+            target.portal_to_floor_id = source.portal_to_floor_id
+            target.monster = source.monster
+            target.item = source.item
+            target.player = source.player
+        array_map.reindex_entities()
+        return array_map
+
+    def to_world_map(self) -> WorldMap:
+        """
+        Build a Tile-backed WorldMap holding the same cell state; the reverse
+        of from_world_map. Each Tile is created once and then filled in.
+        """
+        world_map = WorldMap(self.width, self.height)
+        tiles = [tile for row in world_map.grid for tile in row]
+        for tile, code in zip(tiles, self.tile_types):
+            tile.type = TILE_TYPE_NAMES[code]
+        for index in compress(range(len(tiles)), self.explored):
+            tiles[index].is_explored = True
+        for index in compress(range(len(tiles)), self.visible):
+            tiles[index].is_currently_visible = True
+        for index in compress(range(len(tiles)), self.portal_flags):
+            tiles[index].is_portal = True
+        for index, dest in enumerate(self.portal_dest):
+            if dest != NO_PORTAL_DEST:
+                tiles[index].portal_to_floor_id = dest
+        if self._monsters or self._items or self._players:
+            for index, monster in self._monsters.items():
+                tiles[index].monster = monster
+            for index, item in self._items.items():
+                tiles[index].item = item
+            for index, player in self._players.items():
+                tiles[index].player = player
+            world_map.reindex_entities()
+        return world_map
+
+    @property
+    def grid(self) -> List[List[TileView]]:  # type: ignore[override]
+        """
+        Row-major TileView snapshot for code written against WorldMap.grid.
+
+        Assigning into the returned lists does not change the map; mutate the
+        proxies (or the buffers) instead.
+        """
+        return [
+            [TileView(self, y * self.width + x) for x in range(self.width)]
+            for y in range(self.height)
+        ]
+
+    def index(self, x: int, y: int) -> int:
+        """Return the buffer index of (x, y). Coordinates are not checked."""
+        return y * self.width + x
+
+    def type_mask(self, tile_type: str, interior: bool = False) -> bytearray:
+        """
+        Return one byte per cell, 1 where the cell has the given type and 0
+        elsewhere, indexed like the buffers.
+
+        Args:
+            tile_type: The tile type to select.
+            interior: Also clear the outer ring of cells (the map border).
+        """
+        table = bytearray(256)
+        table[tile_type_code(tile_type)] = 1
+        mask = self.tile_types.translate(table)
+        if interior and mask:
+            width, height = self.width, self.height
+            mask[:width] = bytes(width)
+            mask[-width:] = bytes(width)
+            mask[::width] = bytes(height)
+            mask[width - 1 :: width] = bytes(height)
+        return mask
+
+    def coords_in(self, mask: bytes) -> List[Tuple[int, int]]:
+        """Return (x, y) of every cell set in mask, in row-major order."""
+        width = self.width
+        return [
+            (index % width, index // width)
+            for index in compress(range(len(mask)), mask)
+        ]
+
+    def get_tile(self, x: int, y: int) -> Tile | None:
+        """
+        Returns a TileView proxy for the cell at (x, y).
+
+        Args:
+            x: The x-coordinate of the tile.
+            y: The y-coordinate of the tile.
+
+        Returns:
+            A TileView if the coordinates are within map bounds, otherwise None.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return TileView(self, y * self.width + x)
+        return None
+
+    def set_tile_type(self, x: int, y: int, tile_type: str) -> bool:
+        """
+        Sets the base type of the tile at the specified coordinates.
+
+        Args:
+            x: The x-coordinate of the tile.
+            y: The y-coordinate of the tile.
+            tile_type: The new type for the tile (e.g., "wall", "floor").
+
+        Returns:
+            True if tile type was set, False if coords are out of bounds.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.tile_types[y * self.width + x] = tile_type_code(tile_type)
+            self._record_terrain_change(x, y)
+            return True
+        return False
+
+    def is_valid_move(self, x: int, y: int) -> bool:
+        """
+        Checks if a move to the specified coordinates is valid.
+        A move is valid if the coordinates are within map bounds and the
+        tile is not a "wall" (portals are always enterable).
+
+        Args:
+            x: The target x-coordinate.
+            y: The target y-coordinate.
+
+        Returns:
+            True if the move is valid, False otherwise.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = y * self.width + x
+            return self.tile_types[index] != WALL_CODE or bool(self.portal_flags[index])
+        return False
+
+    def _set_occupant(
+        self, occupants: Dict[int, object], flag: int, index: int, value: object
+    ) -> None:
+        """Store or clear an entity in one of the occupant dicts."""
+        if value is None:
+            occupants.pop(index, None)
+            self.occupancy[index] &= ~flag & 0xFF
+        else:
+            occupants[index] = value
+            self.occupancy[index] |= flag
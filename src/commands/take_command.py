@@ -56,7 +56,7 @@ class TakeCommand(Command):
                     self.message_log.add_message(
                         f"You picked up the {removed_item.name}! You win!"
                     )
-                return {"game_over": True}
+                return {"game_over": True, "player_won": True}
             else:
                 self.message_log.add_message(
                     f"Error: Failed to remove quest item {item_to_take.name} from map."
@@ -3,20 +3,44 @@ from __future__ import annotations
 import curses
 import random
 import time
+from dataclasses import dataclass, field
+from typing import Iterable
 
 from src.ai_logic import AILogic
 from src.command_processor import CommandProcessor
 from src.game_state import GameState
 from src.input_handler import InputHandler
 from src.input_mode import InputMode
+from src.map_algorithms.distance_field import DistanceFieldCache
+from src.map_algorithms.line_of_sight import (
+    DEFAULT_FOV_ALGORITHM,
+    calculate_visible_tiles,
+)
 from src.message_log import MessageLog
 from src.monster_ai.main import MonsterAILogic
+from src.monster_ai.turn import MonsterTurn
 from src.parser import Parser
 from src.player import Player
+from src.render_scheduler import RenderScheduler
 from src.renderer import Renderer
+from src.run_result import RunLimit, RunResult
 from src.world_generator import WorldGenerator
 from src.world_map import WorldMap
 
+# Wall-clock limit of GameEngine.run in debug mode unless max_seconds is given
+DEBUG_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class _FogState:
+    """What the visible map of one floor was last synced from."""
+
+    real_map: WorldMap
+    visible_map: WorldMap
+    version: int = -1
+    view_key: tuple[int, int, int] | None = None
+    visible: set[tuple[int, int]] = field(default_factory=set)
+
 
 class GameEngine:
     def __init__(
@@ -31,18 +55,35 @@ class GameEngine:
         world_maps: dict[int, WorldMap] | None = None,
         player_start_pos: tuple[int, int, int] | None = None,
         winning_pos: tuple[int, int, int] | None = None,
+        fov_algorithm: str = DEFAULT_FOV_ALGORITHM,
+        incremental_fog: bool = True,
+        target_fps: float | None = None,
     ):
         self.world_generator = WorldGenerator()
+        self.fov_algorithm = fov_algorithm
+        self.incremental_fog = incremental_fog
+        # Per-floor state for incremental fog-of-war updates
+        self._fog_states: dict[int, _FogState] = {}
         self.parser = Parser()
         self.debug_mode = debug_mode
         self.ai_active = ai_active
         self.ai_sleep_duration = ai_sleep_duration
+        # With a target frame rate the AI plays without sleeping and frames
+        # are rendered at that rate at most; otherwise every turn is rendered.
+        self.render_scheduler = (
+            RenderScheduler(target_fps)
+            if ai_active and target_fps is not None
+            else None
+        )
         self.ai_logic = None
         self.verbose = verbose
         self.random = random.Random(seed)
         self._debug_commands: list[tuple[str, str | None]] | None = None
 
         self.visible_maps: dict[int, WorldMap] = {}
+        # Shared by all monster AIs so chasing the player costs one distance
+        # field per player position rather than one search per monster.
+        self.distance_fields = DistanceFieldCache()
 
         if world_maps:
             self.world_maps = world_maps
@@ -97,6 +138,10 @@ class GameEngine:
             health=20,
         )
         self.game_state = GameState.PLAYING
+        # Turns played so far (commands received, including empty ones)
+        self.turn_count = 0
+        # Set when a command reports the game won (the quest item was taken)
+        self.player_won = False
         self.message_log = MessageLog(max_messages=5)
 
         if self.ai_active:
@@ -122,6 +167,7 @@ class GameEngine:
                     player=self.player,
                     world_map=world_map,
                     random_generator=self.random,
+                    distance_fields=self.distance_fields,
                 )
 
     def _handle_monster_actions(self):
@@ -129,11 +175,16 @@ class GameEngine:
         if not current_map:
             return
 
+        # Line of sight and the way to the player are worked out once for
+        # all monsters on the floor
+        turn = MonsterTurn(
+            current_map, self.player.x, self.player.y, self.distance_fields
+        )
         for monster in current_map.get_monsters():
             if monster.health > 0 and monster.ai:
                 monster.move_energy += monster.move_speed
                 if monster.move_energy >= 10:
-                    action = monster.ai.get_next_action()
+                    action = monster.ai.get_next_action(turn)
                     if action:
                         is_move_action = action[0] == "move"
                         if is_move_action:
@@ -148,8 +199,6 @@ class GameEngine:
                         )
 
     def _update_fog_of_war_visibility(self) -> None:
-        from src.map_algorithms.line_of_sight import calculate_visible_tiles
-
         player_x, player_y = self.player.x, self.player.y
         current_floor_id = self.player.current_floor_id
 
@@ -162,58 +211,246 @@ class GameEngine:
             )
             return
 
+        # Get player's view radius (can be affected by equipment)
+        player_view_radius = self.player.get_view_radius()
+
+        if self.incremental_fog:
+            newly_explored = self._update_fog_incrementally(
+                current_floor_id,
+                current_real_map,
+                current_visible_map,
+                (player_x, player_y, player_view_radius),
+            )
+        else:
+            newly_explored = self._update_fog_fully(
+                current_real_map,
+                current_visible_map,
+                (player_x, player_y, player_view_radius),
+            )
+
+        # Nothing reads the visible map's change set; keep it from growing
+        current_visible_map.take_changed_tiles()
+
+        if newly_explored and self.ai_logic:
+            self.ai_logic.explorer.on_tiles_explored(current_floor_id, newly_explored)
+
+    def _update_fog_fully(
+        self,
+        real_map: WorldMap,
+        visible_map: WorldMap,
+        view_key: tuple[int, int, int],
+    ) -> list[tuple[int, int]]:
+        """
+        Rebuilds visibility from scratch: clears every tile of the visible
+        map, recomputes the field of view and copies each visible tile.
+
+        Returns:
+            The (x, y) tiles explored for the first time.
+        """
         # At the beginning of the update, clear all monster visibility on the
         # visible map. This ensures that monsters that move out of sight are no
         # longer drawn.
-        for y in range(current_visible_map.height):
-            for x in range(current_visible_map.width):
-                tile = current_visible_map.get_tile(x, y)
-                if tile:
-                    tile.monster = None
-                    tile.is_currently_visible = False
+        self._clear_visibility(visible_map)
 
-        # Get player's view radius (can be affected by equipment)
-        player_view_radius = self.player.get_view_radius()
+        return self._copy_visible_tiles(
+            real_map, visible_map, self._visible_positions(real_map, view_key)
+        )
+
+    def _update_fog_incrementally(
+        self,
+        floor_id: int,
+        real_map: WorldMap,
+        visible_map: WorldMap,
+        view_key: tuple[int, int, int],
+    ) -> list[tuple[int, int]]:
+        """
+        Updates visibility from what changed since the previous update of
+        this floor, giving the same visible map as _update_fog_fully.
+
+        The field of view is only recomputed when the player position, the
+        view radius or the real map's version (its terrain) changed. Tiles
+        that left view lose their visibility and monster; tiles that entered
+        view, and visible tiles the real map reports as changed, are copied.
+
+        Returns:
+            The (x, y) tiles explored for the first time.
+        """
+        changed_tiles = real_map.take_changed_tiles()
+        state = self._fog_states.get(floor_id)
+        if (
+            state is None
+            or state.real_map is not real_map
+            or state.visible_map is not visible_map
+        ):
+            # Nothing is known about this visible map yet; start from a clean one.
+            self._clear_visibility(visible_map)
+            state = _FogState(real_map, visible_map)
+            self._fog_states[floor_id] = state
+
+        # A version bump may come from edits that changed_tiles cannot list
+        # (mark_changed), so every visible tile is copied again in that case.
+        terrain_changed = state.version != real_map.version
+        previous = state.visible
+        if terrain_changed or state.view_key != view_key:
+            current = set(self._visible_positions(real_map, view_key))
+        else:
+            current = previous
 
-        # Calculate visible tiles using line of sight
+        for map_x, map_y in previous - current:
+            visible_tile = visible_map.get_tile(map_x, map_y)
+            if visible_tile:
+                visible_tile.is_currently_visible = False
+                visible_map.remove_monster(map_x, map_y)
+
+        if terrain_changed:
+            to_copy = current
+        else:
+            to_copy = (current - previous) | (changed_tiles & current)
+        newly_explored = self._copy_visible_tiles(real_map, visible_map, to_copy)
+
+        state.version = real_map.version
+        state.view_key = view_key
+        state.visible = current
+        return newly_explored
+
+    def _visible_positions(
+        self, real_map: WorldMap, view_key: tuple[int, int, int]
+    ) -> list[tuple[int, int]]:
+        """Returns the in-bounds tiles in line of sight for (x, y, radius)."""
+        player_x, player_y, view_radius = view_key
         visible_tiles = calculate_visible_tiles(
-            current_real_map, player_x, player_y, player_view_radius
+            real_map,
+            player_x,
+            player_y,
+            view_radius,
+            algorithm=self.fov_algorithm,
         )
+        return [
+            (map_x, map_y)
+            for map_x, map_y in visible_tiles
+            if 0 <= map_x < real_map.width and 0 <= map_y < real_map.height
+        ]
 
-        # Update visibility for all tiles in line of sight
-        for map_x, map_y in visible_tiles:
-            if not (
-                0 <= map_x < current_real_map.width
-                and 0 <= map_y < current_real_map.height
-            ):
-                continue
-
-            real_tile = current_real_map.get_tile(map_x, map_y)
-            if real_tile:
-                visible_tile = current_visible_map.get_tile(map_x, map_y)
-                if visible_tile:
-                    visible_tile.type = real_tile.type
-                    visible_tile.item = real_tile.item
-                    visible_tile.is_portal = real_tile.is_portal
-                    visible_tile.portal_to_floor_id = real_tile.portal_to_floor_id
-                    visible_tile.is_explored = True
-                    visible_tile.is_currently_visible = True
-
-                    # Update monster visibility for currently visible tiles
-                    if real_tile.monster:
-                        visible_tile.monster = real_tile.monster
-
-    def run(self):
+    @staticmethod
+    def _clear_visibility(visible_map: WorldMap) -> None:
+        """Removes every monster from the visible map and marks all tiles unseen."""
+        for x, y, _ in visible_map.get_monsters_with_positions():
+            visible_map.remove_monster(x, y)
+        for y in range(visible_map.height):
+            for x in range(visible_map.width):
+                tile = visible_map.get_tile(x, y)
+                if tile:
+                    tile.is_currently_visible = False
+
+    @classmethod
+    def _copy_visible_tiles(
+        cls,
+        real_map: WorldMap,
+        visible_map: WorldMap,
+        positions: Iterable[tuple[int, int]],
+    ) -> list[tuple[int, int]]:
+        """
+        Copies tiles in view from the real map onto the visible map.
+
+        The visible map's version is bumped once, and only if the terrain or
+        walkability of some tile changed, so AI caches keyed on it (path
+        cache, portal graph) survive turns where nothing new was learnt.
+
+        Returns:
+            The (x, y) tiles explored for the first time.
+        """
+        newly_explored: list[tuple[int, int]] = []
+        terrain_changes: list[tuple[int, int]] = []
+        for map_x, map_y in positions:
+            cls._copy_visible_tile(
+                real_map, visible_map, map_x, map_y, newly_explored, terrain_changes
+            )
+        if terrain_changes:
+            visible_map.record_terrain_changes(terrain_changes)
+        return newly_explored
+
+    @staticmethod
+    def _copy_visible_tile(
+        real_map: WorldMap,
+        visible_map: WorldMap,
+        map_x: int,
+        map_y: int,
+        newly_explored: list[tuple[int, int]],
+        terrain_changes: list[tuple[int, int]],
+    ) -> None:
+        """Copies a tile in view from the real map onto the visible map."""
+        real_tile = real_map.get_tile(map_x, map_y)
+        visible_tile = visible_map.get_tile(map_x, map_y)
+        if not real_tile or not visible_tile:
+            return
+        terrain_changed = (
+            visible_tile.type != real_tile.type
+            or visible_tile.is_portal != real_tile.is_portal
+            or visible_tile.portal_to_floor_id != real_tile.portal_to_floor_id
+        )
+        visible_tile.type = real_tile.type
+        if visible_tile.item is not real_tile.item:
+            # Go through the map so its item index stays current
+            visible_map.remove_item(map_x, map_y)
+            if real_tile.item:
+                visible_map.place_item(real_tile.item, map_x, map_y)
+        visible_tile.is_portal = real_tile.is_portal
+        visible_tile.portal_to_floor_id = real_tile.portal_to_floor_id
+        if not visible_tile.is_explored:
+            newly_explored.append((map_x, map_y))
+            # Explored tiles become walkable for require_explored searches
+            if not terrain_changed and visible_map.is_valid_move(map_x, map_y):
+                terrain_changed = True
+        if terrain_changed:
+            terrain_changes.append((map_x, map_y))
+        visible_tile.is_explored = True
+        visible_tile.is_currently_visible = True
+
+        # Update monster visibility for currently visible tiles
+        if visible_tile.monster is not real_tile.monster:
+            visible_map.remove_monster(map_x, map_y)
+            if real_tile.monster:
+                visible_map.place_monster(real_tile.monster, map_x, map_y)
+
+    def run(
+        self, max_turns: int | None = None, max_seconds: float | None = None
+    ) -> RunResult:
+        """
+        Plays the game until it ends or a budget runs out.
+
+        Args:
+            max_turns: Stop after this many turns. Turn budgets give the same
+                       cut-off on every machine.
+            max_seconds: Stop once this much wall-clock time has passed,
+                         checked between turns. Debug mode defaults to
+                         DEBUG_TIMEOUT_SECONDS.
+
+        Returns:
+            A RunResult saying how the game ended and which limit, if any,
+            stopped it.
+        """
         if self.debug_mode:
             self._setup_debug_mode()
+            if max_seconds is None:
+                max_seconds = DEBUG_TIMEOUT_SECONDS
 
+        start_time = time.time()
         try:
-            self._main_game_loop()
+            limit_reached = self._main_game_loop(max_turns, max_seconds)
             self._handle_game_over()
         finally:
             if not self.debug_mode:
                 self.renderer.cleanup_curses()
 
+        return RunResult(
+            game_state=self.game_state,
+            turns=self.turn_count,
+            seconds=time.time() - start_time,
+            player_health=self.player.health,
+            limit_reached=limit_reached,
+            player_won=self.player_won,
+        )
+
     def _setup_debug_mode(self):
         print("--- Starting Game in Debug Mode ---")
         print(f"\nPlayer initial position: ({self.player.x}, {self.player.y})")
@@ -221,36 +458,55 @@ class GameEngine:
         print(f"Winning position: {self.winning_full_pos}")
         self._print_full_map_debug()
 
-    def _main_game_loop(self):
+    def _main_game_loop(
+        self, max_turns: int | None = None, max_seconds: float | None = None
+    ) -> RunLimit | None:
         start_time = time.time()
-        timeout_seconds = 30
 
         self._update_fog_of_war_visibility()
         if not self.debug_mode:
             self._render()
 
         while self.game_state == GameState.PLAYING:
-            if self.debug_mode and time.time() - start_time > timeout_seconds:
-                print("--- Debug Mode Timeout ---")
+            limit_reached = None
+            if max_turns is not None and self.turn_count >= max_turns:
+                limit_reached = RunLimit.MAX_TURNS
+            elif max_seconds is not None and time.time() - start_time > max_seconds:
+                limit_reached = RunLimit.MAX_SECONDS
+            if limit_reached:
+                if self.debug_mode:
+                    print("--- Debug Mode Timeout ---")
                 self.game_state = GameState.GAME_OVER
-                break
+                return limit_reached
 
-            self._handle_invisibility()
-            self._update_fog_of_war_visibility()
+            self.play_turn()
 
-            parsed_command_output = self._get_next_command()
-            if parsed_command_output == "NO_COMMAND":
-                self.game_state = GameState.QUIT
-                break
+            if self.game_state == GameState.PLAYING and not self.debug_mode:
+                # The final state is rendered by _handle_game_over
+                if self.render_scheduler is None or self.render_scheduler.frame_due():
+                    self._render()
+        return None
+
+    def play_turn(self) -> None:
+        """
+        Plays a single turn: gets the next command from the AI or the input
+        handler, processes it and lets the monsters act. Rendering is left to
+        the caller. Updates game_state when the game ends.
+        """
+        self._handle_invisibility()
+        self._update_fog_of_war_visibility()
 
-            if parsed_command_output:
-                self._process_command(parsed_command_output)
+        parsed_command_output = self._get_next_command()
+        if parsed_command_output == "NO_COMMAND":
+            self.game_state = GameState.QUIT
+            return
+        self.turn_count += 1
 
-            if self.game_state == GameState.PLAYING and not self.debug_mode:
-                self._render()
+        if parsed_command_output:
+            self._process_command(parsed_command_output)
 
-            if self.player.health <= 0:
-                self.game_state = GameState.GAME_OVER
+        if self.player.health <= 0:
+            self.game_state = GameState.GAME_OVER
 
     def _handle_game_over(self):
         if self.game_state == GameState.GAME_OVER:
@@ -271,7 +527,8 @@ class GameEngine:
     def _get_next_command(self):
         if self.ai_active and self.ai_logic:
             # AI is active, get command from AI logic
-            time.sleep(self.ai_sleep_duration)
+            if self.render_scheduler is None:
+                time.sleep(self.ai_sleep_duration)
             return self.ai_logic.get_next_action()
         else:
             # AI is not active, get command from player input
@@ -310,6 +567,8 @@ class GameEngine:
         if "used_item" in results:
             self._handle_item_use(results["used_item"])
 
+        if results.get("player_won", False):
+            self.player_won = True
         if results.get("game_over", False):
             self.game_state = GameState.GAME_OVER
 
@@ -0,0 +1,46 @@
+"""
+Item categories for bucketing items on a map.
+
+Every item falls in exactly one category, matching the item kinds the AI
+looks for: healing consumables, equipment per slot, quest items and
+everything else. WorldMap keeps its items bucketed by category so a query
+only looks at candidates of the right kind.
+"""
+
+from __future__ import annotations
+
+from src.effects.healing_effect import HealingEffect
+from src.items.consumable_item import ConsumableItem
+from src.items.equippable import EquippableItem
+from src.items.item import Item
+from src.items.quest_item import QuestItem
+
+HEALING = "healing"
+QUEST = "quest"
+OTHER = "other"
+
+
+def equipment_category(slot: str | None) -> str:
+    """Returns the category of equippable items for the given slot."""
+    return f"equipment:{slot}"
+
+
+def item_category(item: Item) -> str:
+    """
+    Returns the category of an item.
+
+    Args:
+        item: The item to categorize.
+
+    Returns:
+        QUEST, HEALING, OTHER or equipment_category(slot).
+    """
+    if isinstance(item, QuestItem):
+        return QUEST
+    if isinstance(item, EquippableItem):
+        return equipment_category(item.properties.get("slot"))
+    if isinstance(item, ConsumableItem) and any(
+        isinstance(effect, HealingEffect) for effect in item.effects
+    ):
+        return HEALING
+    return OTHER
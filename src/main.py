@@ -30,6 +30,10 @@ except NameError:
 
 
 from src.game_engine import GameEngine  # noqa: E402 (ignore import not at top of file)
+from src.map_algorithms.line_of_sight import (  # noqa: E402
+    DEFAULT_FOV_ALGORITHM,
+    FOV_ALGORITHMS,
+)
 
 # --- End Path setup ---
 
@@ -38,7 +42,13 @@ from src.game_engine import GameEngine  # noqa: E402 (ignore import not at top o
 # it can be imported here, but typically it's encapsulated.
 
 
-def main_debug(seed=None, verbose=0):
+def main_debug(
+    seed=None,
+    verbose=0,
+    fov_algorithm=DEFAULT_FOV_ALGORITHM,
+    max_turns=None,
+    max_seconds=None,
+):
     """
     Runs the game in a debug mode without the curses interface.
     This allows for printing game state and messages directly to the console,
@@ -53,8 +63,9 @@ def main_debug(seed=None, verbose=0):
         ai_sleep_duration=0,
         seed=seed,
         verbose=verbose,
+        fov_algorithm=fov_algorithm,
     )
-    game.run()
+    game.run(max_turns=max_turns, max_seconds=max_seconds)
 
 
 if __name__ == "__main__":
@@ -71,6 +82,13 @@ if __name__ == "__main__":
         default=0.5,
         help="Delay in seconds between AI actions.",
     )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=None,
+        help="Let the AI play at full speed, rendering at most this many "
+        "frames per second (replaces --ai_sleep).",
+    )
     parser.add_argument(
         "--seed",
         type=int,
@@ -84,10 +102,34 @@ if __name__ == "__main__":
         default=0,
         help="Increase verbosity of debug output.",
     )
+    parser.add_argument(
+        "--fov",
+        choices=sorted(FOV_ALGORITHMS),
+        default=DEFAULT_FOV_ALGORITHM,
+        help="Field-of-view algorithm.",
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=None,
+        help="End the game after this many turns.",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="End the game after this many seconds (debug mode default: 30).",
+    )
     args = parser.parse_args()
 
     if args.debug:
-        main_debug(seed=args.seed, verbose=args.verbose)
+        main_debug(
+            seed=args.seed,
+            verbose=args.verbose,
+            fov_algorithm=args.fov,
+            max_turns=args.max_turns,
+            max_seconds=args.max_seconds,
+        )
     else:
         # Initialize and run the game with the curses interface.
         # Larger map for the actual game.
@@ -98,9 +140,11 @@ if __name__ == "__main__":
             ai_active=args.ai,
             ai_sleep_duration=args.ai_sleep,
             seed=args.seed,
+            fov_algorithm=args.fov,
+            target_fps=args.fps,
         )
         try:
-            game.run()
+            game.run(max_turns=args.max_turns, max_seconds=args.max_seconds)
         except Exception as e:
             # This is a top-level catch-all for unexpected errors during game.run().
             # GameEngine.run() has its own finally block for curses cleanup,
@@ -0,0 +1,397 @@
+"""
+Cluster graph: the abstraction layer for HPA* pathfinding on one floor.
+
+A* on a large floor spends most of its time expanding open areas tile by
+tile. ClusterGraph follows HPA* (Botea, Mueller and Schaeffer, 2004): the
+floor is split into square clusters, and wherever two neighbouring clusters
+touch through a run of open tiles, one or two "entrances" (pairs of adjacent
+tiles, one on each side) are placed on that run. The distances between the
+entrances of a cluster, found by a search restricted to the cluster, are the
+edges of a small abstract graph.
+
+A query inserts the start and goal into their clusters, runs A* over the
+entrances only, and then expands each abstract edge into tiles. Expanded
+intra-cluster segments are kept, so repeated queries across the same
+clusters mostly just look them up.
+
+The graph follows the map's terrain log (WorldMap.terrain_changes_since): a
+set_tile_type change rebuilds only the cluster containing the tile, and its
+neighbours if the entrances on their shared border moved. Any change the log
+cannot replay rebuilds everything.
+
+Paths are at most a few steps longer than A*'s (they pass through
+entrances), but a goal is reachable exactly when A* can reach it.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS, _wall_lookup
+from src.world_map import WorldMap
+
+# Border runs of open tiles shorter than this get one entrance in their
+# middle; longer runs get one at each end.
+MAX_SINGLE_ENTRANCE_RUN = 6
+
+
+@dataclass
+class _Cluster:
+    """The entrances of one cluster and how they connect."""
+
+    # Entrance tile -> [(other entrance tile, steps within the cluster)]
+    edges: Dict[int, List[Tuple[int, int]]]
+    # Entrance tile -> tiles across the border it leads to
+    crossings: Dict[int, List[int]]
+    # (from, to) -> tiles after `from` up to `to`, filled in by queries
+    segments: Dict[Tuple[int, int], List[int]] = field(default_factory=dict)
+
+
+class ClusterGraph:
+    """
+    HPA*-style abstraction of one floor for fast single-floor pathfinding.
+
+    Walkability follows PathFinder.a_star_search: every tile that is not a
+    wall can be walked, monsters are ignored, and only the goal may be a wall
+    tile (the caller decides whether that is allowed). Tiles are numbered
+    ``y * width + x`` internally.
+
+    Args:
+        world_map: The floor to search. It is read on every query, so it may
+                   be edited in place.
+        cluster_size: The side length of a cluster in tiles.
+    """
+
+    def __init__(self, world_map: WorldMap, cluster_size: int = 16):
+        self.world_map = world_map
+        self.cluster_size = cluster_size
+        self.width = world_map.width
+        self.height = world_map.height
+        self.columns = -(-self.width // cluster_size)
+        self.rows = -(-self.height // cluster_size)
+        # Map version the graph was last brought up to date with
+        self._version: Optional[int] = None
+        self._walkable = bytearray()
+        # (cluster, east or south neighbour) -> [(tile, neighbour tile)]
+        self._borders: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._clusters: Dict[int, _Cluster] = {}
+
+    def find_path(
+        self, start_pos_xy: Tuple[int, int], goal_pos_xy: Tuple[int, int]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Finds a path from start to goal through the cluster graph.
+
+        Args:
+            start_pos_xy: The starting (x, y) coordinates, within the map.
+            goal_pos_xy: The target (x, y) coordinates, within the map.
+
+        Returns:
+            A list of (x, y) tuples from start to goal (inclusive), or None if
+            the goal cannot be reached.
+        """
+        self.update()
+        if start_pos_xy == goal_pos_xy:
+            return [start_pos_xy]
+        width = self.width
+        start = start_pos_xy[1] * width + start_pos_xy[0]
+        goal = goal_pos_xy[1] * width + goal_pos_xy[0]
+        start_cluster = self._cluster_of(start)
+        goal_cluster = self._cluster_of(goal)
+
+        start_targets = set(self._clusters[start_cluster].edges)
+        if start_cluster == goal_cluster:
+            start_targets.add(goal)
+        start_distances, start_parents = self._search_cluster(
+            start_cluster, start, start_targets, stop_at=goal
+        )
+        goal_targets = set(self._clusters[goal_cluster].edges)
+        goal_distances, goal_parents = self._search_cluster(
+            goal_cluster, goal, goal_targets
+        )
+
+        route = self._route(
+            start,
+            goal,
+            {
+                tile: start_distances[tile]
+                for tile in start_targets & start_distances.keys()
+            },
+            {
+                tile: goal_distances[tile]
+                for tile in goal_targets & goal_distances.keys()
+            },
+        )
+        if route is None:
+            return None
+
+        path = [start]
+        for current, following in zip(route, route[1:]):
+            if self._cluster_of(current) != self._cluster_of(following):
+                path.append(following)  # Crossing a border
+            elif current == start:
+                path.extend(_walk_back(start_parents, following, start)[::-1])
+            elif following == goal:
+                path.extend(_walk_back(goal_parents, current, goal)[1:] + [goal])
+            else:
+                path.extend(self._segment(current, following))
+        return [(index % width, index // width) for index in path]
+
+    def update(self) -> None:
+        """Brings the graph up to date with the map's terrain."""
+        world_map = self.world_map
+        if self._version == world_map.version:
+            return
+        changes = (
+            None
+            if self._version is None
+            else world_map.terrain_changes_since(self._version)
+        )
+        if changes is None:
+            self._rebuild()
+        else:
+            self._apply_changes(changes)
+        self._version = world_map.version
+
+    def entrances(self, cluster_id: int) -> Tuple[Tuple[int, int], ...]:
+        """Returns the (x, y) entrance tiles of a cluster, row-major."""
+        self.update()
+        return tuple(
+            (index % self.width, index // self.width)
+            for index in sorted(self._clusters[cluster_id].edges)
+        )
+
+    def _rebuild(self) -> None:
+        is_wall = _wall_lookup(self.world_map, self.width, self.height)
+        self._walkable = bytearray(
+            0 if is_wall(x, y) else 1
+            for y in range(self.height)
+            for x in range(self.width)
+        )
+        self._borders = {}
+        for cluster_id in range(self.columns * self.rows):
+            for border in self._border_keys(cluster_id):
+                if border[0] == cluster_id:
+                    self._borders[border] = self._scan_border(*border)
+        self._clusters = {
+            cluster_id: self._build_cluster(cluster_id)
+            for cluster_id in range(self.columns * self.rows)
+        }
+
+    def _apply_changes(self, changes: List[Tuple[int, int]]) -> None:
+        """Rebuilds the clusters whose tiles, or border entrances, changed."""
+        is_wall = _wall_lookup(self.world_map, self.width, self.height)
+        dirty: Set[int] = set()
+        for x, y in changes:
+            index = y * self.width + x
+            walkable = 0 if is_wall(x, y) else 1
+            if self._walkable[index] != walkable:
+                self._walkable[index] = walkable
+                dirty.add(self._cluster_of(index))
+
+        rebuild = set(dirty)
+        for cluster_id in dirty:
+            for border in self._border_keys(cluster_id):
+                transitions = self._scan_border(*border)
+                if transitions != self._borders[border]:
+                    self._borders[border] = transitions
+                    rebuild.update(border)
+        for cluster_id in rebuild:
+            self._clusters[cluster_id] = self._build_cluster(cluster_id)
+
+    def _border_keys(self, cluster_id: int) -> List[Tuple[int, int]]:
+        """The borders of a cluster, as (cluster, east or south neighbour)."""
+        column = cluster_id % self.columns
+        row = cluster_id // self.columns
+        keys = []
+        if column > 0:
+            keys.append((cluster_id - 1, cluster_id))
+        if row > 0:
+            keys.append((cluster_id - self.columns, cluster_id))
+        if column + 1 < self.columns:
+            keys.append((cluster_id, cluster_id + 1))
+        if row + 1 < self.rows:
+            keys.append((cluster_id, cluster_id + self.columns))
+        return keys
+
+    def _scan_border(self, cluster_id: int, neighbour_id: int) -> List[Tuple[int, int]]:
+        """Places the entrances on the border between two clusters."""
+        size = self.cluster_size
+        width = self.width
+        column = cluster_id % self.columns
+        row = cluster_id // self.columns
+        if neighbour_id == cluster_id + self.columns:
+            y = (row + 1) * size - 1
+            pairs = [
+                (y * width + x, (y + 1) * width + x)
+                for x in range(column * size, min((column + 1) * size, width))
+            ]
+        else:
+            x = (column + 1) * size - 1
+            pairs = [
+                (y * width + x, y * width + x + 1)
+                for y in range(row * size, min((row + 1) * size, self.height))
+            ]
+
+        walkable = self._walkable
+        transitions: List[Tuple[int, int]] = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [(-1, -1)]:
+            if pair[0] >= 0 and walkable[pair[0]] and walkable[pair[1]]:
+                run.append(pair)
+                continue
+            if len(run) >= MAX_SINGLE_ENTRANCE_RUN:
+                transitions.extend((run[0], run[-1]))
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    def _build_cluster(self, cluster_id: int) -> _Cluster:
+        crossings: Dict[int, List[int]] = {}
+        for border in self._border_keys(cluster_id):
+            for tile, neighbour_tile in self._borders[border]:
+                if border[0] != cluster_id:
+                    tile, neighbour_tile = neighbour_tile, tile
+                crossings.setdefault(tile, []).append(neighbour_tile)
+
+        entrances = sorted(crossings)
+        edges: Dict[int, List[Tuple[int, int]]] = {tile: [] for tile in entrances}
+        for position, entrance in enumerate(entrances):
+            others = set(entrances[position + 1 :])
+            if not others:
+                break
+            distances, _ = self._search_cluster(cluster_id, entrance, others)
+            for other in entrances[position + 1 :]:
+                if other in distances:
+                    edges[entrance].append((other, distances[other]))
+                    edges[other].append((entrance, distances[other]))
+        return _Cluster(edges, crossings)
+
+    def _route(
+        self,
+        start: int,
+        goal: int,
+        start_edges: Dict[int, int],
+        goal_edges: Dict[int, int],
+    ) -> Optional[List[int]]:
+        """
+        A* over the start, the goal and the entrances. start_edges and
+        goal_edges give the steps from the start to the entrances of its
+        cluster, and from the entrances of the goal's cluster to the goal.
+        """
+        width = self.width
+        goal_x, goal_y = goal % width, goal // width
+
+        def heuristic(tile: int) -> int:
+            return abs(tile % width - goal_x) + abs(tile // width - goal_y)
+
+        costs: Dict[int, int] = {start: 0}
+        parents: Dict[int, int] = {start: start}
+        heap: List[Tuple[int, int]] = [(heuristic(start), start)]
+        while heap:
+            estimate, node = heapq.heappop(heap)
+            cost = costs[node]
+            if estimate > cost + heuristic(node):
+                continue  # Stale entry
+            if node == goal:
+                route = [node]
+                while parents[route[-1]] != route[-1]:
+                    route.append(parents[route[-1]])
+                route.reverse()
+                return route
+
+            neighbours: List[Tuple[int, int]] = []
+            if node == start:
+                neighbours.extend(start_edges.items())
+            cluster = self._clusters[self._cluster_of(node)]
+            if node in cluster.edges:
+                neighbours.extend(cluster.edges[node])
+                neighbours.extend((tile, 1) for tile in cluster.crossings[node])
+            if node in goal_edges:
+                neighbours.append((goal, goal_edges[node]))
+
+            for neighbour, step_cost in neighbours:
+                new_cost = cost + step_cost
+                if new_cost < costs.get(neighbour, new_cost + 1):
+                    costs[neighbour] = new_cost
+                    parents[neighbour] = node
+                    heapq.heappush(heap, (new_cost + heuristic(neighbour), neighbour))
+        return None
+
+    def _segment(self, current: int, following: int) -> List[int]:
+        """Tiles after current up to following, two entrances of a cluster."""
+        cluster = self._clusters[self._cluster_of(current)]
+        segment = cluster.segments.get((current, following))
+        if segment is None:
+            _, parents = self._search_cluster(
+                self._cluster_of(current), current, {following}
+            )
+            segment = _walk_back(parents, following, current)[::-1]
+            cluster.segments[(current, following)] = segment
+        return segment
+
+    def _search_cluster(
+        self,
+        cluster_id: int,
+        source: int,
+        targets: Set[int],
+        stop_at: Optional[int] = None,
+    ) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """
+        Breadth-first search from source that stays inside the cluster.
+
+        The source is expanded even if it is a wall. stop_at may be entered
+        even if it is a wall, but is not expanded (the goal of a query).
+        Stops once every target is found.
+
+        Returns:
+            (distances, parents) of the tiles reached.
+        """
+        size = self.cluster_size
+        width = self.width
+        column = cluster_id % self.columns
+        row = cluster_id // self.columns
+        min_x, max_x = column * size, min((column + 1) * size, width)
+        min_y, max_y = row * size, min((row + 1) * size, self.height)
+        walkable = self._walkable
+
+        distances = {source: 0}
+        parents = {source: source}
+        remaining = len(targets - {source})
+        queue = deque([source])
+        while queue and remaining:
+            tile = queue.popleft()
+            if tile == stop_at and tile != source:
+                continue
+            x, y = tile % width, tile // width
+            distance = distances[tile] + 1
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (min_x <= nx < max_x and min_y <= ny < max_y):
+                    continue
+                neighbour = ny * width + nx
+                if neighbour in distances:
+                    continue
+                if not walkable[neighbour] and neighbour != stop_at:
+                    continue
+                distances[neighbour] = distance
+                parents[neighbour] = tile
+                queue.append(neighbour)
+                if neighbour in targets:
+                    remaining -= 1
+        return distances, parents
+
+    def _cluster_of(self, tile: int) -> int:
+        y, x = divmod(tile, self.width)
+        return (y // self.cluster_size) * self.columns + x // self.cluster_size
+
+
+def _walk_back(parents: Dict[int, int], tile: int, root: int) -> List[int]:
+    """Tiles from tile back to (excluding) root along parent pointers."""
+    tiles = []
+    while tile != root:
+        tiles.append(tile)
+        tile = parents[tile]
+    return tiles
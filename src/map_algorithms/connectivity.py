@@ -1,6 +1,7 @@
 from collections import deque
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
+from src.array_world_map import ArrayWorldMap
 from src.map_algorithms.pathfinding import PathFinder
 from src.world_map import WorldMap
 
@@ -8,6 +9,42 @@ if TYPE_CHECKING:
     from random import Random
 
 
+def _interior_floor_mask(
+    world_map: WorldMap, map_width: int, map_height: int
+) -> Optional[bytearray]:
+    """
+    The cells the searches below may enter (interior floor tiles) as a mask,
+    if world_map is an ArrayWorldMap searched over its full size; else None.
+    """
+    if type(world_map) is ArrayWorldMap and (map_width, map_height) == (
+        world_map.width,
+        world_map.height,
+    ):
+        return world_map.type_mask("floor", interior=True)
+    return None
+
+
+def _breadth_first_order(
+    walkable: bytearray, width: int, starts: List[int]
+) -> List[int]:
+    """
+    Cells reached from starts through walkable cells, in the order a
+    breadth-first search with the neighbour order N, S, E, W visits them.
+    Starts must be interior cells; walkable must be clear on the border.
+    """
+    seen = bytearray(len(walkable))
+    for start in starts:
+        seen[start] = 1
+    order = list(starts)
+    # Iterating a list while appending to it is a FIFO queue
+    for index in order:
+        for neighbour in (index - width, index + width, index + 1, index - 1):
+            if walkable[neighbour] and not seen[neighbour]:
+                seen[neighbour] = 1
+                order.append(neighbour)
+    return order
+
+
 class MapConnectivityManager:
     def __init__(self, random_generator: "Random"):
         self.random = random_generator
@@ -24,6 +61,22 @@ class MapConnectivityManager:
         if start_node in visited_overall:
             return component_nodes
 
+        walkable = _interior_floor_mask(world_map, map_width, map_height)
+        if (
+            walkable is not None
+            and 1 <= start_node[0] < map_width - 1
+            and 1 <= start_node[1] < map_height - 1
+        ):
+            # Built in visiting order, so the set iterates like the one below
+            component_nodes = {
+                (index % map_width, index // map_width)
+                for index in _breadth_first_order(
+                    walkable, map_width, [start_node[1] * map_width + start_node[0]]
+                )
+            }
+            visited_overall.update(component_nodes)
+            return component_nodes
+
         queue: deque[tuple[int, int]] = deque([start_node])
         component_visited_this_bfs = {start_node}
 
@@ -64,11 +117,15 @@ class MapConnectivityManager:
             main_component_nodes.add(player_start_pos)
 
         all_floor_tiles_coords = []
-        for y_coord in range(1, map_height - 1):
-            for x_coord in range(1, map_width - 1):
-                tile = world_map.get_tile(x_coord, y_coord)
-                if tile and tile.type == "floor":
-                    all_floor_tiles_coords.append((x_coord, y_coord))
+        floor_mask = _interior_floor_mask(world_map, map_width, map_height)
+        if floor_mask is not None and isinstance(world_map, ArrayWorldMap):
+            all_floor_tiles_coords = world_map.coords_in(floor_mask)
+        else:
+            for y_coord in range(1, map_height - 1):
+                for x_coord in range(1, map_width - 1):
+                    tile = world_map.get_tile(x_coord, y_coord)
+                    if tile and tile.type == "floor":
+                        all_floor_tiles_coords.append((x_coord, y_coord))
         self.random.shuffle(all_floor_tiles_coords)
 
         for x_coord, y_coord in all_floor_tiles_coords:
@@ -155,6 +212,23 @@ class MapConnectivityManager:
         map_width: int,
         map_height: int,
     ) -> Set[tuple[int, int]]:
+        walkable = _interior_floor_mask(world_map, map_width, map_height)
+        if walkable is not None:
+            starts: List[int] = []
+            for x, y in start_nodes:
+                index = y * map_width + x
+                if (
+                    1 <= x < map_width - 1
+                    and 1 <= y < map_height - 1
+                    and walkable[index]
+                    and index not in starts
+                ):
+                    starts.append(index)
+            return {
+                (index % map_width, index // map_width)
+                for index in _breadth_first_order(walkable, map_width, starts)
+            }
+
         reachable_tiles: set[tuple[int, int]] = set()
         queue: deque[tuple[int, int]] = deque()
         visited: set[tuple[int, int]] = set()
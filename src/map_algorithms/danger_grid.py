@@ -0,0 +1,109 @@
+"""
+Danger grids: the cost of standing next to known monsters, per tile.
+
+find_path_risk_aware and the AI's flee logic both want to know how risky a
+tile is. Checking a tile's four neighbours for monsters on every visit costs
+four map lookups; a DangerGrid keeps the answer for every tile of a floor in
+one array instead. It is synced from the floor's monster index, and when
+monsters move only the tiles around their old and new positions are redone.
+"""
+
+from array import array
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS
+from src.monster import Monster
+from src.world_map import WorldMap
+
+
+class DangerGrid:
+    """
+    Danger of every tile of one floor.
+
+    A tile's danger is the largest weight among the monsters on its four
+    neighbours, or 0 if there are none. A monster's own tile is not counted
+    unless another monster stands next to it.
+
+    Args:
+        width: Width of the floor.
+        height: Height of the floor.
+    """
+
+    __slots__ = ("width", "height", "costs", "_monsters")
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        # Danger of tile (x, y) at y * width + x
+        self.costs = array("d", [0.0]) * (width * height)
+        self._monsters: Dict[Tuple[int, int], float] = {}
+
+    @classmethod
+    def from_world_map(
+        cls,
+        world_map: WorldMap,
+        weigh: Optional[Callable[[Monster], float]] = None,
+    ) -> "DangerGrid":
+        """Builds the grid of a floor; see sync."""
+        grid = cls(world_map.width, world_map.height)
+        grid.sync(world_map, weigh)
+        return grid
+
+    def sync(
+        self,
+        world_map: WorldMap,
+        weigh: Optional[Callable[[Monster], float]] = None,
+    ) -> None:
+        """
+        Updates the grid to the monsters currently on world_map.
+
+        Args:
+            world_map: The floor the grid covers.
+            weigh: Weight of a monster; every monster weighs 1 if omitted.
+        """
+        self.set_monsters(
+            {
+                (x, y): weigh(monster) if weigh else 1.0
+                for x, y, monster in world_map.get_monsters_with_positions()
+            }
+        )
+
+    def set_monsters(self, monsters: Dict[Tuple[int, int], float]) -> None:
+        """
+        Replaces the known monsters, recomputing only the tiles next to
+        monsters that appeared, left or changed weight.
+
+        Args:
+            monsters: Weight of the monster at each (x, y).
+        """
+        old = self._monsters
+        if monsters == old:
+            return
+        changed = [
+            position
+            for position in old.keys() | monsters.keys()
+            if old.get(position) != monsters.get(position)
+        ]
+        self._monsters = dict(monsters)
+
+        stale: Set[Tuple[int, int]] = set()
+        for x, y in changed:
+            for dx, dy in NEIGHBOR_OFFSETS:
+                stale.add((x + dx, y + dy))
+        for x, y in stale:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.costs[y * self.width + x] = self._danger_from_neighbours(x, y)
+
+    def danger(self, x: int, y: int) -> float:
+        """Returns the danger of (x, y), 0 outside the floor."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.costs[y * self.width + x]
+        return 0.0
+
+    def _danger_from_neighbours(self, x: int, y: int) -> float:
+        danger = 0.0
+        for dx, dy in NEIGHBOR_OFFSETS:
+            weight = self._monsters.get((x + dx, y + dy))
+            if weight is not None and weight > danger:
+                danger = weight
+        return danger
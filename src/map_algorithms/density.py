@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
+from src.array_world_map import ArrayWorldMap
 from src.map_algorithms.connectivity import MapConnectivityManager
 from src.map_algorithms.pathfinding import PathFinder
 from src.world_map import WorldMap
@@ -52,55 +53,13 @@ class FloorDensityAdjuster:
 
         target_floor_tiles = int(total_placeable_tiles * target_floor_portion)
 
-        current_floor_tiles: List[Tuple[int, int]] = []
-        for r_y in range(1, height - 1):
-            for r_x in range(1, width - 1):
-                coord = (r_x, r_y)
-                tile = world_map.get_tile(r_x, r_y)
-                if tile and tile.type == "floor":
-                    current_floor_tiles.append(coord)
-
-        num_current_floor = len(current_floor_tiles)
-
-        def is_adjacent_to_floor_tile(x: int, y: int, current_map: WorldMap) -> bool:
-            for dx_offset, dy_offset in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                adj_x, adj_y = x + dx_offset, y + dy_offset
-                if not (0 <= adj_x < width and 0 <= adj_y < height):
-                    continue
-                adj_tile = current_map.get_tile(adj_x, adj_y)
-                if adj_tile and adj_tile.type == "floor":
-                    return True
-            return False
-
-        candidate_walls_to_floor: List[Tuple[int, int]] = []
-        if num_current_floor < target_floor_tiles:
-            for r_y in range(1, height - 1):
-                for r_x in range(1, width - 1):
-                    coord = (r_x, r_y)
-                    if coord in effective_protected_coords:
-                        continue
-                    tile = world_map.get_tile(r_x, r_y)
-                    if tile and tile.type == "wall":
-                        is_adjacent_to_floor = is_adjacent_to_floor_tile(
-                            r_x, r_y, world_map
-                        )
-                        if is_adjacent_to_floor:
-                            # Store without adjacent_floor_count for now,
-                            # can be added if needed for sorting.
-                            candidate_walls_to_floor.append((r_x, r_y))
+        num_current_floor = self._count_floor_tiles(world_map, width, height)
 
         if num_current_floor < target_floor_tiles:
             while num_current_floor < target_floor_tiles:
-                walls_to_add = []
-                for r_y in range(1, height - 1):
-                    for r_x in range(1, width - 1):
-                        coord = (r_x, r_y)
-                        if coord in effective_protected_coords:
-                            continue
-                        tile = world_map.get_tile(r_x, r_y)
-                        if tile and tile.type == "wall":
-                            if is_adjacent_to_floor_tile(r_x, r_y, world_map):
-                                walls_to_add.append(coord)
+                walls_to_add = self._walls_next_to_floor(
+                    world_map, width, height, effective_protected_coords
+                )
 
                 if not walls_to_add:
                     break  # No more walls can be converted
@@ -170,3 +129,64 @@ class FloorDensityAdjuster:
                     converted_count += 1
                 else:
                     world_map.set_tile_type(c_x, c_y, original_type)  # type: ignore
+
+    @staticmethod
+    def _count_floor_tiles(world_map: WorldMap, width: int, height: int) -> int:
+        """Counts the floor tiles inside the border."""
+        if type(world_map) is ArrayWorldMap and (width, height) == (
+            world_map.width,
+            world_map.height,
+        ):
+            return world_map.type_mask("floor", interior=True).count(1)
+        return sum(
+            1
+            for r_y in range(1, height - 1)
+            for r_x in range(1, width - 1)
+            if (tile := world_map.get_tile(r_x, r_y)) and tile.type == "floor"
+        )
+
+    @staticmethod
+    def _walls_next_to_floor(
+        world_map: WorldMap,
+        width: int,
+        height: int,
+        protected_coords: Set[Tuple[int, int]],
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns the unprotected wall tiles inside the border that have a floor
+        tile N, S, W or E of them, in row-major order.
+        """
+        if type(world_map) is ArrayWorldMap and (width, height) == (
+            world_map.width,
+            world_map.height,
+        ):
+            # One byte per cell: shifting the floor mask by 8 bits moves it one
+            # cell, by 8 * width one row. Interior cells' neighbours never wrap.
+            floor = int.from_bytes(world_map.type_mask("floor"), "little")
+            row = 8 * width
+            near_floor = (floor << 8) | (floor >> 8) | (floor << row) | (floor >> row)
+            allowed = world_map.type_mask("wall", interior=True)
+            for x, y in protected_coords:
+                if 0 <= x < width and 0 <= y < height:
+                    allowed[y * width + x] = 0
+            candidates = near_floor & int.from_bytes(allowed, "little")
+            return world_map.coords_in(candidates.to_bytes(len(allowed), "little"))
+
+        def is_floor(x: int, y: int) -> bool:
+            tile = world_map.get_tile(x, y)
+            return tile is not None and tile.type == "floor"
+
+        walls = []
+        for r_y in range(1, height - 1):
+            for r_x in range(1, width - 1):
+                coord = (r_x, r_y)
+                if coord in protected_coords:
+                    continue
+                tile = world_map.get_tile(r_x, r_y)
+                if tile and tile.type == "wall":
+                    if any(
+                        is_floor(r_x + dx, r_y + dy)
+                        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]
+                    ):
+                        walls.append(coord)
+        return walls
@@ -0,0 +1,315 @@
+"""
+Distance fields ("Dijkstra maps") over a single floor.
+
+A DistanceField stores, for every tile of a WorldMap, the number of steps to
+the nearest of one or more sources. Once built, "which way is downhill from
+here?" is a look at four neighbours, so any number of entities heading for the
+same target can share one field instead of each running its own search.
+
+DistanceFieldCache keeps recently built fields keyed by map, map version and
+sources, so a field is built at most once per map change and source set.
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.array_world_map import WALL_CODE, ArrayWorldMap
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS
+from src.world_map import WorldMap
+
+# Distance stored for tiles no source can reach.
+UNREACHABLE = 2**31 - 1
+
+# Safety fields count in tenths of a step, so the coefficient survives the
+# rounding to integers even next to a threat.
+SAFETY_SCALE = 10
+
+
+class DistanceField:
+    """
+    Steps from every tile to the nearest source, over non-wall tiles.
+
+    Walkability matches WorldMap.is_valid_move: anything but a "wall" tile
+    (unless it is also a portal) can be walked; monsters do not block.
+
+    Args:
+        world_map: The floor to measure.
+        seeds: Mapping of source (x, y) to its starting value. Plain sources
+               start at 0; other values let callers build derived maps (see
+               safety_field). Out-of-bounds and wall sources are ignored.
+        walkable: Optional precomputed walkable_mask(world_map).
+        step_cost: Value added per step; seeds are in the same unit.
+    """
+
+    __slots__ = ("width", "height", "distances", "version")
+
+    def __init__(
+        self,
+        world_map: WorldMap,
+        seeds: Dict[Tuple[int, int], int],
+        walkable: Optional[bytearray] = None,
+        step_cost: int = 1,
+    ):
+        self.width = world_map.width
+        self.height = world_map.height
+        self.version = world_map.version
+        self.distances = array("i", [UNREACHABLE]) * (self.width * self.height)
+        if walkable is None:
+            walkable = walkable_mask(world_map)
+
+        valid_seeds = [
+            (value, y * self.width + x)
+            for (x, y), value in seeds.items()
+            if 0 <= x < self.width
+            and 0 <= y < self.height
+            and walkable[y * self.width + x]
+        ]
+        if valid_seeds and all(value == 0 for value, _ in valid_seeds):
+            self._bfs([index for _, index in valid_seeds], walkable, step_cost)
+        else:
+            self._dijkstra(valid_seeds, walkable, step_cost)
+
+    @classmethod
+    def from_sources(
+        cls,
+        world_map: WorldMap,
+        sources: Iterable[Tuple[int, int]],
+        walkable: Optional[bytearray] = None,
+    ) -> "DistanceField":
+        """Builds a plain distance field from one or more (x, y) sources."""
+        return cls(world_map, {source: 0 for source in sources}, walkable)
+
+    def _bfs(
+        self, start_indices: List[int], walkable: bytearray, step_cost: int
+    ) -> None:
+        width, height, distances = self.width, self.height, self.distances
+        queue = deque(start_indices)
+        for index in start_indices:
+            distances[index] = 0
+        while queue:
+            index = queue.popleft()
+            next_distance = distances[index] + step_cost
+            y, x = divmod(index, width)
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbor = ny * width + nx
+                    if walkable[neighbor] and distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = next_distance
+                        queue.append(neighbor)
+
+    def _dijkstra(
+        self, seeds: List[Tuple[int, int]], walkable: bytearray, step_cost: int
+    ) -> None:
+        width, height, distances = self.width, self.height, self.distances
+        heap = list(seeds)
+        heapq.heapify(heap)
+        for value, index in seeds:
+            distances[index] = min(distances[index], value)
+        while heap:
+            value, index = heapq.heappop(heap)
+            if value > distances[index]:
+                continue  # Stale entry
+            y, x = divmod(index, width)
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbor = ny * width + nx
+                    next_value = value + step_cost
+                    if walkable[neighbor] and next_value < distances[neighbor]:
+                        distances[neighbor] = next_value
+                        heapq.heappush(heap, (next_value, neighbor))
+
+    def distance(self, x: int, y: int) -> Optional[int]:
+        """Returns the field value at (x, y), or None if unreachable."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        value = self.distances[y * self.width + x]
+        return None if value == UNREACHABLE else value
+
+    def next_step(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns the neighbour of (x, y) with the lowest value, if it is lower
+        than the value at (x, y). Ties go to the first in N, S, W, E order.
+
+        Works from any tile, including walls and tiles the field cannot
+        reach, as long as a neighbour is downhill.
+        """
+        width, height, distances = self.width, self.height, self.distances
+        if 0 <= x < width and 0 <= y < height:
+            best_value = distances[y * width + x]
+        else:
+            best_value = UNREACHABLE
+        best_step = None
+        for dx, dy in NEIGHBOR_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                value = distances[ny * width + nx]
+                if value < best_value:
+                    best_value = value
+                    best_step = (nx, ny)
+        return best_step
+
+    def path_from(self, x: int, y: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Follows next_step from (x, y) to a local minimum (a source, for plain
+        fields). Returns the (x, y) path including both ends, or None if
+        (x, y) is unreachable.
+        """
+        if self.distance(x, y) is None:
+            return None
+        path = [(x, y)]
+        step = self.next_step(x, y)
+        while step is not None:
+            path.append(step)
+            step = self.next_step(*step)
+        return path
+
+
+def safety_field(
+    world_map: WorldMap,
+    threats: Iterable[Tuple[int, int]],
+    coefficient: float = -1.2,
+    walkable: Optional[bytearray] = None,
+) -> DistanceField:
+    """
+    Builds a "safety map" for fleeing from threats.
+
+    The distance field from the threats is scaled by a negative coefficient and
+    re-relaxed, so walking downhill leads away from the threats while
+    preferring open ground over dead ends, rather than simply maximizing
+    distance. A coefficient below -1 makes it worth passing a threat to reach
+    a much safer area.
+
+    Values are in tenths of a step (SAFETY_SCALE), so dividing one by
+    SAFETY_SCALE * coefficient gives back roughly the distance to the
+    threats.
+
+    Args:
+        world_map: The floor to measure.
+        threats: (x, y) positions to flee from.
+        coefficient: Multiplier applied to the threat distances.
+        walkable: Optional precomputed walkable_mask(world_map).
+
+    Returns:
+        A DistanceField to descend with next_step.
+    """
+    if walkable is None:
+        walkable = walkable_mask(world_map)
+    threat_field = DistanceField.from_sources(world_map, threats, walkable)
+    width = threat_field.width
+    seeds = {
+        (index % width, index // width): round(value * coefficient * SAFETY_SCALE)
+        for index, value in enumerate(threat_field.distances)
+        if value != UNREACHABLE
+    }
+    return DistanceField(world_map, seeds, walkable, SAFETY_SCALE)
+
+
+class DistanceFieldCache:
+    """
+    Small LRU cache of distance fields.
+
+    Fields are keyed by map identity, map version and the sorted sources, so a
+    field is rebuilt only when the terrain or the sources change. The walkable
+    mask of each map version is cached too, so a new source set only costs
+    the search itself.
+
+    Args:
+        max_entries: How many fields to keep before evicting the oldest.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._fields: "OrderedDict[tuple, Tuple[WorldMap, DistanceField]]" = (
+            OrderedDict()
+        )
+        self._masks: Dict[int, Tuple[WorldMap, int, bytearray]] = {}
+
+    def get(
+        self, world_map: WorldMap, sources: Iterable[Tuple[int, int]]
+    ) -> DistanceField:
+        """Returns the distance field to the given sources, building it once."""
+        source_key = tuple(sorted(set(sources)))
+        return self._get_or_build(
+            ("distance", id(world_map), world_map.version, source_key),
+            world_map,
+            lambda: DistanceField.from_sources(
+                world_map, source_key, self._walkable(world_map)
+            ),
+        )
+
+    def get_safety(
+        self,
+        world_map: WorldMap,
+        threats: Iterable[Tuple[int, int]],
+        coefficient: float = -1.2,
+    ) -> DistanceField:
+        """Returns the safety_field for the given threats, building it once."""
+        threat_key = tuple(sorted(set(threats)))
+        return self._get_or_build(
+            ("safety", id(world_map), world_map.version, threat_key, coefficient),
+            world_map,
+            lambda: safety_field(
+                world_map, threat_key, coefficient, self._walkable(world_map)
+            ),
+        )
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self._masks.clear()
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _get_or_build(self, key: tuple, world_map: WorldMap, build) -> DistanceField:
+        entry = self._fields.get(key)
+        # The map is kept alongside the field so its id() cannot be reused by
+        # a new map while the entry is alive.
+        if entry is not None and entry[0] is world_map:
+            self._fields.move_to_end(key)
+            return entry[1]
+        field = build()
+        self._fields[key] = (world_map, field)
+        if len(self._fields) > self.max_entries:
+            self._fields.popitem(last=False)
+        return field
+
+    def _walkable(self, world_map: WorldMap) -> bytearray:
+        entry = self._masks.get(id(world_map))
+        if (
+            entry is not None
+            and entry[0] is world_map
+            and entry[1] == world_map.version
+        ):
+            return entry[2]
+        mask = walkable_mask(world_map)
+        self._masks[id(world_map)] = (world_map, world_map.version, mask)
+        return mask
+
+
+def walkable_mask(world_map: WorldMap) -> bytearray:
+    """Returns a flat y * width + x mask (1/0) of tiles that can be walked."""
+    if type(world_map) is ArrayWorldMap:
+        portal_flags = world_map.portal_flags
+        return bytearray(
+            1 if code != WALL_CODE or portal_flags[index] else 0
+            for index, code in enumerate(world_map.tile_types)
+        )
+    if type(world_map) is WorldMap:
+        return bytearray(
+            1 if tile.type != "wall" or tile.is_portal else 0
+            for row in world_map.grid
+            for tile in row
+        )
+    mask = bytearray(world_map.width * world_map.height)
+    index = 0
+    for y in range(world_map.height):
+        for x in range(world_map.width):
+            tile = world_map.get_tile(x, y)
+            if tile and (tile.type != "wall" or tile.is_portal):
+                mask[index] = 1
+            index += 1
+    return mask
@@ -0,0 +1,261 @@
+"""
+Jump Point Search for 4-connected grids where every step costs 1.
+
+Across an open area there are many equally short paths between two tiles,
+and A* expands all of them. JPS searches only one canonical path of each
+such family, the "horizontal first" one: a path may turn from horizontal to
+vertical anywhere, but from vertical to horizontal only where a wall
+diagonally behind the turn made it necessary (a forced turn). Moving
+vertically, a path therefore runs straight until a wall, the goal or a
+forced turn; moving horizontally, it also stops where a vertical run would
+find one of those. These stopping tiles are the jump points, and A* only
+visits them.
+
+Where each straight run from a tile ends, and where its next jump point is,
+depend only on the walls, so they are precomputed per map version for all
+four directions (as in JPS+). A jump is then a table lookup plus a check
+whether the goal lies on the run.
+"""
+
+import heapq
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS, _wall_lookup
+from src.world_map import WorldMap
+
+# A search state: (x, y, dx, dy) of a jump point and the direction it was
+# reached in; (0, 0) for the start
+_State = Tuple[int, int, int, int]
+
+
+class JumpPointSearch:
+    """
+    Precomputed jump tables of one map, and the search over them.
+
+    Walkability follows PathFinder.a_star_search: every tile that is not a
+    wall can be walked and monsters are ignored. The goal must not be a wall
+    (the caller handles that case).
+
+    Args:
+        world_map: The map to search. Tables are rebuilt when its version
+                   changes.
+        width: Width of the searchable area.
+        height: Height of the searchable area.
+    """
+
+    def __init__(self, world_map: WorldMap, width: int, height: int):
+        self.world_map = world_map
+        self.width = width
+        self.height = height
+        self._version: Optional[int] = None
+        self._open = bytearray()
+        # Per direction (see NEIGHBOR_OFFSETS) and tile y * width + x: the
+        # open tiles straight ahead before a wall ...
+        self._runs: Dict[Tuple[int, int], array] = {}
+        # ... and the steps to the next jump point within that run, or 0
+        self._jumps: Dict[Tuple[int, int], array] = {}
+
+    def find_path(
+        self, start_pos_xy: Tuple[int, int], goal_pos_xy: Tuple[int, int]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Finds a shortest path from start to goal.
+
+        Args:
+            start_pos_xy: The starting (x, y) coordinates, within the area.
+            goal_pos_xy: The target (x, y) coordinates, an open tile within
+                         the area.
+
+        Returns:
+            A list of (x, y) tuples from start to goal (inclusive), or None if
+            the goal cannot be reached.
+        """
+        self.update()
+        if start_pos_xy == goal_pos_xy:
+            return [start_pos_xy]
+        goal_x, goal_y = goal_pos_xy
+        start: _State = (start_pos_xy[0], start_pos_xy[1], 0, 0)
+        # Entries are (f, -g, state): among equal f, the jump point furthest
+        # along is expanded first, which in open areas heads straight for
+        # the goal instead of widening the search front
+        open_heap: List[Tuple[int, int, _State]] = [
+            (abs(start[0] - goal_x) + abs(start[1] - goal_y), 0, start)
+        ]
+        came_from: Dict[_State, _State] = {}
+        g_score: Dict[_State, int] = {start: 0}
+        while open_heap:
+            _, neg_g, current = heapq.heappop(open_heap)
+            g = -neg_g
+            if g > g_score[current]:
+                continue  # Stale entry
+            x, y, dx, dy = current
+            if x == goal_x and y == goal_y:
+                jump_points = [(x, y)]
+                while current in came_from:
+                    current = came_from[current]
+                    jump_points.append((current[0], current[1]))
+                jump_points.reverse()
+                return _fill_straight_runs(jump_points)
+
+            for direction in self._successor_directions(x, y, dx, dy):
+                if direction[1] == 0:
+                    jump_point = self._jump_horizontal(x, y, direction, goal_pos_xy)
+                else:
+                    jump_point = self._jump_vertical(x, y, direction, goal_pos_xy)
+                if jump_point is None:
+                    continue
+                jx, jy = jump_point
+                tentative_g = g + abs(jx - x) + abs(jy - y)
+                state = (jx, jy, direction[0], direction[1])
+                if tentative_g < g_score.get(state, tentative_g + 1):
+                    g_score[state] = tentative_g
+                    came_from[state] = current
+                    heapq.heappush(
+                        open_heap,
+                        (
+                            tentative_g + abs(jx - goal_x) + abs(jy - goal_y),
+                            -tentative_g,
+                            state,
+                        ),
+                    )
+        return None  # No path found
+
+    def update(self) -> None:
+        """Rebuilds the jump tables if the map changed since they were built."""
+        if self._version == self.world_map.version:
+            return
+        width, height = self.width, self.height
+        is_wall = _wall_lookup(self.world_map, width, height)
+        self._open = is_open = bytearray(
+            0 if is_wall(x, y) else 1 for y in range(height) for x in range(width)
+        )
+
+        size = width * height
+        runs = {direction: array("i", [0]) * size for direction in NEIGHBOR_OFFSETS}
+        jumps = {direction: array("i", [0]) * size for direction in NEIGHBOR_OFFSETS}
+
+        # Vertical runs, swept so each tile's next tile is done first. A tile
+        # entered moving in dy is a jump point if a turn there is forced.
+        for dy in (-1, 1):
+            run, jump = runs[(0, dy)], jumps[(0, dy)]
+            rows = range(1, height) if dy == -1 else range(height - 2, -1, -1)
+            for y in rows:
+                for x in range(width):
+                    index = y * width + x
+                    ahead = index + dy * width
+                    if not is_open[ahead]:
+                        continue
+                    run[index] = run[ahead] + 1
+                    if self._forced_turn(x, y + dy, dy):
+                        jump[index] = 1
+                    elif jump[ahead]:
+                        jump[index] = jump[ahead] + 1
+
+        # Horizontal runs stop where a vertical run from the tile would
+        stops = bytearray(
+            1 if jumps[(0, -1)][index] or jumps[(0, 1)][index] else 0
+            for index in range(size)
+        )
+        for dx in (-1, 1):
+            run, jump = runs[(dx, 0)], jumps[(dx, 0)]
+            columns = range(1, width) if dx == -1 else range(width - 2, -1, -1)
+            for y in range(height):
+                row = y * width
+                for x in columns:
+                    index = row + x
+                    ahead = index + dx
+                    if not is_open[ahead]:
+                        continue
+                    run[index] = run[ahead] + 1
+                    if stops[ahead]:
+                        jump[index] = 1
+                    elif jump[ahead]:
+                        jump[index] = jump[ahead] + 1
+
+        self._runs, self._jumps = runs, jumps
+        self._version = self.world_map.version
+
+    def _successor_directions(
+        self, x: int, y: int, dx: int, dy: int
+    ) -> List[Tuple[int, int]]:
+        """The directions worth searching from a jump point reached in dx, dy."""
+        if dx == 0 and dy == 0:
+            return list(NEIGHBOR_OFFSETS)
+        if dy == 0:
+            return [(dx, 0), (0, -1), (0, 1)]
+        return [(0, dy)] + [
+            (side, 0) for side in (-1, 1) if self._turn_is_forced(x, y, dy, side)
+        ]
+
+    def _jump_vertical(
+        self, x: int, y: int, direction: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Optional[Tuple[int, int]]:
+        index = y * self.width + x
+        dy = direction[1]
+        steps = self._jumps[direction][index]
+        to_goal = (goal[1] - y) * dy
+        if (
+            goal[0] == x
+            and 0 < to_goal <= self._runs[direction][index]
+            and (not steps or to_goal <= steps)
+        ):
+            return goal
+        if steps:
+            return x, y + steps * dy
+        return None
+
+    def _jump_horizontal(
+        self, x: int, y: int, direction: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Optional[Tuple[int, int]]:
+        width = self.width
+        index = y * width + x
+        dx = direction[0]
+        steps = self._jumps[direction][index]
+        goal_x, goal_y = goal
+        to_goal_column = (goal_x - x) * dx
+        if 0 < to_goal_column <= self._runs[direction][index] and (
+            not steps or to_goal_column < steps
+        ):
+            # A vertical run from the goal's column may reach the goal
+            if goal_y == y:
+                return goal
+            dy = 1 if goal_y > y else -1
+            if abs(goal_y - y) <= self._runs[(0, dy)][y * width + goal_x]:
+                return goal_x, y
+        if steps:
+            return x + steps * dx, y
+        return None
+
+    def _forced_turn(self, x: int, y: int, dy: int) -> bool:
+        """Whether a vertical move in dy into (x, y) must turn either way."""
+        return self._turn_is_forced(x, y, dy, -1) or self._turn_is_forced(x, y, dy, 1)
+
+    def _turn_is_forced(self, x: int, y: int, dy: int, side: int) -> bool:
+        """
+        Whether a vertical move in dy into (x, y) must turn towards side: the
+        tile to that side is open, but the one diagonally behind is not, so
+        no horizontal-first path could have reached it.
+        """
+        return self._is_open(x + side, y) and not self._is_open(x + side, y - dy)
+
+    def _is_open(self, x: int, y: int) -> bool:
+        return (
+            0 <= x < self.width
+            and 0 <= y < self.height
+            and self._open[y * self.width + x] == 1
+        )
+
+
+def _fill_straight_runs(jump_points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Expands the straight runs between jump points into single steps."""
+    path = [jump_points[0]]
+    for x, y in jump_points[1:]:
+        last_x, last_y = path[-1]
+        step_x = (x > last_x) - (x < last_x)
+        step_y = (y > last_y) - (y < last_y)
+        for _ in range(abs(x - last_x) + abs(y - last_y)):
+            last_x += step_x
+            last_y += step_y
+            path.append((last_x, last_y))
+    return path
@@ -2,11 +2,13 @@
 Line of sight calculations for visibility and targeting.
 """
 
-from typing import TYPE_CHECKING, List, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Set, Tuple
 
 if TYPE_CHECKING:
     from src.world_map import WorldMap
 
+DEFAULT_FOV_ALGORITHM = "shadowcast"
+
 
 def get_line_tiles(x1: int, y1: int, x2: int, y2: int) -> List[Tuple[int, int]]:
     """
@@ -65,10 +67,122 @@ def calculate_visible_tiles(
     origin_x: int,
     origin_y: int,
     view_radius: int,
+    algorithm: str = DEFAULT_FOV_ALGORITHM,
 ) -> Set[Tuple[int, int]]:
     """
     Calculate all tiles visible from the origin point within view_radius.
-    Uses raycasting to check line of sight to each potential tile.
+
+    Walls are visible but block sight; tiles outside the map are never
+    visible. The origin is always visible.
+
+    Args:
+        world_map: The world map to check visibility on.
+        origin_x: X coordinate of the viewer.
+        origin_y: Y coordinate of the viewer.
+        view_radius: Maximum viewing distance.
+        algorithm: Name of the FOV algorithm (see FOV_ALGORITHMS):
+                   "shadowcast" (default) or "raycast".
+
+    Returns:
+        Set of (x, y) tuples that are visible from the origin.
+    """
+    fov = FOV_ALGORITHMS.get(algorithm)
+    if fov is None:
+        raise ValueError(
+            f"Unknown FOV algorithm {algorithm!r}; expected one of "
+            f"{', '.join(FOV_ALGORITHMS)}"
+        )
+    return fov(world_map, origin_x, origin_y, view_radius)
+
+
+def calculate_visible_tiles_shadowcast(
+    world_map: "WorldMap",
+    origin_x: int,
+    origin_y: int,
+    view_radius: int,
+) -> Set[Tuple[int, int]]:
+    """
+    Symmetric shadowcasting field of view.
+
+    Each quadrant is scanned row by row outwards from the origin, tracking
+    the visible slope range; a wall narrows the range for the rows behind it.
+    Every cell in the view square is visited at most once per quadrant, and
+    a floor tile is visible from A exactly when A is visible from it. Slopes
+    are kept as integer fractions so tie rounding is exact.
+
+    Args:
+        world_map: The world map to check visibility on.
+        origin_x: X coordinate of the viewer.
+        origin_y: Y coordinate of the viewer.
+        view_radius: Maximum viewing distance.
+
+    Returns:
+        Set of (x, y) tuples that are visible from the origin.
+    """
+    visible = {(origin_x, origin_y)}  # Origin is always visible
+    if view_radius <= 0:
+        return visible
+    is_wall = _sight_blocker(world_map)
+    width, height = world_map.width, world_map.height
+    radius_sq = view_radius * view_radius
+
+    # (depth, col) -> (x, y) for the four quadrants: north, south, east, west
+    for axis_x, axis_y, swap in (
+        (1, -1, False),
+        (1, 1, False),
+        (1, 1, True),
+        (-1, 1, True),
+    ):
+        # Rows to scan: (depth, start_num, start_den, end_num, end_den)
+        rows = [(1, -1, 1, 1, 1)]
+        while rows:
+            depth, start_num, start_den, end_num, end_den = rows.pop()
+            if depth > view_radius:
+                continue
+            # round_ties_up(depth * start) .. round_ties_down(depth * end)
+            min_col = (2 * depth * start_num + start_den) // (2 * start_den)
+            max_col = -((end_den - 2 * depth * end_num) // (2 * end_den))
+            prev_wall = None  # None before the first tile of the row
+            for col in range(min_col, max_col + 1):
+                if swap:
+                    x, y = origin_x + axis_x * depth, origin_y + col
+                else:
+                    x, y = origin_x + col, origin_y + axis_y * depth
+                in_bounds = 0 <= x < width and 0 <= y < height
+                wall = not in_bounds or is_wall(x, y)
+                if in_bounds and depth * depth + col * col <= radius_sq:
+                    # Walls are revealed whenever lit; floors only when the
+                    # centre lies within the visible slope range (symmetry).
+                    if wall or (
+                        col * start_den >= depth * start_num
+                        and col * end_den <= depth * end_num
+                    ):
+                        visible.add((x, y))
+                if prev_wall and not wall:
+                    # Leaving a wall: the rest of the row starts at its edge
+                    start_num, start_den = 2 * col - 1, 2 * depth
+                elif prev_wall is False and wall:
+                    # Entering a wall: scan behind the floor run so far
+                    rows.append(
+                        (depth + 1, start_num, start_den, 2 * col - 1, 2 * depth)
+                    )
+                prev_wall = wall
+            if prev_wall is False:
+                rows.append((depth + 1, start_num, start_den, end_num, end_den))
+
+    return visible
+
+
+def calculate_visible_tiles_raycast(
+    world_map: "WorldMap",
+    origin_x: int,
+    origin_y: int,
+    view_radius: int,
+) -> Set[Tuple[int, int]]:
+    """
+    Calculate all tiles visible from the origin point within view_radius.
+    Uses raycasting to check line of sight to each potential tile, which
+    costs O(r^3) per call; kept as the "raycast" algorithm.
 
     Args:
         world_map: The world map to check visibility on.
@@ -118,3 +232,32 @@ def calculate_visible_tiles(
                 visible.add((target_x, target_y))
 
     return visible
+
+
+FOV_ALGORITHMS: Dict[
+    str, Callable[["WorldMap", int, int, int], Set[Tuple[int, int]]]
+] = {
+    "shadowcast": calculate_visible_tiles_shadowcast,
+    "raycast": calculate_visible_tiles_raycast,
+}
+
+
+def _sight_blocker(world_map: "WorldMap") -> Callable[[int, int], bool]:
+    """Returns an is_wall(x, y) predicate for in-bounds coordinates."""
+    from src.array_world_map import WALL_CODE, ArrayWorldMap
+    from src.world_map import WorldMap
+
+    if type(world_map) is ArrayWorldMap:
+        tile_types, width = world_map.tile_types, world_map.width
+        return lambda x, y: tile_types[y * width + x] == WALL_CODE
+    if type(world_map) is WorldMap:
+        rows = world_map.grid
+        return lambda x, y: rows[y][x].type == "wall"
+
+    get_tile = world_map.get_tile
+
+    def is_wall(x: int, y: int) -> bool:
+        tile = get_tile(x, y)
+        return tile is None or tile.type == "wall"
+
+    return is_wall
@@ -1,16 +1,52 @@
 from collections import deque
-from typing import Dict, List, Optional, Tuple  # Added Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from src.array_world_map import WALL_CODE, ArrayWorldMap
 from src.world_map import WorldMap  # For type hinting
 
-# No random needed here unless we add path randomization features later
+if TYPE_CHECKING:
+    from src.map_algorithms.danger_grid import DangerGrid
+
+# Neighbour order used by every search here (N, S, W, E). A* tie-breaking,
+# and therefore which of several equally short paths is returned, depends on it.
+NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
 
 
 class PathFinder:
     """
     Provides pathfinding and path-carving functionalities on the map.
+
+    Args:
+        engine: Which implementation a_star_search uses. "astar" (default) is
+                the tuned search; "reference" is the original implementation,
+                kept for parity tests and benchmarks. Both return identical
+                paths. "hpa" searches a cached ClusterGraph of each map
+                (HPA*); it is much faster on large floors, but its paths may
+                be a few steps longer than the shortest. "jps" is Jump Point
+                Search for 4-connected moves; its paths are shortest, but
+                may differ from A*'s among paths of equal length.
     """
 
+    ENGINES: Tuple[str, ...] = ("astar", "reference", "hpa", "jps")
+    # Engines that return exactly the reference engine's paths
+    EXACT_ENGINES: Tuple[str, ...] = ("astar", "reference")
+    # Maps whose search structures the "hpa" and "jps" engines keep
+    MAX_MAP_SEARCHES = 8
+
+    def __init__(self, engine: str = "astar"):
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown pathfinding engine {engine!r}; expected one of "
+                f"{', '.join(self.ENGINES)}"
+            )
+        self.engine = engine
+        # (id(world_maps), require_explored) -> PortalGraph, see
+        # find_path_hierarchical
+        self._portal_graphs: Dict[Tuple[int, bool], Any] = {}
+        # (id(world_map), searched area) -> ClusterGraph or JumpPointSearch,
+        # oldest first, see _map_search
+        self._map_searches: Dict[Tuple[int, Tuple[int, int]], Any] = {}
+
     def a_star_search(
         self,
         world_map: WorldMap,  # Single map for single-floor A*
@@ -21,7 +57,223 @@ class PathFinder:
     ) -> Optional[List[Tuple[int, int]]]:  # Path is List[(x,y)]
         """
         Performs A* pathfinding from start to goal on a single floor.
-        Returns a list of (x,y) tuples or None.
+
+        Wall tiles are unwalkable, except that the goal may be a wall tile if a
+        monster stands on it.
+
+        Args:
+            world_map: The map to search.
+            start_pos_xy: The starting (x, y) coordinates.
+            goal_pos_xy: The target (x, y) coordinates.
+            map_width: Width of the searchable area.
+            map_height: Height of the searchable area.
+
+        Returns:
+            A list of (x, y) tuples from start to goal (inclusive), or None if
+            the goal cannot be reached.
+        """
+        if self.engine == "reference":
+            return self._a_star_search_reference(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        if self.engine == "hpa":
+            return self._a_star_search_hpa(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        if self.engine == "jps":
+            return self._a_star_search_jps(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        return self._a_star_search_fast(
+            world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+        )
+
+    def _a_star_search_jps(
+        self,
+        world_map: WorldMap,
+        start_pos_xy: Tuple[int, int],
+        goal_pos_xy: Tuple[int, int],
+        map_width: int,
+        map_height: int,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Jump Point Search over the map's cached JumpPointSearch tables.
+        Searches to a monster on a wall tile, or on maps that are not
+        WorldMaps (mocks), use the tuned A* instead.
+        """
+        from src.map_algorithms.jump_point_search import JumpPointSearch
+
+        start_x, start_y = start_pos_xy
+        goal_x, goal_y = goal_pos_xy
+        if (
+            not isinstance(world_map, WorldMap)
+            or not (0 <= start_x < map_width and 0 <= start_y < map_height)
+            or not (0 <= goal_x < map_width and 0 <= goal_y < map_height)
+        ):
+            return self._a_star_search_fast(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        goal_tile = world_map.get_tile(goal_x, goal_y)
+        if not goal_tile or goal_tile.type == "wall":
+            return self._a_star_search_fast(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        search = self._map_search(
+            world_map,
+            (map_width, map_height),
+            lambda: JumpPointSearch(world_map, map_width, map_height),
+        )
+        return search.find_path(start_pos_xy, goal_pos_xy)
+
+    def _a_star_search_hpa(
+        self,
+        world_map: WorldMap,
+        start_pos_xy: Tuple[int, int],
+        goal_pos_xy: Tuple[int, int],
+        map_width: int,
+        map_height: int,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        HPA* through the map's ClusterGraph. Searches over part of a map, from
+        a wall tile, or on maps that are not WorldMaps (mocks) use the tuned
+        A* instead.
+        """
+        from src.map_algorithms.cluster_graph import ClusterGraph
+
+        start_tile = (
+            world_map.get_tile(*start_pos_xy)
+            if isinstance(world_map, WorldMap)
+            else None
+        )
+        if (
+            not start_tile
+            or start_tile.type == "wall"
+            or (map_width, map_height) != (world_map.width, world_map.height)
+        ):
+            return self._a_star_search_fast(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        if start_pos_xy == goal_pos_xy:
+            return [start_pos_xy]
+        goal_tile = world_map.get_tile(*goal_pos_xy)
+        if not goal_tile or (goal_tile.type == "wall" and not goal_tile.monster):
+            return None
+        graph = self._map_search(
+            world_map, (map_width, map_height), lambda: ClusterGraph(world_map)
+        )
+        return graph.find_path(start_pos_xy, goal_pos_xy)
+
+    def _map_search(
+        self,
+        world_map: WorldMap,
+        area: Tuple[int, int],
+        build: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the engine's cached per-map search structure (a ClusterGraph
+        or JumpPointSearch) for world_map and the searched area, creating it
+        with build() if needed. The structures update themselves when the
+        map's version changes.
+        """
+        key = (id(world_map), area)
+        search = self._map_searches.pop(key, None)
+        if search is None or search.world_map is not world_map:
+            search = build()
+        self._map_searches[key] = search
+        while len(self._map_searches) > self.MAX_MAP_SEARCHES:
+            del self._map_searches[next(iter(self._map_searches))]
+        return search
+
+    def _a_star_search_fast(
+        self,
+        world_map: WorldMap,
+        start_pos_xy: Tuple[int, int],
+        goal_pos_xy: Tuple[int, int],
+        map_width: int,
+        map_height: int,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Tuned A*: nodes are encoded as ``x * map_height + y`` so heap entries
+        compare exactly like the reference's (f, (x, y)) tuples, open-set
+        membership is an O(1) set lookup, and an unreachable goal tile is
+        rejected before searching.
+        """
+        from heapq import heappop, heappush
+
+        if start_pos_xy == goal_pos_xy:
+            return [start_pos_xy]
+        start_x, start_y = start_pos_xy
+        if not (0 <= start_x < map_width and 0 <= start_y < map_height):
+            # The node encoding needs in-bounds coordinates; this never happens
+            # in play, so let the reference handle it.
+            return self._a_star_search_reference(
+                world_map, start_pos_xy, goal_pos_xy, map_width, map_height
+            )
+        goal_x, goal_y = goal_pos_xy
+        if not (0 <= goal_x < map_width and 0 <= goal_y < map_height):
+            return None
+        goal_tile = world_map.get_tile(goal_x, goal_y)
+        if not goal_tile or (goal_tile.type == "wall" and not goal_tile.monster):
+            return None
+
+        is_wall = _wall_lookup(world_map, map_width, map_height)
+        height = map_height
+        start_node = start_x * height + start_y
+        goal_node = goal_x * height + goal_y
+
+        open_heap: List[Tuple[int, int]] = [(0, start_node)]
+        in_open = {start_node}
+        came_from: Dict[int, int] = {}
+        g_score: Dict[int, int] = {start_node: 0}
+
+        while open_heap:
+            current = heappop(open_heap)[1]
+            in_open.discard(current)
+
+            if current == goal_node:
+                path: List[Tuple[int, int]] = []
+                while current in came_from:
+                    path.append(divmod(current, height))
+                    current = came_from[current]
+                path.append(start_pos_xy)
+                path.reverse()
+                return path
+
+            cx, cy = divmod(current, height)
+            tentative_g = g_score[current] + 1
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < map_width and 0 <= ny < map_height):
+                    continue
+                neighbor = nx * height + ny
+                if neighbor != goal_node and is_wall(nx, ny):
+                    continue
+                if tentative_g < g_score.get(neighbor, tentative_g + 1):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    if neighbor not in in_open:
+                        in_open.add(neighbor)
+                        heappush(
+                            open_heap,
+                            (
+                                tentative_g + abs(nx - goal_x) + abs(ny - goal_y),
+                                neighbor,
+                            ),
+                        )
+        return None  # No path found
+
+    def _a_star_search_reference(
+        self,
+        world_map: WorldMap,
+        start_pos_xy: Tuple[int, int],
+        goal_pos_xy: Tuple[int, int],
+        map_width: int,
+        map_height: int,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Original A* implementation. Its open-set membership test scans the
+        whole heap, so it is only used as the "reference" engine.
         """
         import heapq  # Local import if not already at top level
 
@@ -113,30 +365,116 @@ class PathFinder:
             A list of (x, y, floor_id) tuples representing the path,
             or None if no path is found. Includes start and goal positions.
         """
-        start_node = (start_pos_xy[0], start_pos_xy[1], start_floor_id)
-        goal_node = (goal_pos_xy[0], goal_pos_xy[1], goal_floor_id)
+        return self._bfs(
+            world_maps,
+            (start_pos_xy[0], start_pos_xy[1], start_floor_id),
+            [(goal_pos_xy[0], goal_pos_xy[1], goal_floor_id)],
+            avoid_monsters,
+            require_explored,
+        )
 
-        # queue stores (current_pos_xyz, current_path_xyz_list)
-        queue = deque([(start_node, [start_node])])
-        # visited stores (x,y,floor_id) tuples
-        visited = {start_node}
+    def find_nearest_path_bfs(
+        self,
+        world_maps: Dict[int, WorldMap],
+        start_pos_xy: Tuple[int, int],
+        start_floor_id: int,
+        goal_nodes: Iterable[Tuple[int, int, int]],
+        avoid_monsters: bool = False,
+        require_explored: bool = False,
+        goal_key: Optional[Callable[[Tuple[int, int, int]], Any]] = None,
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Finds a path to the nearest of several goals in a single BFS sweep.
 
-        while queue:
-            (curr_x, curr_y, curr_floor_id), path = queue.popleft()
+        Walkability rules are the same as find_path_bfs; a tile holding a
+        monster may be entered only if it is one of the goals. The path to
+        any goal is the one find_path_bfs would return for that goal.
 
-            if (curr_x, curr_y, curr_floor_id) == goal_node:
-                return path
+        Args:
+            world_maps: A dictionary mapping floor_id to WorldMap objects.
+            start_pos_xy: The starting (x, y) coordinates.
+            start_floor_id: The starting floor ID.
+            goal_nodes: Candidate (x, y, floor_id) goals.
+            avoid_monsters: If True, treats tiles with monsters as obstacles.
+            require_explored: If True, only paths through explored tiles.
+            goal_key: Breaks ties between equally near goals: the goal with
+                the smallest key wins. Without it, the first goal BFS reaches
+                wins (which ends the search a little earlier).
+
+        Returns:
+            The path to the nearest reachable goal (its last element is that
+            goal), or None if no goal is reachable.
+        """
+        return self._bfs(
+            world_maps,
+            (start_pos_xy[0], start_pos_xy[1], start_floor_id),
+            goal_nodes,
+            avoid_monsters,
+            require_explored,
+            goal_key,
+        )
+
+    def _bfs(
+        self,
+        world_maps: Dict[int, WorldMap],
+        start_node: Tuple[int, int, int],
+        goal_nodes: Iterable[Tuple[int, int, int]],
+        avoid_monsters: bool,
+        require_explored: bool,
+        goal_key: Optional[Callable[[Tuple[int, int, int]], Any]] = None,
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Multi-floor BFS keeping one parent pointer per node.
+
+        Nodes are integer ids (see _NodeCodec); the path is rebuilt from the
+        parent map only once a goal is chosen. With a goal_key, the rest of the
+        goal's depth level is drained (without expanding it) to find the
+        smallest-key goal at that depth.
+        """
+        codec = _NodeCodec(world_maps)
+        if not codec.contains(start_node):
+            return None
+        encode = codec.encode
+        start_id = encode(*start_node)
+        goal_ids = {encode(*goal) for goal in goal_nodes if codec.contains(goal)}
+        if not goal_ids:
+            return None
+
+        # Queue entries are (x, y, floor_id, depth)
+        queue = deque([(start_node[0], start_node[1], start_node[2], 0)])
+        # parents doubles as the visited set
+        parents: Dict[int, int] = {start_id: start_id}
+        best_goal: Optional[Tuple[int, int, int]] = None
+        best_depth = 0
+
+        while queue:
+            curr_x, curr_y, curr_floor_id, depth = queue.popleft()
+            if best_goal is not None and depth > best_depth:
+                break
+            current_id = encode(curr_x, curr_y, curr_floor_id)
+
+            if current_id in goal_ids:
+                if goal_key is None:
+                    return codec.rebuild_path(parents, current_id)
+                node = (curr_x, curr_y, curr_floor_id)
+                if best_goal is None or goal_key(node) < goal_key(best_goal):
+                    best_goal, best_depth = node, depth
+                continue
+            if best_goal is not None:
+                continue  # Only looking for other goals at best_depth
 
             current_map = world_maps.get(curr_floor_id)
             if not current_map:
                 continue  # Should not happen if world_maps is consistent
 
             # Explore neighbors on the current floor (N, S, W, E)
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            for dx, dy in NEIGHBOR_OFFSETS:
                 next_x, next_y = curr_x + dx, curr_y + dy
-                next_node_on_floor = (next_x, next_y, curr_floor_id)
 
                 if current_map.is_valid_move(next_x, next_y):
+                    next_id = encode(next_x, next_y, curr_floor_id)
+                    if next_id in parents:
+                        continue
                     target_tile = current_map.get_tile(next_x, next_y)
                     # Don't path through unexplored tiles when require_explored
                     # (AI visible map has default floor tiles for unexplored areas)
@@ -145,15 +483,12 @@ class PathFinder:
                     if target_tile and target_tile.monster:
                         if avoid_monsters:
                             continue
-                        # Allow pathing to monster only if it's the goal node
-                        if next_node_on_floor != goal_node:
+                        # Allow pathing to monster only if it's a goal node
+                        if next_id not in goal_ids:
                             continue  # Don't path through other monsters
 
-                    if next_node_on_floor not in visited:
-                        visited.add(next_node_on_floor)
-                        new_path = list(path)
-                        new_path.append(next_node_on_floor)
-                        queue.append((next_node_on_floor, new_path))
+                    parents[next_id] = current_id
+                    queue.append((next_x, next_y, curr_floor_id, depth + 1))
 
             # Check for portals on the current tile (curr_x, curr_y, curr_floor_id)
             current_tile = current_map.get_tile(curr_x, curr_y)
@@ -164,8 +499,6 @@ class PathFinder:
             ):
                 portal_to_floor = current_tile.portal_to_floor_id
                 # Portal leads to the same (x,y) on the destination floor
-                next_node_via_portal = (curr_x, curr_y, portal_to_floor)
-
                 # Check if destination map for portal exists
                 if portal_to_floor not in world_maps:
                     continue
@@ -175,27 +508,22 @@ class PathFinder:
                 # This assumes portals are two-way and lead to valid landing spots.
                 # If a portal leads directly into a wall on the other side,
                 # pathfinding should not use it.
-                dest_map_for_portal = world_maps[portal_to_floor]
-                dest_tile_of_portal = dest_map_for_portal.get_tile(curr_x, curr_y)
-
-                can_use_portal = False
-                if dest_tile_of_portal:
-                    if dest_tile_of_portal.type != "wall":
-                        if dest_tile_of_portal.monster:
-                            # Allow landing on monster only if it's the goal node
-                            if next_node_via_portal == goal_node:
-                                can_use_portal = True
-                            # else: portal blocked by monster
-                        else:  # No monster on destination tile
-                            can_use_portal = True
-                # else: portal leads to invalid tile type or out of bounds on dest map
-
-                if can_use_portal and next_node_via_portal not in visited:
-                    visited.add(next_node_via_portal)
-                    new_path_portal = list(path)  # Path up to current tile
-                    new_path_portal.append(next_node_via_portal)  # Add landing spot
-                    queue.append((next_node_via_portal, new_path_portal))
+                dest_tile_of_portal = world_maps[portal_to_floor].get_tile(
+                    curr_x, curr_y
+                )
+                if not dest_tile_of_portal or dest_tile_of_portal.type == "wall":
+                    continue
+                portal_id = encode(curr_x, curr_y, portal_to_floor)
+                # Allow landing on monster only if it's a goal node
+                if dest_tile_of_portal.monster and portal_id not in goal_ids:
+                    continue
 
+                if portal_id not in parents:
+                    parents[portal_id] = current_id
+                    queue.append((curr_x, curr_y, portal_to_floor, depth + 1))
+
+        if best_goal is not None:
+            return codec.rebuild_path(parents, encode(*best_goal))
         return None  # No path found
 
     def find_path_risk_aware(
@@ -207,11 +535,16 @@ class PathFinder:
         goal_floor_id: int,
         player_health_ratio: float = 1.0,
         require_explored: bool = False,
+        danger_grids: Optional[Dict[int, "DangerGrid"]] = None,
     ) -> Optional[List[Tuple[int, int, int]]]:
         """
         Pathfinding that adds cost penalty for tiles adjacent to monsters.
         Uses Dijkstra's algorithm with variable costs.
 
+        A step onto a tile costs 1 plus the penalty times the tile's danger
+        (see DangerGrid), read from danger_grids. Floors without a grid get
+        one built from their monsters, each weighing 1.
+
         Args:
             world_maps: A dictionary mapping floor_id to WorldMap objects.
             start_pos_xy: The starting (x, y) coordinates.
@@ -221,6 +554,8 @@ class PathFinder:
             player_health_ratio: Current health / max health (0.0 to 1.0).
                 Lower values increase danger avoidance.
             require_explored: If True, only paths through explored tiles.
+            danger_grids: Danger grids by floor_id, kept in sync with the
+                floors' monsters by the caller.
 
         Returns:
             A list of (x, y, floor_id) tuples representing the path,
@@ -228,44 +563,58 @@ class PathFinder:
         """
         import heapq
 
+        from src.map_algorithms.danger_grid import DangerGrid
+
+        grids: Dict[int, DangerGrid] = dict(danger_grids) if danger_grids else {}
+
         # Higher penalty when low on health
         danger_penalty = 5 if player_health_ratio < 0.5 else 2
 
         start_node = (start_pos_xy[0], start_pos_xy[1], start_floor_id)
         goal_node = (goal_pos_xy[0], goal_pos_xy[1], goal_floor_id)
-
-        # Priority queue: (cost, counter, node, path)
-        # Use a counter to break ties and ensure consistent ordering
+        codec = _NodeCodec(world_maps)
+        if not codec.contains(start_node):
+            return None
+        encode = codec.encode
+        start_id = encode(*start_node)
+        goal_id = encode(*goal_node) if codec.contains(goal_node) else None
+
+        # Priority queue: (cost, counter, node_id, parent_id). The counter breaks
+        # ties (so ids are never compared) and keeps the ordering consistent.
+        # A node's parent is fixed by the entry that first reaches the top.
         counter = 0
-        pq: List[Tuple[int, int, Tuple[int, int, int], List[Tuple[int, int, int]]]] = [
-            (0, counter, start_node, [start_node])
-        ]
-        visited: Dict[Tuple[int, int, int], int] = {}  # node -> best cost to reach it
+        pq: List[Tuple[float, int, int, int]] = [(0, counter, start_id, start_id)]
+        parents: Dict[int, int] = {}  # expanded node -> parent
 
         while pq:
-            cost, _, (cx, cy, cf), path = heapq.heappop(pq)
-
-            if (cx, cy, cf) == goal_node:
-                return path
+            cost, _, node_id, parent_id = heapq.heappop(pq)
 
             # Skip if we've already found a better path to this node
-            if (cx, cy, cf) in visited and visited[(cx, cy, cf)] <= cost:
+            if node_id in parents:
                 continue
-            visited[(cx, cy, cf)] = cost
+            parents[node_id] = parent_id
 
+            if node_id == goal_id:
+                return codec.rebuild_path(parents, node_id)
+
+            cx, cy, cf = codec.decode(node_id)
             current_map = world_maps.get(cf)
             if not current_map:
                 continue
+            grid = grids.get(cf)
+            if grid is None:
+                grid = grids[cf] = DangerGrid.from_world_map(current_map)
+            danger, grid_width = grid.costs, grid.width
 
             # Explore neighbors on the current floor
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            for dx, dy in NEIGHBOR_OFFSETS:
                 nx, ny = cx + dx, cy + dy
-                next_node = (nx, ny, cf)
 
-                if next_node in visited:
+                if not current_map.is_valid_move(nx, ny):
                     continue
 
-                if not current_map.is_valid_move(nx, ny):
+                next_id = encode(nx, ny, cf)
+                if next_id in parents:
                     continue
 
                 tile = current_map.get_tile(nx, ny)
@@ -277,22 +626,14 @@ class PathFinder:
                     continue
 
                 # Don't path through monsters (unless goal)
-                if tile.monster and next_node != goal_node:
+                if tile.monster and next_id != goal_id:
                     continue
 
-                # Base movement cost
-                move_cost = 1
-
-                # Add penalty if adjacent to a monster
-                for ddx, ddy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                    adj_tile = current_map.get_tile(nx + ddx, ny + ddy)
-                    if adj_tile and adj_tile.monster:
-                        move_cost += danger_penalty
-                        break  # Only penalize once per tile
+                # Base movement cost, plus the penalty for nearby monsters
+                move_cost = 1 + danger_penalty * danger[ny * grid_width + nx]
 
-                new_cost = cost + move_cost
                 counter += 1
-                heapq.heappush(pq, (new_cost, counter, next_node, path + [next_node]))  # type: ignore[arg-type]
+                heapq.heappush(pq, (cost + move_cost, counter, next_id, node_id))
 
             # Check for portals
             current_tile = current_map.get_tile(cx, cy)
@@ -302,32 +643,98 @@ class PathFinder:
                 and current_tile.portal_to_floor_id is not None
             ):
                 portal_to_floor = current_tile.portal_to_floor_id
-                next_node_via_portal = (cx, cy, portal_to_floor)
+                if portal_to_floor not in world_maps:
+                    continue
+                portal_id = encode(cx, cy, portal_to_floor)
+                if portal_id in parents:
+                    continue
 
-                if (
-                    portal_to_floor in world_maps
-                    and next_node_via_portal not in visited
-                ):
-                    dest_map = world_maps[portal_to_floor]
-                    dest_tile = dest_map.get_tile(cx, cy)
-
-                    if dest_tile and dest_tile.type != "wall":
-                        if not dest_tile.monster or next_node_via_portal == goal_node:
-                            # Portal cost is 1 (same as normal move)
-                            new_cost = cost + 1
-                            counter += 1
-                            heapq.heappush(
-                                pq,  # type: ignore[arg-type]
-                                (
-                                    new_cost,
-                                    counter,
-                                    next_node_via_portal,
-                                    path + [next_node_via_portal],
-                                ),
-                            )
+                dest_tile = world_maps[portal_to_floor].get_tile(cx, cy)
+                if dest_tile and dest_tile.type != "wall":
+                    if not dest_tile.monster or portal_id == goal_id:
+                        # Portal cost is 1 (same as normal move)
+                        counter += 1
+                        heapq.heappush(pq, (cost + 1, counter, portal_id, node_id))
 
         return None  # No path found (risk-aware)
 
+    def find_path_hierarchical(
+        self,
+        world_maps: Dict[int, WorldMap],
+        start_pos_xy: Tuple[int, int],
+        start_floor_id: int,
+        goal_pos_xy: Tuple[int, int],
+        goal_floor_id: int,
+        require_explored: bool = False,
+        player_health_ratio: Optional[float] = None,
+        danger_grids: Optional[Dict[int, "DangerGrid"]] = None,
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Finds a cross-floor path through the portal graph (see PortalGraph).
+
+        Instead of flooding every floor tile by tile, the route is planned
+        over precomputed portal-to-portal distances and only the floor
+        segments it uses are searched. Those distances are kept per floor
+        and rebuilt when that floor's version changes. Same-floor queries,
+        and queries whose segments are blocked by monsters, fall back to
+        find_path_bfs (or find_path_risk_aware).
+
+        Args:
+            world_maps: A dictionary mapping floor_id to WorldMap objects.
+            start_pos_xy: The starting (x, y) coordinates.
+            start_floor_id: The starting floor ID.
+            goal_pos_xy: The target (x, y) coordinates.
+            goal_floor_id: The target floor ID.
+            require_explored: If True, only paths through explored tiles.
+            player_health_ratio: If given, segments are searched risk-aware
+                (see find_path_risk_aware) with this health ratio.
+            danger_grids: Danger grids by floor for the risk-aware searches.
+
+        Returns:
+            A list of (x, y, floor_id) tuples representing the path,
+            or None if no path is found. Includes start and goal positions.
+        """
+        if start_floor_id != goal_floor_id:
+            return self._portal_graph(world_maps, require_explored).find_path(
+                start_pos_xy,
+                start_floor_id,
+                goal_pos_xy,
+                goal_floor_id,
+                player_health_ratio,
+                danger_grids,
+            )
+        if player_health_ratio is not None:
+            return self.find_path_risk_aware(
+                world_maps,
+                start_pos_xy,
+                start_floor_id,
+                goal_pos_xy,
+                goal_floor_id,
+                player_health_ratio=player_health_ratio,
+                require_explored=require_explored,
+                danger_grids=danger_grids,
+            )
+        return self.find_path_bfs(
+            world_maps,
+            start_pos_xy,
+            start_floor_id,
+            goal_pos_xy,
+            goal_floor_id,
+            require_explored=require_explored,
+        )
+
+    def _portal_graph(self, world_maps: Dict[int, WorldMap], require_explored: bool):
+        # Imported here: portal_graph builds on this module
+        from src.map_algorithms.portal_graph import PortalGraph
+
+        key = (id(world_maps), require_explored)
+        graph = self._portal_graphs.get(key)
+        # The graph keeps world_maps alive, so a matching id is the same dict
+        if graph is None or graph.world_maps is not world_maps:
+            graph = PortalGraph(world_maps, require_explored, self)
+            self._portal_graphs[key] = graph
+        return graph
+
     def find_furthest_point(
         self,
         world_map: WorldMap,
@@ -413,3 +820,76 @@ class PathFinder:
         while y1 != y2:
             y1 += 1 if y1 < y2 else -1
             carve_at(x1, y1)
+
+
+class _NodeCodec:
+    """
+    Encodes multi-floor (x, y, floor_id) nodes as integer ids.
+
+    Ids are ``(floor_id * height + y) * width + x`` using the largest map
+    dimensions in world_maps, so every in-bounds node on every floor gets a
+    distinct id.
+    """
+
+    __slots__ = ("width", "height", "world_maps")
+
+    def __init__(self, world_maps: Dict[int, WorldMap]):
+        self.world_maps = world_maps
+        self.width = max((m.width for m in world_maps.values()), default=0)
+        self.height = max((m.height for m in world_maps.values()), default=0)
+
+    def contains(self, node: Tuple[int, int, int]) -> bool:
+        """Whether node lies within the bounds of its floor's map."""
+        world_map = self.world_maps.get(node[2])
+        return (
+            world_map is not None
+            and 0 <= node[0] < world_map.width
+            and 0 <= node[1] < world_map.height
+        )
+
+    def encode(self, x: int, y: int, floor_id: int) -> int:
+        return (floor_id * self.height + y) * self.width + x
+
+    def decode(self, node_id: int) -> Tuple[int, int, int]:
+        rest, x = divmod(node_id, self.width)
+        floor_id, y = divmod(rest, self.height)
+        return x, y, floor_id
+
+    def rebuild_path(
+        self, parents: Dict[int, int], node_id: int
+    ) -> List[Tuple[int, int, int]]:
+        """Follows parent pointers back to the root (its own parent)."""
+        path = [self.decode(node_id)]
+        while parents[node_id] != node_id:
+            node_id = parents[node_id]
+            path.append(self.decode(node_id))
+        path.reverse()
+        return path
+
+
+def _wall_lookup(
+    world_map: WorldMap, map_width: int, map_height: int
+) -> Callable[[int, int], bool]:
+    """
+    Returns an ``is_wall(x, y)`` predicate for in-bounds coordinates.
+
+    Plain WorldMaps and ArrayWorldMaps are read directly from their storage;
+    anything else (subclasses overriding get_tile, mocks) goes through
+    get_tile, treating a missing tile as a wall.
+    """
+    fits = map_width <= world_map.width and map_height <= world_map.height
+    if fits and type(world_map) is ArrayWorldMap:
+        tile_types = world_map.tile_types
+        width = world_map.width
+        return lambda x, y: tile_types[y * width + x] == WALL_CODE
+    if fits and type(world_map) is WorldMap:
+        rows = world_map.grid
+        return lambda x, y: rows[y][x].type == "wall"
+
+    get_tile = world_map.get_tile
+
+    def is_wall(x: int, y: int) -> bool:
+        tile = get_tile(x, y)
+        return not tile or tile.type == "wall"
+
+    return is_wall
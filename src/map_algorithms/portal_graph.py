@@ -0,0 +1,468 @@
+"""
+Portal graph: the abstraction layer for hierarchical cross-floor pathfinding.
+
+PathFinder.find_path_bfs searches tile by tile and treats portals as extra
+edges, so a path to another floor floods every floor it touches. PortalGraph
+instead works on the "points" of each floor: its portal tiles and the tiles
+where portals from other floors land. For every floor it keeps a distance
+field from each of its points, built on first use. When the floor changes,
+its terrain log (WorldMap.terrain_changes_since) tells which cells did, and
+only the fields that reach one of them are dropped. A query is a Dijkstra
+search over the handful of points (plus the start and goal), after which only
+the floor segments the route actually uses are searched tile by tile.
+
+Monsters are ignored when building the graph, since they move every turn.
+A query never routes through a point holding a monster (other than its
+goal), and the segment searches respect monsters as find_path_bfs does.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.map_algorithms.distance_field import DistanceField, walkable_mask
+from src.map_algorithms.pathfinding import NEIGHBOR_OFFSETS, PathFinder
+from src.world_map import WorldMap
+
+if TYPE_CHECKING:
+    from src.map_algorithms.danger_grid import DangerGrid
+
+PathNode = Tuple[int, int, int]
+
+
+@dataclass
+class _FloorTable:
+    """Distance fields from the points of one floor, built on first use."""
+
+    world_map: WorldMap
+    version: int
+    points: Tuple[Tuple[int, int], ...]
+    walkable: bytearray
+    fields: Dict[Tuple[int, int], DistanceField] = field(default_factory=dict)
+
+
+class PortalGraph:
+    """
+    Hierarchical pathfinder over a set of floors connected by portals.
+
+    Walkability follows find_path_bfs: tiles that are not walls (or are
+    portals), explored if require_explored is set, and a portal leads to the
+    same (x, y) on its destination floor unless that tile is a wall.
+
+    Args:
+        world_maps: The floors, by id. The dict is read on every query, so
+                    floors may be added or edited in place.
+        require_explored: Only path through explored tiles (for AI maps).
+        path_finder: Used for the per-floor segment searches.
+    """
+
+    def __init__(
+        self,
+        world_maps: Dict[int, WorldMap],
+        require_explored: bool = False,
+        path_finder: Optional[PathFinder] = None,
+    ):
+        self.world_maps = world_maps
+        self.require_explored = require_explored
+        self.path_finder = path_finder or PathFinder()
+        # floor_id -> (map, version, {(x, y): destination floor})
+        self._portals: Dict[
+            int, Tuple[WorldMap, int, Dict[Tuple[int, int], int]]
+        ] = {}
+        self._tables: Dict[int, _FloorTable] = {}
+
+    def find_path(
+        self,
+        start_pos_xy: Tuple[int, int],
+        start_floor_id: int,
+        goal_pos_xy: Tuple[int, int],
+        goal_floor_id: int,
+        player_health_ratio: Optional[float] = None,
+        danger_grids: Optional[Dict[int, "DangerGrid"]] = None,
+    ) -> Optional[List[PathNode]]:
+        """
+        Finds a path from start to goal through the portal graph.
+
+        The route (which portals, in which order) is shortest in steps. Each
+        floor segment of it is then searched with find_path_bfs, or with
+        find_path_risk_aware when player_health_ratio is given.
+
+        Args:
+            start_pos_xy: The starting (x, y) coordinates.
+            start_floor_id: The starting floor ID.
+            goal_pos_xy: The target (x, y) coordinates.
+            goal_floor_id: The target floor ID.
+            player_health_ratio: Refine segments with risk-aware search.
+            danger_grids: Danger grids by floor for the risk-aware searches.
+
+        Returns:
+            A list of (x, y, floor_id) tuples including start and goal, or
+            None if there is no path. If monsters block a segment of the
+            route, the path is searched across all floors instead.
+        """
+        start = (start_pos_xy[0], start_pos_xy[1], start_floor_id)
+        goal = (goal_pos_xy[0], goal_pos_xy[1], goal_floor_id)
+        if not self._in_bounds(start) or not self._in_bounds(goal):
+            return None
+        if start == goal:
+            return [start]
+
+        start_field = self._field_from(self._floor_table(start_floor_id), start_pos_xy)
+        routed = self._route(start, goal, start_field)
+        if routed is None:
+            # Monsters off the points only ever block more, so no tile search
+            # can succeed
+            return None
+        route, cost = routed
+        path = self._refine(route, start_field, goal, player_health_ratio, danger_grids)
+        if path is not None and player_health_ratio is None and len(path) - 1 > cost:
+            # A segment detoured around a monster; another route may be shorter
+            path = None
+        if path is None:
+            # Monsters block the route; search every floor instead
+            path = self._search(
+                self.world_maps, start, goal, player_health_ratio, danger_grids
+            )
+        return path
+
+    def invalidate(self, floor_id: Optional[int] = None) -> None:
+        """Drops cached data for one floor, or for all floors."""
+        if floor_id is None:
+            self._portals.clear()
+            self._tables.clear()
+        else:
+            self._portals.pop(floor_id, None)
+            self._tables.pop(floor_id, None)
+
+    def floor_points(self, floor_id: int) -> Tuple[Tuple[int, int], ...]:
+        """Returns the points of a floor: its portals and portal landings."""
+        world_map = self.world_maps.get(floor_id)
+        if world_map is None:
+            return ()
+        points = {
+            position
+            for position, destination in self._floor_portals(floor_id).items()
+            if destination in self.world_maps
+        }
+        for other_id in self.world_maps:
+            if other_id == floor_id:
+                continue
+            for (x, y), destination in self._floor_portals(other_id).items():
+                if destination == floor_id and world_map.is_in_bounds(x, y):
+                    points.add((x, y))
+        return tuple(sorted(points, key=lambda p: (p[1], p[0])))
+
+    def _route(
+        self, start: PathNode, goal: PathNode, start_field: DistanceField
+    ) -> Optional[Tuple[List[PathNode], int]]:
+        """
+        Dijkstra over start, goal and the floor points. Points holding a
+        monster are skipped unless they are the goal.
+
+        Returns:
+            The route and its length in steps, or None if there is none.
+        """
+        distances: Dict[PathNode, int] = {start: 0}
+        parents: Dict[PathNode, PathNode] = {start: start}
+        heap: List[Tuple[int, PathNode]] = [(0, start)]
+
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > distances[node]:
+                continue  # Stale entry
+            if node == goal:
+                route = [node]
+                while parents[route[-1]] != route[-1]:
+                    route.append(parents[route[-1]])
+                route.reverse()
+                return route, cost
+
+            x, y, floor_id = node
+            table = self._floor_table(floor_id)
+            if node == start:
+                from_field = start_field
+            else:
+                from_field = self._point_field(table, (x, y))
+            neighbours: List[Tuple[PathNode, Optional[int]]] = [
+                ((px, py, floor_id), from_field.distance(px, py))
+                for px, py in table.points
+                if (px, py) != (x, y)
+                and not self._blocked((px, py, floor_id), goal)
+            ]
+            if floor_id == goal[2]:
+                neighbours.append((goal, from_field.distance(goal[0], goal[1])))
+            destination = self._portal_destination(floor_id, x, y, goal)
+            if destination is not None:
+                neighbours.append(((x, y, destination), 1))
+
+            for neighbour, step_cost in neighbours:
+                if step_cost is None:
+                    continue
+                new_cost = cost + step_cost
+                if new_cost < distances.get(neighbour, new_cost + 1):
+                    distances[neighbour] = new_cost
+                    parents[neighbour] = node
+                    heapq.heappush(heap, (new_cost, neighbour))
+        return None
+
+    def _refine(
+        self,
+        route: List[PathNode],
+        start_field: DistanceField,
+        goal: PathNode,
+        player_health_ratio: Optional[float],
+        danger_grids: Optional[Dict[int, "DangerGrid"]],
+    ) -> Optional[List[PathNode]]:
+        """
+        Turns a route into tiles. A floor segment follows the distance field
+        of its end point downhill, which needs no search; segments crossing
+        a monster, and all segments of risk-aware queries, are searched.
+        """
+        path = [route[0]]
+        for current, following in zip(route, route[1:]):
+            floor_id = following[2]
+            world_map = self.world_maps[floor_id]
+            if self._blocked(following, goal):
+                # A monster may only stand on a route point if it is the goal;
+                # the segment search would otherwise walk onto it
+                return None
+            if current[2] != floor_id:
+                # Portal hop
+                path.append(following)
+                continue
+
+            segment = None
+            if player_health_ratio is None:
+                segment = self._downhill_segment(current, following, start_field)
+                if segment and self._crosses_monster(world_map, segment, goal):
+                    segment = None
+            if segment is None:
+                segment = self._search(
+                    {floor_id: world_map},
+                    current,
+                    following,
+                    player_health_ratio,
+                    danger_grids,
+                )
+            if not segment:
+                return None
+            path.extend(segment[1:])
+        return path
+
+    def _downhill_segment(
+        self, current: PathNode, following: PathNode, start_field: DistanceField
+    ) -> Optional[List[PathNode]]:
+        """Reads a shortest segment off a precomputed distance field."""
+        floor_id = current[2]
+        table = self._floor_table(floor_id)
+        if following[:2] in table.points:
+            steps = self._point_field(table, following[:2]).path_from(
+                current[0], current[1]
+            )
+        else:
+            # Only the goal is not a point; walk back to where we came from
+            if current[:2] in table.points:
+                from_field = self._point_field(table, current[:2])
+            else:
+                from_field = start_field
+            steps = from_field.path_from(following[0], following[1])
+            if steps:
+                steps.reverse()
+        if not steps or steps[0] != current[:2] or steps[-1] != following[:2]:
+            return None
+        return [(x, y, floor_id) for x, y in steps]
+
+    def _blocked(self, node: PathNode, goal: PathNode) -> bool:
+        """Whether a monster stands on node, which is not the goal."""
+        if node == goal:
+            return False
+        tile = self.world_maps[node[2]].get_tile(node[0], node[1])
+        return bool(tile and tile.monster)
+
+    @staticmethod
+    def _crosses_monster(
+        world_map: WorldMap, segment: List[PathNode], goal: PathNode
+    ) -> bool:
+        for node in segment[1:]:
+            tile = world_map.get_tile(node[0], node[1])
+            if tile and tile.monster and node != goal:
+                return True
+        return False
+
+    def _search(
+        self,
+        world_maps: Dict[int, WorldMap],
+        start: PathNode,
+        goal: PathNode,
+        player_health_ratio: Optional[float],
+        danger_grids: Optional[Dict[int, "DangerGrid"]],
+    ) -> Optional[List[PathNode]]:
+        """Tile-by-tile search with find_path_bfs or find_path_risk_aware."""
+        if player_health_ratio is None:
+            return self.path_finder.find_path_bfs(
+                world_maps,
+                (start[0], start[1]),
+                start[2],
+                (goal[0], goal[1]),
+                goal[2],
+                require_explored=self.require_explored,
+            )
+        return self.path_finder.find_path_risk_aware(
+            world_maps,
+            (start[0], start[1]),
+            start[2],
+            (goal[0], goal[1]),
+            goal[2],
+            player_health_ratio=player_health_ratio,
+            require_explored=self.require_explored,
+            danger_grids=danger_grids,
+        )
+
+    def _floor_table(self, floor_id: int) -> _FloorTable:
+        """Returns the floor's table, brought up to date with the floor."""
+        world_map = self.world_maps[floor_id]
+        points = self.floor_points(floor_id)
+        table = self._tables.get(floor_id)
+        if table is None or table.world_map is not world_map:
+            table = _FloorTable(
+                world_map, world_map.version, points, self._walkable(world_map)
+            )
+            self._tables[floor_id] = table
+        elif table.version != world_map.version:
+            changes = world_map.terrain_changes_since(table.version)
+            if changes is None:
+                table.walkable = self._walkable(world_map)
+                table.fields.clear()
+            else:
+                self._apply_terrain_changes(table, changes)
+            table.version = world_map.version
+        if table.points != points:
+            table.fields = {
+                point: point_field
+                for point, point_field in table.fields.items()
+                if point in points
+            }
+            table.points = points
+        return table
+
+    def _apply_terrain_changes(
+        self, table: _FloorTable, changes: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Updates the walkable mask for changed cells and drops the fields that
+        reach one of them or a neighbour (a cell that became walkable next to
+        a field's region extends it).
+        """
+        world_map = table.world_map
+        width, height = world_map.width, world_map.height
+        touched = set()
+        for x, y in set(changes):
+            table.walkable[y * width + x] = self._cell_walkable(world_map, x, y)
+            touched.add((x, y))
+            for dx, dy in NEIGHBOR_OFFSETS:
+                if 0 <= x + dx < width and 0 <= y + dy < height:
+                    touched.add((x + dx, y + dy))
+        table.fields = {
+            point: point_field
+            for point, point_field in table.fields.items()
+            if all(point_field.distance(x, y) is None for x, y in touched)
+        }
+
+    def _point_field(
+        self, table: _FloorTable, point: Tuple[int, int]
+    ) -> DistanceField:
+        """Returns the distance field from one of the table's points."""
+        point_field = table.fields.get(point)
+        if point_field is None:
+            point_field = table.fields[point] = self._field_from(table, point)
+        return point_field
+
+    def _field_from(self, table: _FloorTable, source: Tuple[int, int]) -> DistanceField:
+        """Distance field from source, which need not be walkable itself
+        (e.g. an unexplored portal landing)."""
+        walkable = table.walkable
+        index = source[1] * table.world_map.width + source[0]
+        if not walkable[index]:
+            walkable = bytearray(walkable)
+            walkable[index] = 1
+        return DistanceField.from_sources(table.world_map, [source], walkable)
+
+    def _walkable(self, world_map: WorldMap) -> bytearray:
+        mask = walkable_mask(world_map)
+        if self.require_explored:
+            width = world_map.width
+            for index in range(len(mask)):
+                if mask[index]:
+                    y, x = divmod(index, width)
+                    tile = world_map.get_tile(x, y)
+                    if not tile or not tile.is_explored:
+                        mask[index] = 0
+        return mask
+
+    def _cell_walkable(self, world_map: WorldMap, x: int, y: int) -> int:
+        """One cell of _walkable."""
+        tile = world_map.get_tile(x, y)
+        if not tile or (tile.type == "wall" and not tile.is_portal):
+            return 0
+        return 0 if self.require_explored and not tile.is_explored else 1
+
+    def _floor_portals(self, floor_id: int) -> Dict[Tuple[int, int], int]:
+        """Returns {(x, y): destination floor} of the floor's portals."""
+        world_map = self.world_maps[floor_id]
+        cached = self._portals.get(floor_id)
+        if cached is not None and cached[0] is world_map:
+            if cached[1] == world_map.version:
+                return cached[2]
+            changes = world_map.terrain_changes_since(cached[1])
+            if changes is not None:
+                # Only the changed cells can have gained or lost a portal
+                portals = dict(cached[2])
+                for x, y in set(changes):
+                    portals.pop((x, y), None)
+                    destination = self._portal_at(world_map, x, y)
+                    if destination is not None:
+                        portals[(x, y)] = destination
+                self._portals[floor_id] = (world_map, world_map.version, portals)
+                return portals
+        portals = {}
+        for y in range(world_map.height):
+            for x in range(world_map.width):
+                destination = self._portal_at(world_map, x, y)
+                if destination is not None:
+                    portals[(x, y)] = destination
+        self._portals[floor_id] = (world_map, world_map.version, portals)
+        return portals
+
+    @staticmethod
+    def _portal_at(world_map: WorldMap, x: int, y: int) -> Optional[int]:
+        """The destination floor of a portal at (x, y), if there is one."""
+        tile = world_map.get_tile(x, y)
+        if tile and tile.is_portal and tile.portal_to_floor_id is not None:
+            return tile.portal_to_floor_id
+        return None
+
+    def _portal_destination(
+        self, floor_id: int, x: int, y: int, goal: PathNode
+    ) -> Optional[int]:
+        """
+        The floor a portal at (x, y) leads to, if it can be taken: its landing
+        is not a wall and holds no monster, unless the landing is the goal.
+        (The portal tile itself is checked when the route reaches it.)
+        """
+        world_map = self.world_maps[floor_id]
+        tile = world_map.get_tile(x, y)
+        if not tile or not tile.is_portal or tile.portal_to_floor_id is None:
+            return None
+        destination_map = self.world_maps.get(tile.portal_to_floor_id)
+        if destination_map is None:
+            return None
+        landing = destination_map.get_tile(x, y)
+        if not landing or landing.type == "wall":
+            return None
+        if landing.monster and (x, y, tile.portal_to_floor_id) != goal:
+            return None
+        return tile.portal_to_floor_id
+
+    def _in_bounds(self, node: PathNode) -> bool:
+        world_map = self.world_maps.get(node[2])
+        return world_map is not None and world_map.is_in_bounds(node[0], node[1])
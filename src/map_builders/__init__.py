@@ -1,4 +1,5 @@
 # flake8: noqa
 from .builder_base import BuilderBase
+from .compact_floor_builder import CompactFloorBuilder
 from .single_floor_builder import SingleFloorBuilder
 from .world_builder import WorldBuilder
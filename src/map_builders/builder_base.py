@@ -12,7 +12,8 @@ class BuilderBase(ABC):
         self.width = width
         self.height = height
         self.random = random_generator
-        self.world_map = WorldMap(width, height)
+        # Set by subclasses, which know how the map should start out
+        self.world_map: WorldMap
 
     @abstractmethod
     def build(self):
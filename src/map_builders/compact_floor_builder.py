@@ -0,0 +1,149 @@
+"""
+SingleFloorBuilder on a compact grid.
+
+SingleFloorBuilder carves a floor through WorldMap.get_tile/set_tile_type,
+so every scan of the map (collecting floor tiles before each random walk and
+path, connectivity checks, density passes) touches one Tile object per cell.
+CompactFloorBuilder runs the same pipeline on an ArrayWorldMap instead: the
+scans become bulk operations on its tile type buffer (see
+ArrayWorldMap.type_mask, and the ArrayWorldMap paths of
+MapConnectivityManager and FloorDensityAdjuster), and Tile objects are only
+created once, when the finished terrain is turned into a WorldMap.
+
+For the same random generator state the result is identical to
+SingleFloorBuilder's, including the random numbers drawn, so a world built
+with either builder is the same.
+"""
+
+from itertools import compress
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, overload
+
+from src.array_world_map import WALL_CODE, ArrayWorldMap, tile_type_code
+from src.item_factory import ItemFactory
+from src.map_builders.single_floor_builder import SingleFloorBuilder
+from src.monster_factory import MonsterFactory
+from src.world_map import WorldMap
+
+if TYPE_CHECKING:
+    from random import Random
+
+# Maps every tile type code to itself, except potential_floor to wall
+_POTENTIAL_FLOOR_TO_WALL = bytes(
+    WALL_CODE if code == tile_type_code("potential_floor") else code
+    for code in range(256)
+)
+
+
+class _Cells(Sequence[Tuple[int, int]]):
+    """(x, y) of a sorted list of buffer indices, converted on access."""
+
+    def __init__(self, indices: List[int], width: int):
+        self._indices = indices
+        self._width = width
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, position: int) -> Tuple[int, int]: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[Tuple[int, int]]: ...
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        index = self._indices[position]
+        return index % self._width, index // self._width
+
+
+class CompactFloorBuilder(SingleFloorBuilder):
+    """
+    Builds a floor like SingleFloorBuilder, on an ArrayWorldMap.
+
+    Args:
+        existing_map: A map to build on (e.g. with portals already placed).
+                      An ArrayWorldMap is used as is; other maps are copied,
+                      and are not modified.
+
+    The other arguments are SingleFloorBuilder's. build() returns a
+    Tile-backed WorldMap, as SingleFloorBuilder does.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        random_generator: "Random",
+        floor_portion: Optional[float] = None,
+        existing_map: Optional[WorldMap] = None,
+        item_factory: Optional[ItemFactory] = None,
+        monster_factory: Optional[MonsterFactory] = None,
+    ):
+        if existing_map is not None and type(existing_map) is not ArrayWorldMap:
+            existing_map = ArrayWorldMap.from_world_map(existing_map)
+        super().__init__(
+            width,
+            height,
+            random_generator,
+            floor_portion=floor_portion,
+            existing_map=existing_map,
+            item_factory=item_factory,
+            monster_factory=monster_factory,
+        )
+
+    def _initialize_map(self, width: int, height: int) -> WorldMap:
+        world_map = ArrayWorldMap(width, height, "potential_floor")
+        tile_types = world_map.tile_types
+        tile_types[:width] = bytes([WALL_CODE]) * width
+        tile_types[-width:] = bytes([WALL_CODE]) * width
+        tile_types[::width] = bytes([WALL_CODE]) * height
+        tile_types[width - 1 :: width] = bytes([WALL_CODE]) * height
+        return world_map
+
+    def _build_terrain(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        floor_start, floor_poi = super()._build_terrain()
+        if isinstance(self.world_map, ArrayWorldMap):
+            self.world_map = self.world_map.to_world_map()
+        return floor_start, floor_poi
+
+    def _collect_tiles(self, tile_type: str) -> List[Tuple[int, int]]:
+        world_map = self.world_map
+        if not isinstance(world_map, ArrayWorldMap):
+            return super()._collect_tiles(tile_type)
+        return world_map.coords_in(world_map.type_mask(tile_type, interior=True))
+
+    def _floor_tile_choices(
+        self, fallback: Tuple[int, int]
+    ) -> Sequence[Tuple[int, int]]:
+        world_map = self.world_map
+        if not isinstance(world_map, ArrayWorldMap):
+            return super()._floor_tile_choices(fallback)
+        floor = world_map.type_mask("floor", interior=True)
+        width = world_map.width
+        if any(floor[y * width + x] for x, y in self.portals_on_floor):
+            # Portals are normally not floor tiles while paths are laid out
+            return super()._floor_tile_choices(fallback)
+        indices = list(compress(range(len(floor)), floor))
+        # random.choice only needs the length and one element, so the
+        # coordinates of the other tiles are never built
+        return _Cells(indices, width) if indices else [fallback]
+
+    def _convert_potential_floor_to_walls_respecting_portals(self):
+        world_map = self.world_map
+        if not isinstance(world_map, ArrayWorldMap):
+            super()._convert_potential_floor_to_walls_respecting_portals()
+            return
+        tile_types = world_map.tile_types
+        width = world_map.width
+        portal_codes = [
+            (index, tile_types[index])
+            for index in (y * width + x for x, y in self.portals_on_floor)
+        ]
+        walled = tile_types.translate(_POTENTIAL_FLOOR_TO_WALL)
+        for y in range(1, world_map.height - 1):
+            row = y * width
+            tile_types[row + 1 : row + width - 1] = walled[row + 1 : row + width - 1]
+        for index, code in portal_codes:
+            tile_types[index] = code
+        world_map.mark_changed()
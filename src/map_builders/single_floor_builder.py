@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 from src.item_factory import ItemFactory
 from src.map_algorithms.connectivity import MapConnectivityManager
@@ -224,17 +224,7 @@ class SingleFloorBuilder(BuilderBase):
             if start_node is None or start_node in self.portals_on_floor:
                 continue
 
-            all_floor_tiles = self._collect_floor_tiles()
-            non_portal_floor_tiles = [
-                f for f in all_floor_tiles if f not in self.portals_on_floor
-            ]
-
-            end_node_choices = (
-                non_portal_floor_tiles if non_portal_floor_tiles else all_floor_tiles
-            )
-            if not end_node_choices:
-                end_node_choices = [player_start_pos]
-
+            end_node_choices = self._floor_tile_choices(player_start_pos)
             end_node = self.random.choice(end_node_choices)
             if end_node == start_node and len(end_node_choices) > 1:
                 potential_end_nodes = [
@@ -261,15 +251,11 @@ class SingleFloorBuilder(BuilderBase):
         )
         num_additional_paths = self.random.randint(min_paths, max_paths)
 
-        potential_target_tiles = []
-        for y_coord in range(1, self.height - 1):
-            for x_coord in range(1, self.width - 1):
-                coord = (x_coord, y_coord)
-                if coord in self.portals_on_floor:
-                    continue
-                tile = self.world_map.get_tile(x_coord, y_coord)
-                if tile and tile.type == "potential_floor":
-                    potential_target_tiles.append(coord)
+        potential_target_tiles = [
+            coord
+            for coord in self._collect_tiles("potential_floor")
+            if coord not in self.portals_on_floor
+        ]
 
         if player_start_pos in potential_target_tiles:
             potential_target_tiles.remove(player_start_pos)
@@ -283,16 +269,7 @@ class SingleFloorBuilder(BuilderBase):
                 self.random.randrange(len(potential_target_tiles))
             )
 
-            current_floor_tiles = self._collect_floor_tiles()
-            non_portal_origins = [
-                t for t in current_floor_tiles if t not in self.portals_on_floor
-            ]
-            origin_choices = (
-                non_portal_origins if non_portal_origins else current_floor_tiles
-            )
-            if not origin_choices:
-                origin_choices = [player_start_pos]
-
+            origin_choices = self._floor_tile_choices(player_start_pos)
             origin_pos = self.random.choice(origin_choices)
 
             self.path_finder.carve_bresenham_line(
@@ -305,12 +282,30 @@ class SingleFloorBuilder(BuilderBase):
             )
 
     def _collect_floor_tiles(self) -> List[tuple[int, int]]:
+        return self._collect_tiles("floor")
+
+    def _collect_tiles(self, tile_type: str) -> List[tuple[int, int]]:
+        """Coordinates of the tiles of tile_type inside the border, row by row."""
         return [
             (x_coord, y_coord)
             for y_coord in range(1, self.height - 1)
             for x_coord in range(1, self.width - 1)
-            if (t := self.world_map.get_tile(x_coord, y_coord)) and t.type == "floor"
+            if (t := self.world_map.get_tile(x_coord, y_coord)) and t.type == tile_type
+        ]
+
+    def _floor_tile_choices(
+        self, fallback: tuple[int, int]
+    ) -> Sequence[tuple[int, int]]:
+        """
+        The floor tiles a random walk or path may start or end at: floor tiles
+        that are not portals, else all floor tiles, else just fallback.
+        """
+        all_floor_tiles = self._collect_floor_tiles()
+        non_portal_floor_tiles = [
+            f for f in all_floor_tiles if f not in self.portals_on_floor
         ]
+        choices = non_portal_floor_tiles if non_portal_floor_tiles else all_floor_tiles
+        return choices if choices else [fallback]
 
     def _try_place_random_entity(self, pos: tuple[int, int]) -> bool:
         x, y = pos
@@ -471,6 +466,19 @@ class SingleFloorBuilder(BuilderBase):
                     )
 
     def build(self) -> Tuple[WorldMap, Tuple[int, int], Tuple[int, int]]:
+        floor_start, floor_poi = self._build_terrain()
+
+        final_floor_tiles = self._collect_floor_tiles()
+        self._place_additional_entities_respecting_portals(
+            final_floor_tiles,
+            floor_start,
+            floor_poi,
+        )
+
+        return self.world_map, floor_start, floor_poi
+
+    def _build_terrain(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Lays out walls, floors and portals; returns the start and POI."""
         if self.width < 10 or self.height < 10:
             raise ValueError(
                 f"Map too small for single floor generation. Minimum size is 10x10, "
@@ -573,12 +581,4 @@ class SingleFloorBuilder(BuilderBase):
                 restored_tile.portal_to_floor_id = original_dest_if_portal
 
         self._ensure_all_floor_tiles_reachable_from_start(floor_start)
-
-        final_floor_tiles = self._collect_floor_tiles()
-        self._place_additional_entities_respecting_portals(
-            final_floor_tiles,
-            floor_start,
-            floor_poi,
-        )
-
-        return self.world_map, floor_start, floor_poi
+        return floor_start, floor_poi
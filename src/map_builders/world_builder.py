@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, List, Tuple
 
 from src.items import QuestItem
+from src.map_builders.compact_floor_builder import CompactFloorBuilder
 from src.map_builders.single_floor_builder import SingleFloorBuilder
 from src.world_map import WorldMap
 
@@ -15,11 +16,15 @@ class WorldBuilder:
         height: int,
         random_generator: "Random",
         num_floors: int = 1,
+        compact: bool = True,
     ):
         self.width = width
         self.height = height
         self.random = random_generator
         self.num_floors = num_floors
+        # Generate floors on compact grids (CompactFloorBuilder); the result
+        # is the same as with SingleFloorBuilder, only faster
+        self.floor_builder = CompactFloorBuilder if compact else SingleFloorBuilder
         self.world_maps: dict[int, WorldMap] = {}
         self.floor_details: list[dict] = []
 
@@ -44,7 +49,7 @@ class WorldBuilder:
                 common_portal_coords = possible_inner_coords[:num_common_portal_coords]
 
         for floor_id in range(self.num_floors):
-            builder = SingleFloorBuilder(
+            builder = self.floor_builder(
                 self.width, self.height, random_generator=self.random
             )
             self.world_maps[floor_id] = builder.world_map
@@ -213,7 +218,7 @@ class WorldBuilder:
         self._initialize_world()
 
         for floor_id in range(self.num_floors):
-            builder = SingleFloorBuilder(
+            builder = self.floor_builder(
                 self.width,
                 self.height,
                 random_generator=self.random,
@@ -223,6 +228,7 @@ class WorldBuilder:
             self.world_maps[floor_id] = world_map
             for fd_item in self.floor_details:
                 if fd_item["id"] == floor_id:
+                    fd_item["map"] = world_map
                     fd_item["start"] = floor_start_pos
                     fd_item["poi"] = floor_poi_pos
                     break
@@ -8,7 +8,9 @@ from src.monster_ai.states.attacking_state import AttackingState
 from src.monster_ai.states.idle_state import IdleState
 
 if TYPE_CHECKING:
+    from src.map_algorithms.distance_field import DistanceFieldCache
     from src.monster import Monster
+    from src.monster_ai.turn import MonsterTurn
     from src.player import Player
     from src.world_map import WorldMap
 
@@ -22,12 +24,18 @@ class MonsterAILogic:
         player: "Player",
         world_map: "WorldMap",
         random_generator: "random.Random",
+        distance_fields: Optional["DistanceFieldCache"] = None,
     ):
         self.monster = monster
         self.player = player
         self.world_map = world_map
         self.random = random_generator
         self.path_finder = PathFinder()
+        # When set, chasing descends a distance field to the player that is
+        # shared by every monster on the floor instead of running A* per monster.
+        self.distance_fields = distance_fields
+        # The floor's shared MonsterTurn while get_next_action runs, if any
+        self.turn: Optional["MonsterTurn"] = None
         self.state: "AIState" = IdleState(self)
 
     def _get_state(self, state_name: str) -> "AIState":
@@ -38,11 +46,28 @@ class MonsterAILogic:
         else:
             raise ValueError(f"Unknown state name: {state_name}")
 
-    def get_next_action(self) -> Optional[Tuple[str, Optional[str]]]:
-        next_state_name = self.state.handle_transitions()
-        if next_state_name != self.state.__class__.__name__:
-            self.state = self._get_state(next_state_name)
-        return self.state.get_next_action()
+    def get_next_action(
+        self, turn: Optional["MonsterTurn"] = None
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Decides the monster's action for this turn.
+
+        Args:
+            turn: Line-of-sight and distance data shared by the monsters of
+                  the floor this turn. Ignored unless it matches the
+                  monster's map and the player's position.
+        """
+        if turn is not None and turn.is_current(
+            self.world_map, self.player.x, self.player.y
+        ):
+            self.turn = turn
+        try:
+            next_state_name = self.state.handle_transitions()
+            if next_state_name != self.state.__class__.__name__:
+                self.state = self._get_state(next_state_name)
+            return self.state.get_next_action()
+        finally:
+            self.turn = None
 
     def _get_line_tiles(
         self, x1: int, y1: int, x2: int, y2: int
@@ -103,9 +128,7 @@ class MonsterAILogic:
         if distance > self.monster.line_of_sight:
             return False
 
-        return self._has_clear_line_of_sight(
-            self.monster.x, self.monster.y, self.player.x, self.player.y
-        )
+        return self._has_clear_line_to_player()
 
     def is_player_in_attack_range(self) -> bool:
         """
@@ -121,20 +144,36 @@ class MonsterAILogic:
             return True
 
         # For ranged attacks, ensure clear line of sight
+        return self._has_clear_line_to_player()
+
+    def _has_clear_line_to_player(self) -> bool:
+        if self.turn is not None:
+            return self.turn.has_clear_line(self.monster.x, self.monster.y)
         return self._has_clear_line_of_sight(
             self.monster.x, self.monster.y, self.player.x, self.player.y
         )
 
     def move_towards_player(self) -> Optional[Tuple[str, Optional[str]]]:
-        path = self.path_finder.a_star_search(
-            self.world_map,
-            (self.monster.x, self.monster.y),
-            (self.player.x, self.player.y),
-            self.world_map.width,
-            self.world_map.height,
-        )
-        if path and len(path) > 1:
-            next_x, next_y = path[1]
+        if self.turn is not None:
+            next_step = self.turn.distance_field.next_step(
+                self.monster.x, self.monster.y
+            )
+        elif self.distance_fields is not None:
+            field = self.distance_fields.get(
+                self.world_map, [(self.player.x, self.player.y)]
+            )
+            next_step = field.next_step(self.monster.x, self.monster.y)
+        else:
+            path = self.path_finder.a_star_search(
+                self.world_map,
+                (self.monster.x, self.monster.y),
+                (self.player.x, self.player.y),
+                self.world_map.width,
+                self.world_map.height,
+            )
+            next_step = path[1] if path and len(path) > 1 else None
+        if next_step:
+            next_x, next_y = next_step
             dx = next_x - self.monster.x
             dy = next_y - self.monster.y
             if dx == 0 and dy == -1:
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Optional, Set, Tuple
+
+from src.map_algorithms.distance_field import DistanceField
+from src.map_algorithms.line_of_sight import calculate_visible_tiles_shadowcast
+
+if TYPE_CHECKING:
+    from src.map_algorithms.distance_field import DistanceFieldCache
+    from src.world_map import WorldMap
+
+
+class MonsterTurn:
+    """
+    What the monsters of one floor share while taking their turns: the
+    distance field to the player, and the tiles the player can see.
+
+    Symmetric shadowcasting sees a tile from the player exactly when the
+    player is seen from that tile, so one field of view from the player
+    answers the line-of-sight check of every monster on the floor.
+
+    Both only depend on the terrain and the player's position, which do not
+    change while monsters act, so each is worked out once per turn however
+    many monsters ask. Monster positions do not matter: monsters block
+    neither sight nor the distance field.
+
+    Args:
+        world_map: The floor the monsters are on.
+        player_x: The player's x position for this turn.
+        player_y: The player's y position for this turn.
+        distance_fields: Cache to get the distance field from; one is built
+                         for this turn if omitted.
+    """
+
+    def __init__(
+        self,
+        world_map: "WorldMap",
+        player_x: int,
+        player_y: int,
+        distance_fields: Optional["DistanceFieldCache"] = None,
+    ):
+        self.world_map = world_map
+        self.player_x = player_x
+        self.player_y = player_y
+        self.version = world_map.version
+        self._distance_fields = distance_fields
+        self._distance_field: Optional[DistanceField] = None
+        # Field of view from the player, widened as farther monsters ask
+        self._visible: Set[Tuple[int, int]] = set()
+        self._view_radius = -1
+
+    def is_current(self, world_map: "WorldMap", player_x: int, player_y: int) -> bool:
+        """Whether the turn still describes world_map and the player's position."""
+        return (
+            world_map is self.world_map
+            and world_map.version == self.version
+            and player_x == self.player_x
+            and player_y == self.player_y
+        )
+
+    @property
+    def distance_field(self) -> DistanceField:
+        """Steps from every tile to the player, built on first use."""
+        if self._distance_field is None:
+            sources = [(self.player_x, self.player_y)]
+            if self._distance_fields is not None:
+                self._distance_field = self._distance_fields.get(
+                    self.world_map, sources
+                )
+            else:
+                self._distance_field = DistanceField.from_sources(
+                    self.world_map, sources
+                )
+        return self._distance_field
+
+    def has_clear_line(self, x: int, y: int) -> bool:
+        """
+        Whether (x, y) and the player can see each other. The field of view
+        is only recomputed when (x, y) lies beyond its current radius.
+
+        Args:
+            x: The x-coordinate to look from.
+            y: The y-coordinate to look from.
+        """
+        radius = math.ceil(math.hypot(x - self.player_x, y - self.player_y))
+        if radius > self._view_radius:
+            self._visible = calculate_visible_tiles_shadowcast(
+                self.world_map, self.player_x, self.player_y, radius
+            )
+            self._view_radius = radius
+        return (x, y) in self._visible
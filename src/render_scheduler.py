@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class RenderScheduler:
+    """
+    Paces rendering to a target frame rate, independently of how fast the
+    game is simulated.
+
+    The game loop asks frame_due() after every turn and only renders when it
+    returns True, so turns played between two frames are never drawn. The
+    caller is responsible for always rendering the final state.
+
+    Args:
+        target_fps: Frames to present per second at most.
+        clock: Returns the current time in seconds; time.monotonic by default.
+
+    Attributes:
+        frames_rendered: Frames frame_due() allowed so far.
+        frames_skipped: Frames frame_due() dropped so far.
+    """
+
+    def __init__(self, target_fps: float, clock: Callable[[], float] = time.monotonic):
+        if target_fps <= 0:
+            raise ValueError(f"target_fps must be positive, got {target_fps}")
+        self.frame_interval = 1.0 / target_fps
+        self._clock = clock
+        self._next_frame_time: float | None = None
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+    def frame_due(self) -> bool:
+        """
+        Returns True if a frame should be rendered now, and if so schedules
+        the next one a frame interval later. The first call is always due.
+        """
+        now = self._clock()
+        if self._next_frame_time is not None and now < self._next_frame_time:
+            self.frames_skipped += 1
+            return False
+        # Scheduled from now rather than from the missed deadline, so a slow
+        # frame is not followed by a burst of catch-up frames
+        self._next_frame_time = now + self.frame_interval
+        self.frames_rendered += 1
+        return True
@@ -1,14 +1,22 @@
 import curses  # Changed from shutil to curses for terminal size
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from itertools import compress
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from src.array_world_map import TILE_TYPE_NAMES, ArrayWorldMap
 from src.input_mode import InputMode
 from src.message_log import MessageLog
-from src.tile import TILE_SYMBOLS
+from src.tile import ENTITY_SYMBOLS, TILE_SYMBOLS
 from src.world_map import WorldMap
 
 if TYPE_CHECKING:
     from src.player import Player
 
+# Maps ArrayWorldMap.explored bytes to 1 for unexplored cells, else 0
+_UNEXPLORED = bytes([1]) + bytes(255)
+
+# What a cell holds after erase(): a space in the default colors
+_BLANK_CELL = (" ", 0)
+
 
 class Renderer:
     def __init__(
@@ -19,6 +27,11 @@ class Renderer:
         self.map_height = map_height
         self.player_symbol = player_symbol
         self.stdscr = None
+        # The (char, attr) rows last written to the screen, and the screen
+        # size they were written for; None until the first curses frame
+        self._back_buffer: Optional[List[List[Tuple[str, int]]]] = None
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._display_attrs: Optional[Dict[str, int]] = None
 
         if self.debug_mode:
             self.FLOOR_COLOR_PAIR = 0
@@ -77,44 +90,12 @@ class Renderer:
             print("Error: Renderer.stdscr not initialized for curses rendering.")
             return None
 
+        path_overlay = _path_overlay(ai_path, current_floor_id)
+
         if debug_render_to_list or self.debug_mode:
-            output_buffer = []
-            for y_map in range(world_map_to_render.height):
-                row_str = ""
-                for x_map in range(world_map_to_render.width):
-                    char_to_draw = ""
-                    # is_path_tile = False # Not used in debug list rendering directly
-                    if x_map == player_x and y_map == player_y:
-                        char_to_draw = self.player_symbol
-                    elif ai_path:
-                        path_segment_on_current_floor = [
-                            (px, py)
-                            for px, py, pf_id in ai_path
-                            if pf_id == current_floor_id
-                        ]
-                        current_coord_xy = (x_map, y_map)
-                        if path_segment_on_current_floor:
-                            if (
-                                current_coord_xy == (ai_path[-1][0], ai_path[-1][1])
-                                and current_floor_id == ai_path[-1][2]
-                            ):
-                                char_to_draw = "x"
-                                # is_path_tile = True # Not used for list output
-                            elif current_coord_xy in path_segment_on_current_floor:
-                                char_to_draw = "*"
-                                # is_path_tile = True # Not used for list output
-
-                    if not char_to_draw:
-                        tile = world_map_to_render.get_tile(x_map, y_map)
-                        if tile:
-                            # In debug/list mode, fog is implicitly handled by
-                            # tile.get_display_info if visible_map is passed
-                            symbol, _ = tile.get_display_info(apply_fog=apply_fog)
-                            char_to_draw = symbol
-                        else:  # Should not happen if map is complete
-                            char_to_draw = TILE_SYMBOLS.get("fog", " ")
-                    row_str += char_to_draw
-                output_buffer.append(row_str)
+            output_buffer = self._map_text_rows(
+                world_map_to_render, player_x, player_y, path_overlay, apply_fog
+            )
 
             output_buffer.append(f"HP: {player_health}")
             output_buffer.append(f"Floor: {current_floor_id}")
@@ -130,11 +111,11 @@ class Renderer:
                 output_buffer.append(msg_debug)
             return output_buffer
 
-        # Curses rendering path (remains largely the same)
+        # Curses rendering path: the frame is composed as (char, attr) cells
+        # and only cells that differ from the previous frame are written
         if not self.stdscr:
             print("Critical Error: stdscr is None during curses rendering attempt.")
             return None
-        self.stdscr.clear()
         UI_LINES_BUFFER = 7 if ai_state else 5
         try:
             curses_lines = curses.LINES
@@ -169,34 +150,24 @@ class Renderer:
                 0, min(viewport_x_offset, self.map_width - viewport_width)
             )
 
+        display_attrs = self._get_display_attrs()
+        default_attr = display_attrs["default"]
+        fog_symbol = TILE_SYMBOLS.get("fog", " ")
+        frame: List[List[Tuple[str, int]]] = []
         for screen_y in range(viewport_height):
-            current_screen_x = 0
             map_y = screen_y + viewport_y_offset
+            row: List[Tuple[str, int]] = []
             for screen_x in range(viewport_width):
-                if current_screen_x >= viewport_width:
-                    break
                 map_x = screen_x + viewport_x_offset
                 char_to_draw = ""
-                color_attribute = curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR)
+                color_attribute = default_attr
 
                 if map_x == player_x and map_y == player_y:
                     char_to_draw = self.player_symbol
-                    color_attribute = curses.color_pair(self.PLAYER_COLOR_PAIR)
-                elif ai_path:
-                    path_segment = [
-                        (px, py) for px, py, fid in ai_path if fid == current_floor_id
-                    ]
-                    current_xy = (map_x, map_y)
-                    if current_xy in path_segment:
-                        # If current_xy is the last point of ai_path on current floor
-                        if (
-                            current_xy == (ai_path[-1][0], ai_path[-1][1])
-                            and current_floor_id == ai_path[-1][2]
-                        ):
-                            char_to_draw = "x"
-                        else:
-                            char_to_draw = "*"
-                        color_attribute = curses.color_pair(self.PATH_COLOR_PAIR)
+                    color_attribute = display_attrs["player"]
+                elif path_overlay and (map_x, map_y) in path_overlay:
+                    char_to_draw = path_overlay[(map_x, map_y)]
+                    color_attribute = display_attrs["path"]
 
                 if not char_to_draw:  # If not player or path tile already set
                     tile = world_map_to_render.get_tile(map_x, map_y)
@@ -206,167 +177,169 @@ class Renderer:
                         char_to_draw, display_type = tile.get_display_info(
                             apply_fog=True, show_visibility=True
                         )
-                        if display_type == "monster":
-                            color_attribute = curses.color_pair(self.MONSTER_COLOR_PAIR)
-                        elif display_type == "item":
-                            color_attribute = curses.color_pair(self.ITEM_COLOR_PAIR)
-                        elif display_type == "wall":
-                            color_attribute = curses.color_pair(self.WALL_COLOR_PAIR)
-                        elif display_type == "wall_dim":
-                            color_attribute = curses.color_pair(
-                                self.WALL_DIM_COLOR_PAIR
-                            )
-                        elif display_type == "floor":
-                            color_attribute = curses.color_pair(self.FLOOR_COLOR_PAIR)
-                        elif display_type == "floor_dim":
-                            color_attribute = curses.color_pair(
-                                self.FLOOR_DIM_COLOR_PAIR
-                            )
-                        elif display_type == "portal_dim":
-                            color_attribute = curses.color_pair(
-                                self.FLOOR_DIM_COLOR_PAIR
-                            )
-                        elif display_type == "fog":
-                            color_attribute = curses.color_pair(
-                                self.DEFAULT_TEXT_COLOR_PAIR
-                            )
-                            if char_to_draw == " ":
-                                color_attribute = curses.color_pair(
-                                    0
-                                )  # Use default bg for space fog
-                        # else default color pair
+                        color_attribute = display_attrs.get(display_type, default_attr)
+                        if display_type == "fog" and char_to_draw == " ":
+                            # Use default bg for space fog
+                            color_attribute = display_attrs["blank"]
                     else:  # Should not happen
-                        char_to_draw = TILE_SYMBOLS.get("fog", " ")
-                        color_attribute = (
-                            curses.color_pair(0)
-                            if char_to_draw == " "
-                            else curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR)
-                        )
-
-                try:
-                    self.stdscr.addstr(
-                        screen_y, current_screen_x, char_to_draw, color_attribute
-                    )
-                except curses.error:
-                    break
-                current_screen_x += 1
-
-        next_line_y = viewport_height
-        if next_line_y < curses_lines:
-            try:
-                self.stdscr.addstr(
-                    next_line_y,
-                    0,
-                    f"HP: {player_health}",
-                    curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                )
-                next_line_y += 1
-            except curses.error:
-                pass
-
-        if next_line_y < curses_lines:
-            try:
-                self.stdscr.addstr(
-                    next_line_y,
-                    0,
-                    f"Floor: {current_floor_id}",
-                    curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                )
-                next_line_y += 1
-            except curses.error:
-                pass
-
-        if next_line_y < curses_lines:
-            try:
-                self.stdscr.addstr(
-                    next_line_y,
-                    0,
-                    f"MODE: {input_mode.name.upper()}",
-                    curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                )
-                next_line_y += 1
-            except curses.error:
-                pass
-
+                        char_to_draw = fog_symbol
+                        if char_to_draw == " ":
+                            color_attribute = display_attrs["blank"]
+
+                row.append((char_to_draw, color_attribute))
+            frame.append(row)
+
+        status_lines = [
+            f"HP: {player_health}",
+            f"Floor: {current_floor_id}",
+            f"MODE: {input_mode.name.upper()}",
+        ]
         if ai_state:
-            if next_line_y < curses_lines:
-                try:
-                    self.stdscr.addstr(
-                        next_line_y,
-                        0,
-                        f"AI State: {ai_state}",
-                        curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                    )
-                    next_line_y += 1
-                except curses.error:
-                    pass
-            if next_line_y < curses_lines:
-                try:
-                    self.stdscr.addstr(
-                        next_line_y,
-                        0,
-                        f"Position: ({player_x}, {player_y})",
-                        curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                    )
-                    next_line_y += 1
-                except curses.error:
-                    pass
-
-        message_start_y = next_line_y
+            status_lines.append(f"AI State: {ai_state}")
+            status_lines.append(f"Position: ({player_x}, {player_y})")
         if input_mode == InputMode.COMMAND:
-            if message_start_y < curses_lines:
-                try:
-                    prompt = f"> {current_command_buffer}"
-                    self.stdscr.addstr(
-                        message_start_y,
-                        0,
-                        prompt[: curses_cols - 1],
-                        curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                    )
-                    message_start_y += 1
-                except curses.error:
-                    pass
+            status_lines.append(f"> {current_command_buffer}")
+        for text in status_lines:
+            if len(frame) >= curses_lines:
+                break
+            frame.append([(char, default_attr) for char in text[: curses_cols - 1]])
 
-        available_lines_for_log = curses_lines - message_start_y
+        available_lines_for_log = curses_lines - len(frame)
         if available_lines_for_log > 0:
             messages = message_log.get_messages()
             num_to_display = min(len(messages), available_lines_for_log)
-            start_idx = max(0, len(messages) - num_to_display)
-
-            rendered_count = 0
-            for i, msg_text in enumerate(messages[start_idx:]):
-                msg_y = message_start_y + i
-                if msg_y < curses_lines:
-                    try:
-                        self.stdscr.move(msg_y, 0)
-                        self.stdscr.clrtoeol()
-                        self.stdscr.addstr(
-                            msg_y,
-                            0,
-                            msg_text[: curses_cols - 1],
-                            curses.color_pair(self.DEFAULT_TEXT_COLOR_PAIR),
-                        )
-                        rendered_count += 1
-                    except curses.error:
-                        break
-                else:
-                    break
+            for msg_text in messages[len(messages) - num_to_display :]:
+                frame.append(
+                    [(char, default_attr) for char in msg_text[: curses_cols - 1]]
+                )
+
+        self._present(frame)
+        return None
 
-            # Clear lines not used by current messages but part of log area
-            # This uses message_log.max_messages to know how many lines log *could* take
-            for i in range(rendered_count, message_log.max_messages):
-                msg_y = message_start_y + i
-                if msg_y < curses_lines:
-                    try:
-                        self.stdscr.move(msg_y, 0)
-                        self.stdscr.clrtoeol()
-                    except curses.error:
-                        break
-                else:
+    def _map_text_rows(
+        self,
+        world_map: WorldMap,
+        player_x: int,
+        player_y: int,
+        path_overlay: Dict[Tuple[int, int], str],
+        apply_fog: bool,
+    ) -> List[str]:
+        """
+        The map as one string per row for list rendering: the player, then
+        path markers, then what tile.get_display_info(apply_fog) shows.
+        """
+        glyphs = _map_glyphs(world_map, apply_fog)
+        if glyphs is None:
+            return self._map_text_rows_per_tile(
+                world_map, player_x, player_y, path_overlay, apply_fog
+            )
+
+        width = world_map.width
+        patches = dict(path_overlay)
+        if self.player_symbol:
+            patches[(player_x, player_y)] = self.player_symbol
+        for (x, y), char in patches.items():
+            if 0 <= x < width and 0 <= y < world_map.height:
+                glyphs[y * width + x] = char
+        return [
+            "".join(glyphs[row_start : row_start + width])
+            for row_start in range(0, width * world_map.height, width)
+        ]
+
+    def _map_text_rows_per_tile(
+        self,
+        world_map: WorldMap,
+        player_x: int,
+        player_y: int,
+        path_overlay: Dict[Tuple[int, int], str],
+        apply_fog: bool,
+    ) -> List[str]:
+        """_map_text_rows for any map, asking every tile for its symbol."""
+        rows = []
+        for y_map in range(world_map.height):
+            row_str = ""
+            for x_map in range(world_map.width):
+                char_to_draw = ""
+                if x_map == player_x and y_map == player_y:
+                    char_to_draw = self.player_symbol
+                elif path_overlay:
+                    char_to_draw = path_overlay.get((x_map, y_map), "")
+
+                if not char_to_draw:
+                    tile = world_map.get_tile(x_map, y_map)
+                    if tile:
+                        # In debug/list mode, fog is implicitly handled by
+                        # tile.get_display_info if visible_map is passed
+                        symbol, _ = tile.get_display_info(apply_fog=apply_fog)
+                        char_to_draw = symbol
+                    else:  # Should not happen if map is complete
+                        char_to_draw = TILE_SYMBOLS.get("fog", " ")
+                row_str += char_to_draw
+            rows.append(row_str)
+        return rows
+
+    def invalidate(self) -> None:
+        """
+        Forgets what is on screen, so the next render_all repaints every
+        cell. Needed after anything else draws to or clears the screen.
+        """
+        self._back_buffer = None
+
+    def _get_display_attrs(self) -> Dict[str, int]:
+        """
+        Curses attributes by display type (see Tile.get_display_info), plus
+        "player", "path", "default" and "blank" (space fog).
+        """
+        if self._display_attrs is None:
+            pairs = {
+                "monster": self.MONSTER_COLOR_PAIR,
+                "item": self.ITEM_COLOR_PAIR,
+                "wall": self.WALL_COLOR_PAIR,
+                "wall_dim": self.WALL_DIM_COLOR_PAIR,
+                "floor": self.FLOOR_COLOR_PAIR,
+                "floor_dim": self.FLOOR_DIM_COLOR_PAIR,
+                "portal_dim": self.FLOOR_DIM_COLOR_PAIR,
+                "fog": self.DEFAULT_TEXT_COLOR_PAIR,
+                "player": self.PLAYER_COLOR_PAIR,
+                "path": self.PATH_COLOR_PAIR,
+                "default": self.DEFAULT_TEXT_COLOR_PAIR,
+                "blank": 0,
+            }
+            self._display_attrs = {
+                name: curses.color_pair(pair) for name, pair in pairs.items()
+            }
+        return self._display_attrs
+
+    def _present(self, frame: List[List[Tuple[str, int]]]) -> None:
+        """
+        Writes the cells of frame that differ from the back buffer (the last
+        frame presented) and updates the terminal once.
+
+        Args:
+            frame: Rows of (char, attr) cells, starting at the top left.
+        """
+        assert self.stdscr is not None
+        screen_size = self.stdscr.getmaxyx()
+        previous = self._back_buffer
+        if previous is None or screen_size != self._screen_size:
+            self.stdscr.erase()
+            previous = []
+            self._screen_size = screen_size
+
+        for screen_y in range(max(len(frame), len(previous))):
+            new_row = frame[screen_y] if screen_y < len(frame) else []
+            old_row = previous[screen_y] if screen_y < len(previous) else []
+            if new_row == old_row:
+                continue
+            for screen_x, text, attr in _changed_runs(old_row, new_row):
+                try:
+                    self.stdscr.addstr(screen_y, screen_x, text, attr)
+                except curses.error:
                     break
 
-        self.stdscr.refresh()
-        return None
+        self._back_buffer = frame
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
     def render_inventory(self, player: "Player") -> Optional[List[str]]:
         if self.debug_mode:
@@ -391,6 +364,7 @@ class Renderer:
             return None
 
         self.stdscr.clear()
+        self.invalidate()
         height, width = self.stdscr.getmaxyx()
 
         # Title
@@ -437,3 +411,90 @@ class Renderer:
             curses.echo()
             curses.nocbreak()
             curses.endwin()
+
+
+def _map_glyphs(world_map: WorldMap, apply_fog: bool) -> Optional[List[str]]:
+    """
+    The symbol Tile.get_display_info(apply_fog) gives each cell of the map,
+    row-major, built from the terrain in bulk with the monsters and items
+    patched in from the map's entity index. Returns None for map classes
+    other than WorldMap and ArrayWorldMap, whose tiles may draw differently.
+    """
+    terrain_symbols = {
+        "wall": TILE_SYMBOLS["wall"],
+        "floor": TILE_SYMBOLS["floor"],
+    }
+    unknown = TILE_SYMBOLS["unknown"]
+    portal = TILE_SYMBOLS["portal"]
+    fog = TILE_SYMBOLS["fog"]
+
+    if type(world_map) is ArrayWorldMap:
+        code_symbols = [terrain_symbols.get(name, unknown) for name in TILE_TYPE_NAMES]
+        glyphs = [code_symbols[code] for code in world_map.tile_types]
+        for index in compress(range(len(glyphs)), world_map.portal_flags):
+            glyphs[index] = portal
+        unexplored = world_map.explored.translate(_UNEXPLORED) if apply_fog else bytes()
+    elif type(world_map) is WorldMap:
+        glyphs = [
+            portal if tile.is_portal else terrain_symbols.get(tile.type, unknown)
+            for row in world_map.grid
+            for tile in row
+        ]
+        unexplored = (
+            bytes(not tile.is_explored for row in world_map.grid for tile in row)
+            if apply_fog
+            else bytes()
+        )
+    else:
+        return None
+
+    width = world_map.width
+    for x, y, _ in world_map.get_items():
+        glyphs[y * width + x] = ENTITY_SYMBOLS["item"]
+    for x, y, _ in world_map.get_monsters_with_positions():
+        glyphs[y * width + x] = ENTITY_SYMBOLS["monster"]
+    for index in compress(range(len(unexplored)), unexplored):
+        glyphs[index] = fog
+    return glyphs
+
+
+def _path_overlay(
+    ai_path: Optional[List[Tuple[int, int, int]]], floor_id: int
+) -> Dict[Tuple[int, int], str]:
+    """
+    The path markers to draw on a floor, by (x, y): "*" for each step of
+    ai_path on the floor, and "x" for its final step if that is on the floor.
+    """
+    if not ai_path:
+        return {}
+    overlay = {(x, y): "*" for x, y, path_floor in ai_path if path_floor == floor_id}
+    goal_x, goal_y, goal_floor = ai_path[-1]
+    if goal_floor == floor_id:
+        overlay[(goal_x, goal_y)] = "x"
+    return overlay
+
+
+def _changed_runs(
+    old_row: List[Tuple[str, int]], new_row: List[Tuple[str, int]]
+) -> List[Tuple[int, str, int]]:
+    """
+    Compares two rows of (char, attr) cells and returns what must be written
+    to turn the first into the second, as (x, text, attr) runs of adjacent
+    changed cells sharing one attr. Cells only in old_row are blanked.
+    """
+    runs: List[Tuple[int, str, int]] = []
+    run_x, run_chars, run_attr = -1, [], 0
+    for x in range(max(len(old_row), len(new_row))):
+        cell = new_row[x] if x < len(new_row) else _BLANK_CELL
+        if x < len(old_row) and old_row[x] == cell:
+            continue
+        char, attr = cell
+        if run_chars and attr == run_attr and run_x + len(run_chars) == x:
+            run_chars.append(char)
+            continue
+        if run_chars:
+            runs.append((run_x, "".join(run_chars), run_attr))
+        run_x, run_chars, run_attr = x, [char], attr
+    if run_chars:
+        runs.append((run_x, "".join(run_chars), run_attr))
+    return runs
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum, auto
+
+from src.game_state import GameState
+
+
+class RunLimit(Enum):
+    """The GameEngine.run budget that stopped a game."""
+
+    MAX_TURNS = auto()
+    MAX_SECONDS = auto()
+
+
+@dataclass
+class RunResult:
+    """
+    Summary of a game played by GameEngine.run.
+
+    Attributes:
+        game_state: The state the game ended in.
+        turns: Number of turns played.
+        seconds: Wall-clock time spent in the game loop.
+        player_health: The player's health when the game ended.
+        limit_reached: The budget that cut the game short, or None if the
+                       game ended on its own.
+        player_won: True if the player picked up the quest item. Games that
+                    end any other way (death, quitting, an error, a budget)
+                    are not wins.
+    """
+
+    game_state: GameState
+    turns: int
+    seconds: float
+    player_health: int
+    limit_reached: RunLimit | None = None
+    player_won: bool = False
@@ -1,9 +1,15 @@
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
 from src.input_mode import InputMode
+from src.items import Item
+from src.items.categories import item_category
 from src.monster import Monster
 from src.player import Player
 from src.tile import Tile
 
-from src.items import Item
+# How many terrain changes terrain_changes_since can replay
+TERRAIN_LOG_SIZE = 1024
 
 
 class WorldMap:
@@ -15,6 +21,26 @@ class WorldMap:
         height (int): The height of the map in tiles.
         grid (List[List[Tile]]): The 2D list representing the map, where
                                  grid[y][x] is the Tile at coordinates (x,y).
+
+        version (int): Incremented whenever terrain changes through
+                       set_tile_type, record_terrain_changes or
+                       mark_changed, so derived data (e.g. distance fields)
+                       can be cached per version.
+        changed_tiles (Set[Tuple[int, int]]): (x, y) of cells whose type,
+                       item or monster changed through the map's methods
+                       since the last take_changed_tiles() call.
+
+    The last TERRAIN_LOG_SIZE changed cells of set_tile_type and
+    record_terrain_changes are also logged with the version they produced
+    (whole versions only), so a consumer of derived data can ask which
+    cells changed since the version it last saw (terrain_changes_since)
+    instead of rebuilding everything.
+
+    Monsters and items placed through place_monster/place_item (and moved
+    with move_monster) are also tracked in a position index, so entity
+    queries cost O(entities) instead of a scan over every tile. Items are
+    additionally bucketed by src.items.categories category. Code that
+    assigns tile.monster/tile.item directly must call reindex_entities().
     """
 
     def __init__(self, width: int, height: int):
@@ -34,6 +60,109 @@ class WorldMap:
         self.grid = [
             [Tile(tile_type="floor") for _ in range(width)] for _ in range(height)
         ]
+        self._init_change_tracking()
+        self._init_entity_index()
+
+    def _init_change_tracking(self) -> None:
+        """Resets the version, the changed cell set and the terrain log."""
+        self.version = 0
+        self.changed_tiles: Set[Tuple[int, int]] = set()
+        # (version after the change, x, y) per changed cell
+        self._terrain_log: Deque[Tuple[int, int, int]] = deque()
+
+    def _record_terrain_change(self, x: int, y: int) -> None:
+        """Bumps the version for a set_tile_type change of (x, y)."""
+        self.record_terrain_changes([(x, y)])
+
+    def record_terrain_changes(self, cells: List[Tuple[int, int]]) -> None:
+        """
+        Bumps the version once for cells edited directly (e.g. assigning
+        tile.type or tile.is_explored), logging them so terrain_changes_since
+        can replay the edit. Cheaper for consumers than mark_changed.
+
+        Args:
+            cells: The (x, y) of the edited cells.
+        """
+        self.version += 1
+        self.changed_tiles.update(cells)
+        log = self._terrain_log
+        if len(cells) > TERRAIN_LOG_SIZE:
+            log.clear()
+            return
+        # Drop the oldest versions whole, so a logged version is never partial
+        while len(log) + len(cells) > TERRAIN_LOG_SIZE:
+            oldest = log[0][0]
+            while log and log[0][0] == oldest:
+                log.popleft()
+        log.extend((self.version, x, y) for x, y in cells)
+
+    def mark_changed(self) -> None:
+        """
+        Bumps the map version. Call after editing tiles directly (e.g.
+        assigning tile.type) so cached derived data is recomputed.
+        """
+        self.version += 1
+        # The edits are unknown, so earlier versions can no longer be replayed
+        self._terrain_log.clear()
+
+    def terrain_changes_since(self, version: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Returns the cells changed by set_tile_type or record_terrain_changes
+        since `version`.
+
+        Args:
+            version: A value of `version` seen earlier.
+
+        Returns:
+            The (x, y) of every change after `version`, oldest first (a cell
+            may repeat), or None if they are not all known: the log has
+            overflowed, or mark_changed was called in between.
+        """
+        if version == self.version:
+            return []
+        log = self._terrain_log
+        if version > self.version or not log or log[0][0] > version + 1:
+            return None
+        return [(x, y) for change_version, x, y in log if change_version > version]
+
+    def take_changed_tiles(self) -> Set[Tuple[int, int]]:
+        """
+        Returns the cells changed since the previous call and starts a new
+        change set. Direct edits followed by mark_changed() are not listed
+        individually; compare `version` to catch those.
+        """
+        changed = self.changed_tiles
+        self.changed_tiles = set()
+        return changed
+
+    def _init_entity_index(self) -> None:
+        """Resets the position index of monsters and items."""
+        self._monsters_by_pos: Dict[Tuple[int, int], Monster] = {}
+        self._monster_positions: Dict[Monster, Tuple[int, int]] = {}
+        self._items_by_pos: Dict[Tuple[int, int], Item] = {}
+        self._items_by_category: Dict[str, Dict[Tuple[int, int], Item]] = {}
+
+    def reindex_entities(self) -> None:
+        """
+        Rebuilds the entity index from the tiles.
+
+        Only needed after tiles were modified without going through the
+        place_*/remove_* methods (e.g. assigning tile.monster directly).
+        """
+        self.changed_tiles.update(self._monsters_by_pos)
+        self.changed_tiles.update(self._items_by_pos)
+        self._init_entity_index()
+        for y, x in self.iter_coords():
+            tile = self.get_tile(x, y)
+            if not tile:
+                continue
+            if tile.monster or tile.item:
+                self.changed_tiles.add((x, y))
+            if tile.monster:
+                self._monsters_by_pos[(x, y)] = tile.monster
+                self._monster_positions[tile.monster] = (x, y)
+            if tile.item:
+                self._index_item(tile.item, x, y)
 
     def iter_coords(self):
         """Returns an iterator over all coordinates in the map."""
@@ -84,6 +213,7 @@ class WorldMap:
         tile = self.get_tile(x, y)
         if tile:
             tile.type = tile_type  # Update the tile's base type
+            self._record_terrain_change(x, y)
             return True
         return False  # Tile not found (out of bounds)
 
@@ -122,6 +252,8 @@ class WorldMap:
         tile = self.get_tile(x, y)
         if tile and tile.item is None:  # Check if tile exists and is empty of items
             tile.item = item
+            self._index_item(item, x, y)
+            self.changed_tiles.add((x, y))
             return True
         return False  # Tile not found or already has an item
 
@@ -140,6 +272,11 @@ class WorldMap:
         if tile and tile.item is not None:
             item_removed = tile.item
             tile.item = None  # Clear the item from the tile
+            if self._items_by_pos.pop((x, y), None) is not None:
+                bucket = self._items_by_category.get(item_category(item_removed))
+                if bucket:
+                    bucket.pop((x, y), None)
+            self.changed_tiles.add((x, y))
             return item_removed
         return None  # No item to remove or tile not found
 
@@ -164,6 +301,9 @@ class WorldMap:
             tile.monster = monster
             monster.x = x  # Update monster's own position tracking
             monster.y = y
+            self._monsters_by_pos[(x, y)] = monster
+            self._monster_positions[monster] = (x, y)
+            self.changed_tiles.add((x, y))
             return True
         return False  # Tile not found or already has a monster
 
@@ -182,9 +322,33 @@ class WorldMap:
         if tile and tile.monster is not None:
             monster_removed = tile.monster
             tile.monster = None  # Clear the monster from the tile
+            self._monsters_by_pos.pop((x, y), None)
+            if self._monster_positions.get(monster_removed) == (x, y):
+                del self._monster_positions[monster_removed]
+            self.changed_tiles.add((x, y))
             return monster_removed
         return None  # No monster to remove or tile not found
 
+    def move_monster(self, monster: Monster, x: int, y: int) -> bool:
+        """
+        Moves a Monster from its current tile to the specified coordinates.
+
+        Args:
+            monster: The Monster object to move.
+            x: The destination x-coordinate.
+            y: The destination y-coordinate.
+
+        Returns:
+            True if the monster was moved, False if the destination is out of
+            bounds or already holds a monster.
+        """
+        destination = self.get_tile(x, y)
+        if not destination or destination.monster is not None:
+            return False
+        old_x, old_y = self._monster_positions.get(monster, (monster.x, monster.y))
+        self.remove_monster(old_x, old_y)
+        return self.place_monster(monster, x, y)
+
     def place_player(self, player: Player, x: int, y: int) -> bool:
         """
         Places the Player on the tile at the specified coordinates.
@@ -210,22 +374,73 @@ class WorldMap:
         """
         Returns the tile that contains the given monster.
         """
-        for y, x in self.iter_coords():
-            tile = self.get_tile(x, y)
-            if tile and tile.monster == monster:
-                return tile
-        return None
+        pos = self._monster_positions.get(monster)
+        if pos is None:
+            return None
+        return self.get_tile(pos[0], pos[1])
 
-    def get_monsters(self):
+    def get_monster_position(self, monster: Monster) -> Optional[Tuple[int, int]]:
         """
-        Returns a list of all monsters on the map.
+        Returns the (x, y) position of the given monster, or None if it is not
+        on this map.
         """
-        monsters = []
-        for y, x in self.iter_coords():
-            tile = self.get_tile(x, y)
-            if tile and tile.monster:
-                monsters.append(tile.monster)
-        return monsters
+        return self._monster_positions.get(monster)
+
+    def get_monster_at(self, x: int, y: int) -> Optional[Monster]:
+        """
+        Returns the monster at (x, y), or None.
+        """
+        return self._monsters_by_pos.get((x, y))
+
+    def get_monsters(self) -> List[Monster]:
+        """
+        Returns a list of all monsters on the map, in row-major (y, x) order.
+        """
+        return [
+            monster
+            for _, monster in sorted(
+                self._monsters_by_pos.items(), key=lambda entry: entry[0][::-1]
+            )
+        ]
+
+    def get_monsters_with_positions(self) -> List[Tuple[int, int, Monster]]:
+        """
+        Returns (x, y, monster) for every monster on the map, in row-major order.
+        """
+        return [
+            (x, y, monster)
+            for (x, y), monster in sorted(
+                self._monsters_by_pos.items(), key=lambda entry: entry[0][::-1]
+            )
+        ]
+
+    def get_items(self) -> List[Tuple[int, int, Item]]:
+        """
+        Returns (x, y, item) for every item on the map, in row-major order.
+        """
+        return [
+            (x, y, item)
+            for (x, y), item in sorted(
+                self._items_by_pos.items(), key=lambda entry: entry[0][::-1]
+            )
+        ]
+
+    def get_items_in_categories(self, *categories: str) -> List[Tuple[int, int, Item]]:
+        """
+        Returns (x, y, item) for the items in any of the given categories
+        (see src.items.categories), in row-major order.
+        """
+        entries = [
+            entry
+            for category in categories
+            for entry in self._items_by_category.get(category, {}).items()
+        ]
+        entries.sort(key=lambda entry: entry[0][::-1])
+        return [(x, y, item) for (x, y), item in entries]
+
+    def _index_item(self, item: Item, x: int, y: int) -> None:
+        self._items_by_pos[(x, y)] = item
+        self._items_by_category.setdefault(item_category(item), {})[(x, y)] = item
 
     def get_map_as_string(self, renderer, message_log) -> list[str]:
         """
@@ -4,6 +4,8 @@ from unittest.mock import Mock
 
 from src.ai_logic.actions.explore_action import ExploreAction
 from src.ai_logic.context import AIContext
+from src.ai_logic.path_cache import PathCache
+from src.world_map import WorldMap
 
 
 def create_mock_context(**kwargs):
@@ -158,3 +160,63 @@ class TestExploreAction:
 
         result = action.execute(ctx, mock_ai_logic, mock_message_log)
         assert result is None
+
+    def test_keeps_cached_path_while_target_is_frontier(self):
+        """Test the explorer is only asked again once the target is explored."""
+        world_map = WorldMap(10, 10)
+        for row in world_map.grid:
+            for tile in row:
+                tile.is_explored = True
+        path_cache = PathCache()
+        action = ExploreAction()
+
+        mock_explorer = Mock()
+        mock_explorer.find_exploration_targets.return_value = [
+            (x, 5, 0) for x in range(5, 9)
+        ]
+        mock_explorer.get_frontier.return_value = {(8, 5)}
+
+        def make_ctx(player_x):
+            return create_mock_context(
+                player_x=player_x,
+                visible_maps={0: world_map},
+                explorer=mock_explorer,
+                path_cache=path_cache,
+            )
+
+        assert action.is_available(make_ctx(5))
+        ctx = make_ctx(6)
+        assert action.calculate_utility(ctx) == 0.35
+        assert action._exploration_path(ctx) == [(x, 5, 0) for x in range(6, 9)]
+        mock_explorer.find_exploration_targets.assert_called_once()
+
+        # Once the target is no longer on the frontier, search again
+        mock_explorer.get_frontier.return_value = set()
+        action.is_available(make_ctx(7))
+        assert mock_explorer.find_exploration_targets.call_count == 2
+
+    def test_cached_plan_does_not_replace_explorer_result(self):
+        """Test a path cache hit leaves ctx.find_exploration_targets() fresh."""
+        world_map = WorldMap(10, 10)
+        for row in world_map.grid:
+            for tile in row:
+                tile.is_explored = True
+        path_cache = PathCache()
+        cached = [(x, 5, 0) for x in range(5, 9)]
+        path_cache.store({0: world_map}, (8, 5, 0), "explore", cached)
+        action = ExploreAction()
+
+        nearest = [(5, 5, 0), (5, 4, 0)]
+        mock_explorer = Mock()
+        mock_explorer.find_exploration_targets.return_value = nearest
+        mock_explorer.get_frontier.return_value = {(8, 5), (5, 4)}
+        ctx = create_mock_context(
+            visible_maps={0: world_map},
+            explorer=mock_explorer,
+            path_cache=path_cache,
+        )
+
+        assert action._exploration_path(ctx) == cached
+        mock_explorer.find_exploration_targets.assert_not_called()
+        assert ctx.find_exploration_targets() == nearest
+        assert action._exploration_path(ctx) == cached
@@ -5,6 +5,9 @@ from unittest.mock import Mock
 from src.ai_logic.actions.flee_action import FleeAction
 from src.ai_logic.ai_monster_view import AIMonsterView
 from src.ai_logic.context import AIContext
+from src.map_algorithms.danger_grid import DangerGrid
+from src.map_algorithms.distance_field import DistanceFieldCache
+from src.world_map import WorldMap
 
 
 def create_mock_context(**kwargs):
@@ -154,3 +157,67 @@ class TestFleeAction:
         assert result is not None
         assert result[0] == "move"
         assert result[1] in ["north", "south", "east", "west"]
+
+    def test_best_flee_direction_avoids_other_monsters(self):
+        """Test fleeing prefers tiles that are not next to another monster."""
+        action = FleeAction()
+        mock_tile = Mock()
+        mock_tile.type = "floor"
+        mock_tile.monster = None
+        mock_map = Mock()
+        mock_map.get_tile.return_value = mock_tile
+
+        # North (5, 4) and south (5, 6) score the same; a monster at (5, 3)
+        # makes north dangerous
+        danger_grid = DangerGrid(10, 10)
+        danger_grid.set_monsters({(5, 3): 1.0})
+        ctx = create_mock_context(
+            adjacent_monsters=[AIMonsterView("Goblin", 4, 5)],
+            visible_maps={0: mock_map},
+        )
+        assert action._get_best_flee_direction(ctx) == ("move", "north")
+
+        ctx = create_mock_context(
+            adjacent_monsters=[AIMonsterView("Goblin", 4, 5)],
+            visible_maps={0: mock_map},
+            danger_grids={0: danger_grid},
+        )
+        assert action._get_best_flee_direction(ctx) == ("move", "south")
+
+    def test_best_flee_direction_follows_safety_map(self):
+        """Test fleeing uses walking distance when distance fields are given."""
+        action = FleeAction()
+        layout = [
+            "#######",
+            "###.###",
+            "###.###",
+            "###.###",
+            "###.###",
+            "###.###",
+            "###....",
+        ]
+        world_map = WorldMap(7, 7)
+        for y, row in enumerate(layout):
+            for x, char in enumerate(row):
+                if char == "#":
+                    world_map.set_tile_type(x, y, "wall")
+        world_map.set_tile_type(4, 3, "floor")
+
+        # North is a dead-end corridor, south leads on; both are as far from
+        # the goblin as the crow flies
+        ctx = create_mock_context(
+            player_x=3,
+            player_y=3,
+            adjacent_monsters=[AIMonsterView("Goblin", 4, 3)],
+            visible_maps={0: world_map},
+        )
+        assert action._get_best_flee_direction(ctx) == ("move", "north")
+
+        ctx = create_mock_context(
+            player_x=3,
+            player_y=3,
+            adjacent_monsters=[AIMonsterView("Goblin", 4, 3)],
+            visible_maps={0: world_map},
+            distance_fields=DistanceFieldCache(),
+        )
+        assert action._get_best_flee_direction(ctx) == ("move", "south")
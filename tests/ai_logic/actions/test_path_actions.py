@@ -12,6 +12,8 @@ from src.ai_logic.actions.path_actions import (
     apply_distance_modifier,
 )
 from src.ai_logic.context import AIContext
+from src.ai_logic.path_cache import PathCache
+from src.world_map import WorldMap
 
 
 def create_mock_context(**kwargs):
@@ -368,3 +370,36 @@ class TestPathActionExecution:
 
         result = action.execute(ctx, mock_ai_logic, mock_message_log)
         assert result is None
+
+    def test_execute_reuses_cached_path(self):
+        """Test a cached path is followed on later turns without re-planning."""
+        world_map = WorldMap(10, 10)
+        for row in world_map.grid:
+            for tile in row:
+                tile.is_explored = True
+        path_cache = PathCache()
+        action = PathToWeaponAction()
+
+        mock_target_finder = Mock()
+        mock_target_finder.find_weapons.return_value = [(8, 5, 0, "sword", 3)]
+        mock_path_finder = Mock()
+        mock_path_finder.find_path_bfs.return_value = [(x, 5, 0) for x in range(5, 9)]
+
+        mock_ai_logic = Mock()
+        mock_ai_logic._coordinates_to_move_command.return_value = ("move", "east")
+
+        for player_x in (5, 6, 7):
+            ctx = create_mock_context(
+                player_x=player_x,
+                visible_maps={0: world_map},
+                target_finder=mock_target_finder,
+                path_finder=mock_path_finder,
+                path_cache=path_cache,
+            )
+            assert action.execute(ctx, mock_ai_logic, Mock()) == ("move", "east")
+            # Following the path drops the step just taken
+            assert mock_ai_logic.current_path == [
+                (x, 5, 0) for x in range(player_x + 1, 9)
+            ]
+
+        mock_path_finder.find_path_bfs.assert_called_once()
@@ -1,8 +1,45 @@
 """Tests for AIContext dataclass."""
 
+from unittest.mock import Mock
+
 from src.ai_logic.context import AIContext
 
 
+def make_context(**kwargs) -> AIContext:
+    """Create an AIContext with default values."""
+    defaults = {
+        "player_x": 5,
+        "player_y": 5,
+        "player_floor_id": 0,
+        "player_health": 100,
+        "player_max_health": 100,
+        "player_attack": 5,
+        "player_defense": 2,
+        "health_ratio": 1.0,
+        "survival_threshold": 0.5,
+        "is_cornered": False,
+        "is_in_loop": False,
+        "loop_breaker_active": False,
+        "adjacent_monsters": [],
+        "current_tile_has_item": False,
+        "current_tile_item_name": None,
+        "current_tile_item": None,
+        "inventory_items": [],
+        "has_healing_item": False,
+        "has_fire_potion": False,
+        "equipped_items": {},
+        "current_path": None,
+        "visible_maps": {},
+        "path_finder": None,
+        "bestiary": None,
+        "explorer": None,
+        "target_finder": None,
+        "random": None,
+    }
+    defaults.update(kwargs)
+    return AIContext(**defaults)  # type: ignore[arg-type]
+
+
 class TestAIContext:
     """Test suite for AIContext dataclass."""
 
@@ -239,3 +276,39 @@ class TestAIContext:
             random=None,
         )
         assert ctx.has_adjacent_monsters() is False
+
+
+class TestAIContextQueryCache:
+    """Test suite for the turn-scoped target query cache."""
+
+    def test_target_query_runs_once_per_context(self):
+        target_finder = Mock()
+        target_finder.find_health_potions.return_value = [(1, 1, 0, "potion", 8)]
+        ctx = make_context(target_finder=target_finder)
+
+        first = ctx.find_health_potions()
+        assert ctx.find_health_potions() is first
+        target_finder.find_health_potions.assert_called_once_with((5, 5), 0)
+
+        # A rebuilt context starts with an empty cache
+        make_context(target_finder=target_finder).find_health_potions()
+        assert target_finder.find_health_potions.call_count == 2
+
+    def test_queries_are_cached_separately(self):
+        explorer = Mock()
+        explorer.find_unvisited_portals.return_value = [(2, 2, 0, "portal", 6)]
+        explorer.find_portal_to_unexplored_floor.return_value = []
+        ctx = make_context(explorer=explorer)
+
+        assert ctx.find_unvisited_portals() == [(2, 2, 0, "portal", 6)]
+        assert ctx.find_portal_to_unexplored_floor() == []
+        ctx.find_unvisited_portals()
+        ctx.find_portal_to_unexplored_floor()
+        explorer.find_unvisited_portals.assert_called_once()
+        explorer.find_portal_to_unexplored_floor.assert_called_once()
+
+    def test_missing_finders_return_empty_results(self):
+        ctx = make_context()
+        assert ctx.find_weapons() == []
+        assert ctx.find_exploration_targets() is None
+        assert ctx.get_floor_exploration_ratio() == 0.0
@@ -0,0 +1,93 @@
+"""Tests for Explorer frontier tracking and exploration targets."""
+
+from unittest.mock import Mock
+
+from src.ai_logic.explorer import Explorer
+from src.world_map import WorldMap
+
+
+def make_map(layout: list[str]) -> WorldMap:
+    """'#' explored wall, '.' explored floor, '?' unexplored."""
+    world_map = WorldMap(len(layout[0]), len(layout))
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            tile = world_map.get_tile(x, y)
+            assert tile is not None
+            if char == "#":
+                tile.type = "wall"
+            tile.is_explored = char != "?"
+    return world_map
+
+
+def scan_frontier(world_map: WorldMap) -> set[tuple[int, int]]:
+    return {
+        (x, y)
+        for y, x in world_map.iter_coords()
+        if Explorer._is_frontier_tile(world_map, x, y)
+    }
+
+
+class TestExplorer:
+    """Test suite for Explorer."""
+
+    def test_frontier_scan(self):
+        world_map = make_map(["...?", "#..?", "...."])
+        explorer = Explorer(Mock(), {0: world_map})
+        assert explorer.get_frontier(0) == {(2, 0), (2, 1), (3, 2)}
+
+    def test_on_tiles_explored_matches_full_rescan(self):
+        world_map = make_map(["?????", "?...?", "?????"])
+        explorer = Explorer(Mock(), {0: world_map})
+        assert explorer.get_frontier(0) == {(1, 1), (2, 1), (3, 1)}
+
+        revealed = [(0, 1), (1, 0), (2, 0), (4, 1)]
+        for x, y in revealed:
+            tile = world_map.get_tile(x, y)
+            assert tile is not None
+            tile.is_explored = True
+        explorer.on_tiles_explored(0, revealed)
+
+        assert explorer.get_frontier(0) == scan_frontier(world_map)
+
+    def test_exploration_target_is_nearest_frontier_row_major_tie(self):
+        # Frontier tiles (1, 0) and (1, 2) are both two steps from (0, 1);
+        # the first in row-major order wins.
+        world_map = make_map(["..?", ".#?", "..?"])
+        explorer = Explorer(Mock(), {0: world_map})
+        path = explorer.find_exploration_targets((0, 1), 0)
+        assert path == [(0, 1, 0), (0, 0, 0), (1, 0, 0)]
+
+    def test_exploration_target_skips_player_tile(self):
+        world_map = make_map(["...", "??."])
+        explorer = Explorer(Mock(), {0: world_map})
+        path = explorer.find_exploration_targets((0, 0), 0)
+        assert path == [(0, 0, 0), (1, 0, 0)]
+
+    def test_exploration_stats_follow_on_tiles_explored(self):
+        world_map = make_map(["..??", "#.??"])
+        explorer = Explorer(Mock(), {0: world_map})
+        assert explorer.get_floor_exploration_ratio(0) == 3 / 7
+        assert not explorer.is_floor_fully_explored(0)
+
+        # Reveal a wall, a portal and the remaining floor
+        revealed = {(2, 0): "wall", (3, 0): "floor", (2, 1): "floor", (3, 1): "floor"}
+        for (x, y), tile_type in revealed.items():
+            tile = world_map.get_tile(x, y)
+            assert tile is not None
+            tile.type = tile_type
+            tile.is_explored = True
+        portal = world_map.get_tile(3, 1)
+        assert portal is not None
+        portal.is_portal = True
+        portal.portal_to_floor_id = 1
+        explorer.on_tiles_explored(0, revealed)
+
+        rescanned = Explorer(Mock(), {0: world_map})
+        assert explorer.get_floor_exploration_ratio(0) == 1.0
+        assert explorer.is_floor_fully_explored(0)
+        assert explorer.get_floor_exploration_ratio(0) == (
+            rescanned.get_floor_exploration_ratio(0)
+        )
+        assert explorer.find_unvisited_portals((0, 0), 0) == [
+            (3, 1, 0, "unvisited_portal", 4)
+        ]
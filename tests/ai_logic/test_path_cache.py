@@ -0,0 +1,130 @@
+"""Tests for PathCache reuse, validation and repair."""
+
+from unittest.mock import Mock
+
+from src.ai_logic.path_cache import PathCache
+from src.world_map import WorldMap
+
+
+def make_map(layout: list[str]) -> WorldMap:
+    """'#' wall, '.' floor, '?' unexplored floor."""
+    world_map = WorldMap(len(layout[0]), len(layout))
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            tile = world_map.get_tile(x, y)
+            assert tile is not None
+            if char == "#":
+                tile.type = "wall"
+            tile.is_explored = char != "?"
+    return world_map
+
+
+def row_path(y: int, x_from: int, x_to: int, floor_id: int = 0):
+    return [(x, y, floor_id) for x in range(x_from, x_to + 1)]
+
+
+class TestPathCache:
+    """Test suite for PathCache."""
+
+    def test_returns_path_trimmed_to_player(self):
+        world_map = make_map(["......"])
+        cache = PathCache()
+        cache.store({0: world_map}, (5, 0, 0), "bfs", row_path(0, 0, 5))
+
+        path = cache.get({0: world_map}, (2, 0, 0), (5, 0, 0), "bfs")
+        assert path == row_path(0, 2, 5)
+        # Callers may consume the returned path
+        assert path is not None
+        path.clear()
+        assert cache.get({0: world_map}, (3, 0, 0), (5, 0, 0), "bfs") == row_path(
+            0, 3, 5
+        )
+
+    def test_misses_on_other_target_mode_or_position(self):
+        world_map = make_map(["......", "......"])
+        maps = {0: world_map}
+        cache = PathCache()
+        cache.store(maps, (5, 0, 0), "bfs", row_path(0, 0, 5))
+
+        assert cache.get(maps, (0, 0, 0), (4, 0, 0), "bfs") is None
+        assert cache.get(maps, (0, 0, 0), (5, 0, 0), "risk_aware") is None
+        # Leaving the path drops the entry
+        assert cache.get(maps, (0, 1, 0), (5, 0, 0), "bfs") is None
+        assert cache.get(maps, (0, 0, 0), (5, 0, 0), "bfs") is None
+        assert len(cache) == 0
+
+    def test_repairs_around_monster_on_next_steps(self):
+        world_map = make_map(["......", "......"])
+        maps = {0: world_map}
+        cache = PathCache()
+        cache.store(maps, (5, 0, 0), "bfs", row_path(0, 0, 5))
+        world_map.place_monster(Mock(), 2, 0)
+
+        path = cache.get(maps, (0, 0, 0), (5, 0, 0), "bfs")
+        assert path is not None
+        assert (2, 0, 0) not in path
+        assert path[0] == (0, 0, 0) and path[-1] == (5, 0, 0)
+        for (ax, ay, _), (bx, by, _) in zip(path, path[1:]):
+            assert abs(ax - bx) + abs(ay - by) == 1
+
+    def test_monsters_beyond_lookahead_are_ignored(self):
+        world_map = make_map(["........"])
+        maps = {0: world_map}
+        cache = PathCache(lookahead=2)
+        cache.store(maps, (7, 0, 0), "bfs", row_path(0, 0, 7))
+        world_map.place_monster(Mock(), 5, 0)
+
+        assert cache.get(maps, (0, 0, 0), (7, 0, 0), "bfs") == row_path(0, 0, 7)
+
+    def test_new_wall_is_found_after_version_change(self):
+        world_map = make_map(["........", "........"])
+        maps = {0: world_map}
+        cache = PathCache(lookahead=1)
+        cache.store(maps, (7, 0, 0), "bfs", row_path(0, 0, 7))
+        world_map.set_tile_type(5, 0, "wall")
+
+        path = cache.get(maps, (0, 0, 0), (7, 0, 0), "bfs")
+        assert path is not None
+        assert (5, 0, 0) not in path
+        assert path[-1] == (7, 0, 0)
+
+    def test_unrepairable_path_is_dropped(self):
+        world_map = make_map(["......", "######"])
+        maps = {0: world_map}
+        cache = PathCache()
+        cache.store(maps, (5, 0, 0), "bfs", row_path(0, 0, 5))
+        world_map.set_tile_type(3, 0, "wall")
+
+        assert cache.get(maps, (0, 0, 0), (5, 0, 0), "bfs") is None
+        assert len(cache) == 0
+
+    def test_checks_portal_steps(self):
+        floor_0 = make_map(["..."])
+        floor_1 = make_map(["..."])
+        portal = floor_0.get_tile(2, 0)
+        assert portal is not None
+        portal.is_portal = True
+        portal.portal_to_floor_id = 1
+        maps = {0: floor_0, 1: floor_1}
+        path = row_path(0, 0, 2) + [(2, 0, 1), (1, 0, 1)]
+        cache = PathCache()
+        cache.store(maps, (1, 0, 1), "bfs", path)
+
+        assert cache.get(maps, (1, 0, 0), (1, 0, 1), "bfs") == path[1:]
+
+        portal.is_portal = False
+        floor_0.mark_changed()
+        assert cache.get(maps, (1, 0, 0), (1, 0, 1), "bfs") is None
+
+    def test_targets_lists_newest_first(self):
+        world_map = make_map(["......"])
+        maps = {0: world_map}
+        cache = PathCache(max_entries=2)
+        cache.store(maps, (3, 0, 0), "explore", row_path(0, 0, 3))
+        cache.store(maps, (5, 0, 0), "bfs", row_path(0, 0, 5))
+        cache.store(maps, (4, 0, 0), "explore", row_path(0, 0, 4))
+
+        # The oldest entry was evicted
+        assert cache.targets("explore") == [(4, 0, 0)]
+        cache.invalidate()
+        assert cache.targets("bfs") == []
@@ -0,0 +1,77 @@
+"""Tests for TargetFinder item queries."""
+
+import random
+from unittest.mock import Mock
+
+from src.ai_logic.target_finder import TargetFinder
+from src.effects import HealingEffect
+from src.items import ConsumableItem, EquippableItem, QuestItem
+from src.world_generator import WorldGenerator
+
+
+def make_finder(seed: int, equipped: dict) -> TargetFinder:
+    """A TargetFinder over fully explored copies of a generated world."""
+    world_maps, _, _, _ = WorldGenerator().generate_world(
+        30, 15, random_generator=random.Random(seed)
+    )
+    for world_map in world_maps.values():
+        for row in world_map.grid:
+            for tile in row:
+                tile.is_explored = True
+    player_view = Mock()
+    player_view.get_equipped_item.side_effect = equipped.get
+    return TargetFinder(player_view, world_maps)
+
+
+def scan_items(finder: TargetFinder, target_type: str, item_filter) -> list:
+    """The same query answered by scanning every tile."""
+    return finder._find_items((5, 5), 0, item_filter, target_type)
+
+
+class TestTargetFinder:
+    """Test suite for TargetFinder."""
+
+    def test_indexed_queries_match_full_scan(self):
+        weak_sword = EquippableItem("Stick", "", {"slot": "main_hand"})
+        for seed in range(6):
+            for equipped in ({}, {"main_hand": weak_sword}):
+                finder = make_finder(seed, equipped)
+                assert finder.find_quest_items((5, 5), 0) == scan_items(
+                    finder, "quest_item", lambda item: isinstance(item, QuestItem)
+                )
+                assert finder.find_health_potions((5, 5), 0) == scan_items(
+                    finder,
+                    "health_potion",
+                    lambda item: (
+                        isinstance(item, ConsumableItem)
+                        and any(isinstance(e, HealingEffect) for e in item.effects)
+                    ),
+                )
+                assert finder.find_weapons((5, 5), 0) == scan_items(
+                    finder,
+                    "weapon",
+                    lambda item: (
+                        isinstance(item, EquippableItem)
+                        and item.properties.get("slot") == "main_hand"
+                        and item.properties.get("attack_bonus", 0) > 0
+                    ),
+                )
+                assert finder.find_armor((5, 5), 0) == scan_items(
+                    finder,
+                    "armor",
+                    lambda item: (
+                        isinstance(item, EquippableItem)
+                        and item.properties.get("slot")
+                        in ("head", "chest", "legs", "off_hand", "boots")
+                    ),
+                )
+
+    def test_unexplored_items_are_ignored(self):
+        finder = make_finder(1, {})
+        everything = finder.find_other_items((5, 5), 0)
+        for world_map in finder.ai_visible_maps.values():
+            for row in world_map.grid:
+                for tile in row:
+                    tile.is_explored = False
+        assert everything
+        assert finder.find_other_items((5, 5), 0) == []
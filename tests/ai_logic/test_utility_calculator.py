@@ -4,6 +4,8 @@ from unittest.mock import Mock
 
 from src.ai_logic.context import AIContext
 from src.ai_logic.utility_calculator import UtilityCalculator
+from src.game_engine import GameEngine
+from src.game_state import GameState
 
 
 def create_mock_context(**kwargs):
@@ -48,6 +50,7 @@ class TestUtilityCalculator:
         """Test that select_action returns None when no actions available."""
         # Create a mock action that's never available
         mock_action = Mock()
+        mock_action.max_utility = 1.0
         mock_action.is_available.return_value = False
         mock_action.calculate_utility.return_value = 0.0
 
@@ -61,11 +64,14 @@ class TestUtilityCalculator:
         """Test that select_action returns the highest utility action."""
         # Create mock actions with different utilities
         low_action = Mock()
+        low_action.max_utility = 1.0
         low_action.is_available.return_value = True
         low_action.calculate_utility.return_value = 0.3
         low_action.name = "LowAction"
 
         high_action = Mock()
+
+        high_action.max_utility = 1.0
         high_action.is_available.return_value = True
         high_action.calculate_utility.return_value = 0.9
         high_action.name = "HighAction"
@@ -80,11 +86,14 @@ class TestUtilityCalculator:
         """Test that actions with same utility are ordered by name."""
         # Create mock actions with same utility
         action_b = Mock()
+        action_b.max_utility = 1.0
         action_b.is_available.return_value = True
         action_b.calculate_utility.return_value = 0.5
         action_b.name = "BAction"
 
         action_a = Mock()
+
+        action_a.max_utility = 1.0
         action_a.is_available.return_value = True
         action_a.calculate_utility.return_value = 0.5
         action_a.name = "AAction"
@@ -100,11 +109,14 @@ class TestUtilityCalculator:
     def test_get_action_scores_returns_all_actions(self):
         """Test that get_action_scores returns info for all actions."""
         action1 = Mock()
+        action1.max_utility = 1.0
         action1.is_available.return_value = True
         action1.calculate_utility.return_value = 0.7
         action1.name = "Action1"
 
         action2 = Mock()
+
+        action2.max_utility = 1.0
         action2.is_available.return_value = False
         action2.calculate_utility.return_value = 0.3
         action2.name = "Action2"
@@ -130,6 +142,7 @@ class TestUtilityCalculator:
     def test_returns_none_for_zero_utility(self):
         """Test that select_action returns None when best utility is 0."""
         mock_action = Mock()
+        mock_action.max_utility = 1.0
         mock_action.is_available.return_value = True
         mock_action.calculate_utility.return_value = 0.0
         mock_action.name = "ZeroAction"
@@ -143,6 +156,7 @@ class TestUtilityCalculator:
     def test_execute_best_action_calls_execute(self):
         """Test that execute_best_action calls the best action's execute."""
         mock_action = Mock()
+        mock_action.max_utility = 1.0
         mock_action.is_available.return_value = True
         mock_action.calculate_utility.return_value = 0.9
         mock_action.name = "MockAction"
@@ -151,7 +165,9 @@ class TestUtilityCalculator:
         calculator = UtilityCalculator([mock_action])
         ctx = create_mock_context()
         ai_logic = Mock()
+        ai_logic.max_utility = 1.0
         message_log = Mock()
+        message_log.max_utility = 1.0
 
         result = calculator.execute_best_action(ctx, ai_logic, message_log)
         assert result == ("move", "north")
@@ -160,13 +176,76 @@ class TestUtilityCalculator:
     def test_execute_best_action_returns_none_when_no_action(self):
         """Test that execute_best_action returns None when no action available."""
         mock_action = Mock()
+        mock_action.max_utility = 1.0
         mock_action.is_available.return_value = False
         mock_action.calculate_utility.return_value = 0.0
 
         calculator = UtilityCalculator([mock_action])
         ctx = create_mock_context()
         ai_logic = Mock()
+        ai_logic.max_utility = 1.0
         message_log = Mock()
+        message_log.max_utility = 1.0
 
         result = calculator.execute_best_action(ctx, ai_logic, message_log)
         assert result is None
+
+    def test_skips_actions_that_cannot_beat_best(self):
+        """Test that actions bounded below the best utility are not evaluated."""
+        high_action = Mock()
+        high_action.max_utility = 0.9
+        high_action.is_available.return_value = True
+        high_action.calculate_utility.return_value = 0.9
+        high_action.name = "HighAction"
+
+        low_action = Mock()
+        low_action.max_utility = 0.5
+        low_action.is_available.return_value = True
+        low_action.calculate_utility.return_value = 0.5
+        low_action.name = "LowAction"
+
+        calculator = UtilityCalculator([low_action, high_action])
+        ctx = create_mock_context()
+
+        assert calculator.select_action(ctx) == high_action
+        low_action.is_available.assert_not_called()
+        low_action.calculate_utility.assert_not_called()
+
+        # Falling back past the best action evaluates the next one
+        high_action.execute.return_value = None
+        low_action.execute.return_value = ("move", "north")
+        result = calculator.execute_best_action(ctx, Mock(), Mock())
+        assert result == ("move", "north")
+        low_action.calculate_utility.assert_called_once_with(ctx)
+
+    def test_ranked_actions_match_exhaustive_evaluation(self):
+        """Test lazy ranking against scoring every action, over real games."""
+        for seed in (1, 2, 3):
+            engine = GameEngine(
+                map_width=30,
+                map_height=15,
+                debug_mode=True,
+                ai_active=True,
+                ai_sleep_duration=0,
+                seed=seed,
+            )
+            assert engine.ai_logic is not None
+            calculator = engine.ai_logic.utility_calculator
+            execute_best_action = calculator.execute_best_action
+
+            def checked_execute_best_action(ctx, ai_logic, message_log):
+                scored = []
+                for action in calculator.actions:
+                    utility = action.calculate_utility(ctx)
+                    assert utility <= action.max_utility, action.name
+                    if action.is_available(ctx) and utility > 0:
+                        scored.append((action, utility))
+                scored.sort(key=lambda x: (-x[1], x[0].name))
+                assert list(calculator.ranked_actions(ctx)) == scored
+                return execute_best_action(ctx, ai_logic, message_log)
+
+            calculator.execute_best_action = checked_execute_best_action
+            for _ in range(200):
+                if engine.game_state != GameState.PLAYING:
+                    break
+                engine.play_turn()
@@ -0,0 +1,30 @@
+import unittest
+
+from src.effects import HealingEffect, TeleportEffect
+from src.items import ConsumableItem, EquippableItem, QuestItem
+from src.items.categories import (
+    HEALING,
+    OTHER,
+    QUEST,
+    equipment_category,
+    item_category,
+)
+
+
+class TestItemCategory(unittest.TestCase):
+    def test_categories(self):
+        potion = ConsumableItem("Potion", "", {}, [HealingEffect(5)])
+        scroll = ConsumableItem("Scroll", "", {}, [TeleportEffect()])
+        sword = EquippableItem("Sword", "", {"slot": "main_hand"})
+        helmet = EquippableItem("Helmet", "", {"slot": "head"})
+        amulet = QuestItem("Amulet", "", {})
+
+        self.assertEqual(item_category(potion), HEALING)
+        self.assertEqual(item_category(scroll), OTHER)
+        self.assertEqual(item_category(sword), equipment_category("main_hand"))
+        self.assertEqual(item_category(helmet), equipment_category("head"))
+        self.assertEqual(item_category(amulet), QUEST)
+
+
+if __name__ == "__main__":
+    unittest.main()
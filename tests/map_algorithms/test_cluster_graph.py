@@ -0,0 +1,131 @@
+"""Tests for the cluster graph behind the "hpa" pathfinding engine."""
+
+import random
+import unittest
+
+from src.map_algorithms.cluster_graph import ClusterGraph
+from src.map_algorithms.pathfinding import PathFinder
+from src.world_map import WorldMap
+
+
+def make_floor(layout: list[str]) -> WorldMap:
+    """'#' wall, '.' floor."""
+    world_map = WorldMap(len(layout[0]), len(layout))
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            if char == "#":
+                world_map.set_tile_type(x, y, "wall")
+    return world_map
+
+
+def graph_state(graph: ClusterGraph):
+    return graph._borders, {
+        cluster_id: (sorted(cluster.edges.items()), cluster.crossings)
+        for cluster_id, cluster in graph._clusters.items()
+    }
+
+
+class TestClusterGraph(unittest.TestCase):
+    def setUp(self):
+        # 4x4 clusters; the wall splits the left column of clusters from the
+        # right one except through the gap in the bottom row
+        self.world_map = make_floor(
+            [
+                "...#....",
+                "...#....",
+                "...#....",
+                "...#....",
+                "...#....",
+                "...#....",
+                "...#....",
+                "........",
+            ]
+        )
+        self.graph = ClusterGraph(self.world_map, cluster_size=4)
+
+    def assert_valid_path(self, path, start, goal):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for (ax, ay), (bx, by) in zip(path, path[1:]):
+            self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+            self.assertTrue(self.world_map.is_valid_move(bx, by))
+
+    def test_entrances_on_border_runs(self):
+        # Cluster 0 (top left) touches cluster 1 only through the wall and
+        # cluster 2 through a run of three open tiles
+        self.assertEqual(self.graph.entrances(0), ((1, 3),))
+        # A run of four open tiles gets one entrance; cluster 3 is open
+        self.assertEqual(self.graph.entrances(1), ((6, 3),))
+
+    def test_path_around_wall(self):
+        path = self.graph.find_path((0, 0), (7, 0))
+        assert path is not None
+        self.assert_valid_path(path, (0, 0), (7, 0))
+        self.assertIn((3, 7), path)
+        self.assertEqual(len(path), 22)
+
+    def test_set_tile_type_rebuilds_only_touched_clusters(self):
+        self.graph.update()
+        clusters = dict(self.graph._clusters)
+
+        # Closing the gap changes cluster 2's interior and its border with 3
+        self.world_map.set_tile_type(3, 7, "wall")
+        self.assertIsNone(self.graph.find_path((0, 0), (7, 0)))
+        self.assertIs(self.graph._clusters[0], clusters[0])
+        self.assertIs(self.graph._clusters[1], clusters[1])
+        self.assertIsNot(self.graph._clusters[2], clusters[2])
+        self.assertIsNot(self.graph._clusters[3], clusters[3])
+
+        fresh = ClusterGraph(self.world_map, cluster_size=4)
+        fresh.update()
+        self.assertEqual(graph_state(self.graph), graph_state(fresh))
+
+    def test_direct_edits_rebuild_everything(self):
+        self.graph.update()
+        self.world_map.get_tile(3, 7).type = "wall"
+        self.world_map.mark_changed()
+        self.assertIsNone(self.graph.find_path((0, 0), (7, 0)))
+
+
+class TestHPAEngine(unittest.TestCase):
+    def test_reaches_the_same_goals_as_astar(self):
+        astar = PathFinder()
+        hpa = PathFinder(engine="hpa")
+        rng = random.Random(7)
+        for _ in range(20):
+            width, height = rng.randint(10, 60), rng.randint(10, 40)
+            world_map = WorldMap(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.3:
+                        world_map.set_tile_type(x, y, "wall")
+            for _ in range(10):
+                # Incremental updates must keep the graph correct
+                world_map.set_tile_type(
+                    rng.randrange(width), rng.randrange(height), "wall"
+                )
+                start = (rng.randrange(width), rng.randrange(height))
+                goal = (rng.randrange(width), rng.randrange(height))
+                expected = astar.a_star_search(world_map, start, goal, width, height)
+                path = hpa.a_star_search(world_map, start, goal, width, height)
+                self.assertEqual(path is None, expected is None)
+                if path is None or expected is None:
+                    continue
+                self.assertEqual((path[0], path[-1]), (start, goal))
+                for (ax, ay), (bx, by) in zip(path, path[1:]):
+                    self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+                    tile = world_map.get_tile(bx, by)
+                    assert tile is not None
+                    self.assertTrue(tile.type != "wall" or (bx, by) == goal)
+
+    def test_graph_is_cached_per_map(self):
+        world_map = WorldMap(20, 20)
+        path_finder = PathFinder(engine="hpa")
+        path_finder.a_star_search(world_map, (0, 0), (19, 19), 20, 20)
+        graph = path_finder._map_search(world_map, (20, 20), lambda: None)
+        path_finder.a_star_search(world_map, (19, 0), (0, 19), 20, 20)
+        self.assertIs(path_finder._map_search(world_map, (20, 20), lambda: None), graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
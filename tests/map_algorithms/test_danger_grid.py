@@ -0,0 +1,53 @@
+"""Tests for danger grids."""
+
+import random
+import unittest
+
+from src.map_algorithms.danger_grid import DangerGrid
+from src.monster import Monster
+from src.world_map import WorldMap
+
+
+class TestDangerGrid(unittest.TestCase):
+    """Tests for DangerGrid."""
+
+    def test_danger_is_heaviest_neighbouring_monster(self):
+        grid = DangerGrid(5, 3)
+        grid.set_monsters({(1, 1): 1.0, (3, 1): 2.5})
+        self.assertEqual(grid.danger(1, 0), 1.0)
+        self.assertEqual(grid.danger(2, 1), 2.5)  # Next to both
+        self.assertEqual(grid.danger(1, 1), 0.0)  # The monster's own tile
+        self.assertEqual(grid.danger(0, 0), 0.0)  # Diagonal
+        self.assertEqual(grid.danger(-1, 1), 0.0)  # Out of bounds
+
+    def test_sync_reads_monster_index(self):
+        world_map = WorldMap(4, 4)
+        rng = random.Random(1)
+        world_map.place_monster(Monster("Rat", 5, 1, rng), 1, 1)
+        world_map.place_monster(Monster("Troll", 30, 6, rng), 3, 3)
+        weights = {"Rat": 1.0, "Troll": 2.5}
+
+        grid = DangerGrid.from_world_map(world_map, lambda m: weights[m.name])
+        self.assertEqual(grid.danger(1, 2), 1.0)
+        self.assertEqual(grid.danger(3, 2), 2.5)
+
+        world_map.remove_monster(3, 3)
+        grid.sync(world_map, lambda m: weights[m.name])
+        self.assertEqual(grid.danger(3, 2), 0.0)
+
+    def test_incremental_updates_match_rebuild(self):
+        rng = random.Random(7)
+        grid = DangerGrid(12, 9)
+        for _ in range(50):
+            monsters = {
+                (rng.randrange(12), rng.randrange(9)): rng.choice([1.0, 1.5, 2.5])
+                for _ in range(rng.randint(0, 10))
+            }
+            grid.set_monsters(monsters)
+            fresh = DangerGrid(12, 9)
+            fresh.set_monsters(monsters)
+            self.assertEqual(grid.costs, fresh.costs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Tests for distance fields (Dijkstra maps)."""
+
+import random
+import unittest
+
+from src.array_world_map import ArrayWorldMap
+from src.map_algorithms.distance_field import (
+    DistanceField,
+    DistanceFieldCache,
+    safety_field,
+)
+from src.map_algorithms.pathfinding import PathFinder
+from src.world_map import WorldMap
+
+
+def make_map(layout: list[str]) -> WorldMap:
+    world_map = WorldMap(len(layout[0]), len(layout))
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            if char == "#":
+                world_map.set_tile_type(x, y, "wall")
+    return world_map
+
+
+class TestDistanceField(unittest.TestCase):
+    """Tests for DistanceField."""
+
+    def test_distances_from_single_source(self):
+        world_map = make_map(["...", ".#.", "..."])
+        field = DistanceField.from_sources(world_map, [(0, 0)])
+        self.assertEqual(field.distance(0, 0), 0)
+        self.assertEqual(field.distance(2, 2), 4)
+        self.assertIsNone(field.distance(1, 1))  # Wall
+        self.assertIsNone(field.distance(5, 5))  # Out of bounds
+
+    def test_multiple_sources_use_nearest(self):
+        world_map = make_map([".....", "....."])
+        field = DistanceField.from_sources(world_map, [(0, 0), (4, 1)])
+        self.assertEqual([field.distance(x, 0) for x in range(5)], [0, 1, 2, 2, 1])
+
+    def test_unreachable_region(self):
+        world_map = make_map([".#.", ".#."])
+        field = DistanceField.from_sources(world_map, [(0, 0)])
+        self.assertIsNone(field.distance(2, 0))
+        self.assertIsNone(field.next_step(2, 0))
+        self.assertIsNone(field.path_from(2, 1))
+
+    def test_path_from_follows_shortest_steps(self):
+        rng = random.Random(7)
+        world_map = WorldMap(20, 12)
+        for y in range(12):
+            for x in range(20):
+                if rng.random() < 0.25:
+                    world_map.set_tile_type(x, y, "wall")
+        world_map.set_tile_type(0, 0, "floor")
+        field = DistanceField.from_sources(world_map, [(0, 0)])
+        path_finder = PathFinder()
+        for y, x in world_map.iter_coords():
+            tile = world_map.get_tile(x, y)
+            if not tile or tile.type == "wall":
+                continue
+            path = field.path_from(x, y)
+            a_star = path_finder.a_star_search(world_map, (x, y), (0, 0), 20, 12)
+            if a_star is None:
+                self.assertIsNone(path)
+                continue
+            self.assertIsNotNone(path)
+            path = path or []
+            self.assertEqual(len(path), (field.distance(x, y) or 0) + 1)
+            self.assertLessEqual(len(path), len(a_star))
+            self.assertEqual(path[-1], (0, 0))
+            for (ax, ay), (bx, by) in zip(path, path[1:]):
+                self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+
+    def test_array_world_map_gives_same_field(self):
+        world_map = make_map(["..#..", ".##..", "....."])
+        array_map = ArrayWorldMap.from_world_map(world_map)
+        plain = DistanceField.from_sources(world_map, [(4, 0)])
+        packed = DistanceField.from_sources(array_map, [(4, 0)])
+        self.assertEqual(list(plain.distances), list(packed.distances))
+
+    def test_safety_field_leads_away_from_threat(self):
+        world_map = make_map(["........."])
+        field = safety_field(world_map, [(3, 0)])
+        self.assertEqual(field.next_step(4, 0), (5, 0))
+        self.assertEqual(field.next_step(2, 0), (1, 0))
+
+    def test_safety_coefficient_applies_next_to_threat(self):
+        # Cornered at x=0 by a threat at x=1: at -1 there is nowhere better
+        # to go, below -1 the long corridor past the threat is worth it
+        world_map = make_map(["........."])
+        self.assertIsNone(safety_field(world_map, [(1, 0)], -1.0).next_step(0, 0))
+        field = safety_field(world_map, [(1, 0)], -1.2)
+        self.assertEqual(field.next_step(0, 0), (1, 0))
+        self.assertEqual(field.path_from(0, 0)[-1], (8, 0))
+
+
+class TestDistanceFieldCache(unittest.TestCase):
+    """Tests for DistanceFieldCache."""
+
+    def test_reuses_field_until_map_changes(self):
+        world_map = make_map(["....", "...."])
+        cache = DistanceFieldCache()
+        field = cache.get(world_map, [(0, 0)])
+        self.assertIs(cache.get(world_map, [(0, 0)]), field)
+
+        world_map.set_tile_type(1, 0, "wall")
+        rebuilt = cache.get(world_map, [(0, 0)])
+        self.assertIsNot(rebuilt, field)
+        self.assertEqual(rebuilt.distance(2, 0), 4)
+
+    def test_evicts_oldest_entry(self):
+        world_map = make_map(["...."])
+        cache = DistanceFieldCache(max_entries=2)
+        first = cache.get(world_map, [(0, 0)])
+        cache.get(world_map, [(1, 0)])
+        cache.get(world_map, [(2, 0)])
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get(world_map, [(0, 0)]), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for the "jps" pathfinding engine."""
+
+import random
+import unittest
+from collections import deque
+
+from src.map_algorithms.jump_point_search import JumpPointSearch
+from src.map_algorithms.pathfinding import PathFinder
+from src.world_map import WorldMap
+
+
+def shortest_length(world_map: WorldMap, start, goal):
+    """Number of tiles on a shortest path by plain BFS, or None."""
+    distances = {start: 1}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distances[goal]
+        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            neighbour = (x + dx, y + dy)
+            if neighbour not in distances and world_map.is_valid_move(*neighbour):
+                distances[neighbour] = distances[(x, y)] + 1
+                queue.append(neighbour)
+    return None
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    def assert_valid_path(self, world_map, path, start, goal):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for (ax, ay), (bx, by) in zip(path, path[1:]):
+            self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+            self.assertTrue(world_map.is_valid_move(bx, by))
+
+    def test_open_room_path_is_straight_runs(self):
+        world_map = WorldMap(12, 8)
+        search = JumpPointSearch(world_map, 12, 8)
+        path = search.find_path((1, 1), (10, 6))
+        assert path is not None
+        self.assert_valid_path(world_map, path, (1, 1), (10, 6))
+        self.assertEqual(len(path), 15)
+
+    def test_paths_are_shortest(self):
+        path_finder = PathFinder(engine="jps")
+        rng = random.Random(11)
+        for _ in range(30):
+            width, height = rng.randint(2, 40), rng.randint(2, 30)
+            world_map = WorldMap(width, height)
+            for y in range(height):
+                for x in range(width):
+                    if rng.random() < 0.3:
+                        world_map.set_tile_type(x, y, "wall")
+            for _ in range(10):
+                start = (rng.randrange(width), rng.randrange(height))
+                goal = (rng.randrange(width), rng.randrange(height))
+                if not world_map.is_valid_move(*start) or not world_map.is_valid_move(
+                    *goal
+                ):
+                    continue
+                path = path_finder.a_star_search(world_map, start, goal, width, height)
+                expected = shortest_length(world_map, start, goal)
+                if expected is None:
+                    self.assertIsNone(path)
+                    continue
+                assert path is not None
+                self.assertEqual(len(path), expected)
+                self.assert_valid_path(world_map, path, start, goal)
+
+    def test_tables_follow_map_version(self):
+        world_map = WorldMap(7, 3)
+        path_finder = PathFinder(engine="jps")
+        self.assertEqual(
+            len(path_finder.a_star_search(world_map, (0, 1), (6, 1), 7, 3)), 7
+        )
+
+        for y in range(3):
+            world_map.set_tile_type(3, y, "wall")
+        self.assertIsNone(path_finder.a_star_search(world_map, (0, 1), (6, 1), 7, 3))
+        world_map.set_tile_type(3, 0, "floor")
+        path = path_finder.a_star_search(world_map, (0, 1), (6, 1), 7, 3)
+        assert path is not None
+        self.assertIn((3, 0), path)
+        self.assertEqual(len(path), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
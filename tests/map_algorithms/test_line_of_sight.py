@@ -1,5 +1,6 @@
 """Tests for line of sight algorithms."""
 
+import random
 import unittest
 
 from src.map_algorithms.line_of_sight import (
@@ -7,6 +8,7 @@ from src.map_algorithms.line_of_sight import (
     get_line_tiles,
     has_clear_line_of_sight,
 )
+from src.map_builders.single_floor_builder import SingleFloorBuilder
 from src.world_map import WorldMap
 
 
@@ -84,18 +86,25 @@ class TestHasClearLineOfSight(unittest.TestCase):
 class TestCalculateVisibleTiles(unittest.TestCase):
     """Tests for visible tile calculation."""
 
+    algorithm = "shadowcast"
+
     def setUp(self):
         """Create a simple test map."""
         self.world_map = WorldMap(width=20, height=20)
 
+    def visible_from(self, x: int, y: int, radius: int):
+        return calculate_visible_tiles(
+            self.world_map, x, y, radius, algorithm=self.algorithm
+        )
+
     def test_origin_always_visible(self):
         """The origin tile should always be visible."""
-        visible = calculate_visible_tiles(self.world_map, 10, 10, 5)
+        visible = self.visible_from(10, 10, 5)
         self.assertIn((10, 10), visible)
 
     def test_adjacent_tiles_visible(self):
         """Adjacent tiles should be visible."""
-        visible = calculate_visible_tiles(self.world_map, 10, 10, 5)
+        visible = self.visible_from(10, 10, 5)
         self.assertIn((11, 10), visible)
         self.assertIn((10, 11), visible)
         self.assertIn((9, 10), visible)
@@ -103,7 +112,7 @@ class TestCalculateVisibleTiles(unittest.TestCase):
 
     def test_respects_view_radius(self):
         """Tiles beyond view radius should not be visible."""
-        visible = calculate_visible_tiles(self.world_map, 10, 10, 3)
+        visible = self.visible_from(10, 10, 3)
         # Tile at distance 5 should not be visible with radius 3
         self.assertNotIn((15, 10), visible)
 
@@ -111,7 +120,7 @@ class TestCalculateVisibleTiles(unittest.TestCase):
         """Walls should block visibility of tiles behind them."""
         # Create a wall
         self.world_map.set_tile_type(12, 10, "wall")
-        visible = calculate_visible_tiles(self.world_map, 10, 10, 5)
+        visible = self.visible_from(10, 10, 5)
 
         # Wall itself should be visible
         self.assertIn((12, 10), visible)
@@ -123,12 +132,78 @@ class TestCalculateVisibleTiles(unittest.TestCase):
     def test_can_see_around_corners(self):
         """Test that tiles around walls are visible."""
         self.world_map.set_tile_type(12, 10, "wall")
-        visible = calculate_visible_tiles(self.world_map, 10, 10, 5)
+        visible = self.visible_from(10, 10, 5)
 
         # Tiles above and below the wall should still be visible
         self.assertIn((12, 9), visible)
         self.assertIn((12, 11), visible)
 
 
+class TestCalculateVisibleTilesRaycast(TestCalculateVisibleTiles):
+    """The same visibility rules hold for the legacy raycaster."""
+
+    algorithm = "raycast"
+
+
+class TestShadowcastMatchesRaycast(unittest.TestCase):
+    """Compares shadowcasting with the legacy raycaster."""
+
+    def test_unknown_algorithm_raises(self):
+        with self.assertRaises(ValueError):
+            calculate_visible_tiles(WorldMap(5, 5), 2, 2, 2, algorithm="magic")
+
+    def test_identical_on_open_map(self):
+        world_map = WorldMap(width=25, height=25)
+        for radius in range(0, 10):
+            for x, y in [(12, 12), (0, 0), (3, 22)]:
+                self.assertEqual(
+                    calculate_visible_tiles(world_map, x, y, radius, "shadowcast"),
+                    calculate_visible_tiles(world_map, x, y, radius, "raycast"),
+                )
+
+    def test_close_agreement_on_generated_maps(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            world_map, _, _ = SingleFloorBuilder(40, 20, rng).build()
+            floors = [
+                (x, y)
+                for y, x in world_map.iter_coords()
+                if (tile := world_map.get_tile(x, y)) and tile.type != "wall"
+            ]
+            shadow_total = ray_total = shared = 0
+            for _ in range(20):
+                x, y = rng.choice(floors)
+                radius = rng.choice([3, 5, 8])
+                shadow = calculate_visible_tiles(world_map, x, y, radius)
+                ray = calculate_visible_tiles(world_map, x, y, radius, "raycast")
+                # Both only ever see tiles inside the radius, including walls
+                for vx, vy in shadow:
+                    self.assertLessEqual((vx - x) ** 2 + (vy - y) ** 2, radius**2)
+                shadow_total += len(shadow)
+                ray_total += len(ray)
+                shared += len(shadow & ray)
+            # The algorithms differ only at the fringes of shadows
+            self.assertGreater(shared / ray_total, 0.95)
+            self.assertGreater(shared / shadow_total, 0.95)
+
+    def test_shadowcast_floor_visibility_is_symmetric(self):
+        rng = random.Random(3)
+        world_map, _, _ = SingleFloorBuilder(30, 15, rng).build()
+        floors = [
+            (x, y)
+            for y, x in world_map.iter_coords()
+            if (tile := world_map.get_tile(x, y)) and tile.type != "wall"
+        ]
+        radius = 6
+        fov = {
+            pos: calculate_visible_tiles(world_map, pos[0], pos[1], radius)
+            for pos in floors
+        }
+        for pos, visible in fov.items():
+            for other in visible:
+                if other in fov:
+                    self.assertIn(pos, fov[other])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,10 @@
+import random
 import unittest
 
+from src.array_world_map import ArrayWorldMap
+
 # from src.player import Player # Removed as unused (F401)
+from src.map_algorithms.danger_grid import DangerGrid
 from src.map_algorithms.pathfinding import PathFinder
 from src.monster import Monster
 from src.tile import Tile
@@ -53,6 +57,7 @@ class TestPathFinderMultiFloor(unittest.TestCase):
 
                 world_map.grid[r][c] = tile
                 world_map.grid[r][c].is_explored = True
+        world_map.reindex_entities()
         return world_map
 
     def test_path_on_single_floor_simple(self):
@@ -216,6 +221,111 @@ class TestPathFinderMultiFloor(unittest.TestCase):
             path, "Path should be blocked by monster if avoid_monsters is True."
         )
 
+    def test_find_nearest_path_bfs_returns_closest_goal(self):
+        self.world_maps[0] = self._create_floor(0, 5, 3, [".....", "S.#..", "....."])
+        goals = [(4, 1, 0), (1, 2, 0), (1, 0, 0)]
+        path = self.path_finder.find_nearest_path_bfs(self.world_maps, (0, 1), 0, goals)
+        # (1, 0) and (1, 2) are both two steps away; BFS order (N before S)
+        # decides, exactly as it would for separate find_path_bfs calls.
+        self.assertEqual(path, [(0, 1, 0), (0, 0, 0), (1, 0, 0)])
+
+    def test_find_nearest_path_bfs_crosses_portals_and_monster_goals(self):
+        self.world_maps[0] = self._create_floor(0, 3, 1, ["S.1"])
+        self.world_maps[1] = self._create_floor(1, 3, 1, ["M.0"])
+        path = self.path_finder.find_nearest_path_bfs(
+            self.world_maps, (0, 0), 0, [(0, 0, 1)]
+        )
+        self.assertEqual(path[-1] if path else None, (0, 0, 1))
+        self.assertIsNone(
+            self.path_finder.find_nearest_path_bfs(self.world_maps, (0, 0), 0, [])
+        )
+
+    def test_risk_aware_path_detours_around_monster(self):
+        self.world_maps[0] = self._create_floor(0, 5, 3, ["..M..", "S...G", "....."])
+        path = self.path_finder.find_path_risk_aware(
+            self.world_maps, (0, 1), 0, (4, 1), 0, player_health_ratio=0.2
+        )
+        self.assertIsNotNone(path)
+        if path:
+            self.assertEqual(path[0], (0, 1, 0))
+            self.assertEqual(path[-1], (4, 1, 0))
+            # (2, 1) is next to the monster at (2, 0); the detour is cheaper
+            self.assertNotIn((2, 1, 0), path)
+
+    def test_risk_aware_path_uses_danger_grids(self):
+        self.world_maps[0] = self._create_floor(0, 5, 3, ["..M..", "S...G", "....."])
+        # A weight-1 monster makes the detour only as cheap as the straight
+        # path; a heavier one makes it cheaper
+        grid = DangerGrid(5, 3)
+        grid.set_monsters({(2, 0): 3.0})
+        path = self.path_finder.find_path_risk_aware(
+            self.world_maps,
+            (0, 1),
+            0,
+            (4, 1),
+            0,
+            player_health_ratio=0.9,
+            danger_grids={0: grid},
+        )
+        self.assertIsNotNone(path)
+        assert path is not None
+        self.assertEqual(len(path), 7)
+        self.assertNotIn((2, 1, 0), path)
+
+
+class TestAStarEngines(unittest.TestCase):
+    def _random_map(self, rng: random.Random, width: int, height: int) -> WorldMap:
+        world_map = WorldMap(width, height)
+        for y in range(height):
+            for x in range(width):
+                if rng.random() < 0.3:
+                    world_map.set_tile_type(x, y, "wall")
+        return world_map
+
+    def test_unknown_engine_raises(self):
+        with self.assertRaises(ValueError):
+            PathFinder(engine="dijkstra")
+
+    def test_tuned_engine_matches_reference_paths(self):
+        reference = PathFinder(engine="reference")
+        tuned = PathFinder()
+        rng = random.Random(42)
+        for _ in range(40):
+            width, height = rng.randint(5, 30), rng.randint(5, 20)
+            world_map = self._random_map(rng, width, height)
+            array_map = ArrayWorldMap.from_world_map(world_map)
+            for _ in range(10):
+                start = (rng.randrange(width), rng.randrange(height))
+                goal = (rng.randrange(width), rng.randrange(height))
+                expected = reference.a_star_search(
+                    world_map, start, goal, width, height
+                )
+                self.assertEqual(
+                    tuned.a_star_search(world_map, start, goal, width, height),
+                    expected,
+                )
+                self.assertEqual(
+                    tuned.a_star_search(array_map, start, goal, width, height),
+                    expected,
+                )
+
+    def test_goal_wall_tile_allowed_only_with_monster(self):
+        world_map = WorldMap(3, 1)
+        world_map.set_tile_type(2, 0, "wall")
+        for engine in PathFinder.ENGINES:
+            path_finder = PathFinder(engine=engine)
+            self.assertIsNone(
+                path_finder.a_star_search(world_map, (0, 0), (2, 0), 3, 1)
+            )
+
+        world_map.place_monster(Monster("Golem", 10, 2, random.Random(1)), 2, 0)
+        for engine in PathFinder.ENGINES:
+            path_finder = PathFinder(engine=engine)
+            self.assertEqual(
+                path_finder.a_star_search(world_map, (0, 0), (2, 0), 3, 1),
+                [(0, 0), (1, 0), (2, 0)],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
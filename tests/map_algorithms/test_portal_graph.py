@@ -0,0 +1,258 @@
+"""Tests for the portal graph and hierarchical pathfinding."""
+
+import random
+import unittest
+
+from src.map_algorithms.pathfinding import PathFinder
+from src.map_algorithms.portal_graph import PortalGraph
+from src.monster import Monster
+from src.world_map import WorldMap
+
+
+def make_floor(layout: list[str]) -> WorldMap:
+    """'#' wall, '.' floor, '?' unexplored floor, a digit a portal to that floor."""
+    world_map = WorldMap(len(layout[0]), len(layout))
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            tile = world_map.get_tile(x, y)
+            assert tile is not None
+            tile.is_explored = char != "?"
+            if char == "#":
+                tile.type = "wall"
+            elif char.isdigit():
+                tile.type = "portal"
+                tile.is_portal = True
+                tile.portal_to_floor_id = int(char)
+    return world_map
+
+
+def assert_valid_path(test, world_maps, path, start, goal):
+    test.assertEqual(path[0], start)
+    test.assertEqual(path[-1], goal)
+    for (ax, ay, af), (bx, by, bf) in zip(path, path[1:]):
+        if af == bf:
+            test.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+            test.assertTrue(world_maps[bf].is_valid_move(bx, by))
+        else:
+            test.assertEqual((ax, ay), (bx, by))
+            test.assertEqual(world_maps[af].get_tile(ax, ay).portal_to_floor_id, bf)
+
+
+class TestPortalGraph(unittest.TestCase):
+    def setUp(self):
+        self.world_maps = {
+            0: make_floor(
+                [
+                    "......1",
+                    ".#####.",
+                    "2......",
+                ]
+            ),
+            1: make_floor(
+                [
+                    "......0",
+                    "######.",
+                    ".......",
+                ]
+            ),
+            2: make_floor(
+                [
+                    ".......",
+                    ".......",
+                    "0......",
+                ]
+            ),
+        }
+        self.path_finder = PathFinder()
+
+    def test_matches_bfs_path_length(self):
+        for start, goal in [
+            ((0, 0, 0), (0, 2, 1)),
+            ((3, 2, 0), (6, 0, 2)),
+            ((6, 2, 1), (3, 1, 2)),
+        ]:
+            bfs = self.path_finder.find_path_bfs(
+                self.world_maps, start[:2], start[2], goal[:2], goal[2]
+            )
+            path = self.path_finder.find_path_hierarchical(
+                self.world_maps, start[:2], start[2], goal[:2], goal[2]
+            )
+            self.assertIsNotNone(bfs)
+            self.assertIsNotNone(path)
+            assert bfs is not None and path is not None
+            self.assertEqual(len(path), len(bfs))
+            assert_valid_path(self, self.world_maps, path, start, goal)
+
+    def test_unreachable_goal(self):
+        self.world_maps[2] = make_floor(["#######", "#.....#", "0######"])
+        graph = PortalGraph(self.world_maps)
+        self.assertIsNone(graph.find_path((0, 0), 0, (3, 1), 2))
+
+    def test_monster_on_route_is_avoided(self):
+        graph = PortalGraph(self.world_maps)
+        start, goal = (0, 0, 0), (6, 0, 2)
+        clear_path = graph.find_path(start[:2], 0, goal[:2], 2)
+        assert clear_path is not None
+        blocked = clear_path[-3]
+        self.assertEqual(blocked[2], 2)
+        monster = Monster("Rat", 5, 1, random.Random(1))
+        self.world_maps[2].place_monster(monster, blocked[0], blocked[1])
+
+        path = graph.find_path(start[:2], 0, goal[:2], 2)
+        self.assertIsNotNone(path)
+        assert path is not None
+        self.assertNotIn(blocked, path)
+        self.assertEqual(len(path), len(clear_path))
+        assert_valid_path(self, self.world_maps, path, start, goal)
+
+    def test_monster_on_intermediate_portal_blocks_route(self):
+        graph = PortalGraph(self.world_maps)
+        # The only way from floor 1 to floor 2 is through floor 0's portals
+        monster = Monster("Rat", 5, 1, random.Random(1))
+        self.world_maps[0].place_monster(monster, 0, 2)
+        self.assertIsNone(graph.find_path((6, 2), 1, (3, 0), 2))
+        self.assertIsNone(
+            self.path_finder.find_path_bfs(self.world_maps, (6, 2), 1, (3, 0), 2)
+        )
+
+        # ...unless the portal is the goal
+        path = graph.find_path((6, 2), 1, (0, 2), 0)
+        self.assertIsNotNone(path)
+        assert path is not None
+        assert_valid_path(self, self.world_maps, path, (6, 2, 1), (0, 2, 0))
+
+    def test_matches_bfs_with_monsters_on_portals(self):
+        rng = random.Random(7)
+        width, height, floors = 9, 6, 3
+        for _ in range(300):
+            world_maps = {}
+            for floor_id in range(floors):
+                world_map = WorldMap(width, height)
+                for y in range(height):
+                    for x in range(width):
+                        if rng.random() < 0.25:
+                            world_map.set_tile_type(x, y, "wall")
+                world_maps[floor_id] = world_map
+            for _ in range(rng.randint(1, 5)):
+                x, y = rng.randrange(width), rng.randrange(height)
+                a, b = rng.sample(range(floors), 2)
+                for here, there in ((a, b), (b, a)):
+                    tile = world_maps[here].get_tile(x, y)
+                    assert tile is not None
+                    tile.type = "portal"
+                    tile.is_portal = True
+                    tile.portal_to_floor_id = there
+            for floor_id, world_map in world_maps.items():
+                for y in range(height):
+                    for x in range(width):
+                        tile = world_map.get_tile(x, y)
+                        assert tile is not None
+                        chance = 0.5 if tile.is_portal else 0.05
+                        if tile.type != "wall" and rng.random() < chance:
+                            monster = Monster("Rat", 5, 1, random.Random(1))
+                            world_map.place_monster(monster, x, y)
+
+            path_finder = PathFinder()
+            start = (rng.randrange(width), rng.randrange(height), 0)
+            goal = (rng.randrange(width), rng.randrange(height), rng.randrange(1, 3))
+            bfs = path_finder.find_path_bfs(
+                world_maps, start[:2], start[2], goal[:2], goal[2]
+            )
+            path = path_finder.find_path_hierarchical(
+                world_maps, start[:2], start[2], goal[:2], goal[2]
+            )
+            if bfs is None:
+                self.assertIsNone(path, (start, goal))
+                continue
+            self.assertIsNotNone(path, (start, goal))
+            assert path is not None
+            self.assertEqual(len(path), len(bfs), (start, goal))
+            assert_valid_path(self, world_maps, path, start, goal)
+            for x, y, floor_id in path[1:-1]:
+                tile = world_maps[floor_id].get_tile(x, y)
+                assert tile is not None
+                self.assertIsNone(tile.monster, (start, goal, (x, y, floor_id)))
+
+    def test_require_explored(self):
+        self.world_maps[1] = make_floor(["??????0", "######.", "......."])
+        graph = PortalGraph(self.world_maps, require_explored=True)
+        self.assertIsNone(graph.find_path((6, 1), 0, (0, 0), 1))
+
+        # The portal landing itself may be unexplored
+        self.world_maps[1].get_tile(6, 0).is_explored = False
+        self.world_maps[1].mark_changed()
+        path = graph.find_path((6, 1), 0, (6, 2), 1)
+        self.assertEqual(path, [(6, 1, 0), (6, 0, 0), (6, 0, 1), (6, 1, 1), (6, 2, 1)])
+
+    def test_floor_fields_are_rebuilt_per_floor(self):
+        graph = PortalGraph(self.world_maps)
+        graph.find_path((0, 0), 0, (0, 0), 2)
+        fields = {
+            floor_id: dict(table.fields) for floor_id, table in graph._tables.items()
+        }
+
+        self.world_maps[2].set_tile_type(3, 1, "wall")
+        graph.find_path((0, 0), 0, (0, 0), 2)
+        self.assertEqual(graph._tables[0].fields, fields[0])
+        self.assertIsNot(graph._tables[2].fields[(0, 2)], fields[2][(0, 2)])
+
+    def test_only_fields_reaching_a_change_are_rebuilt(self):
+        world_maps = {
+            0: make_floor(["1....#...."]),
+            1: make_floor(["0....#????"]),
+        }
+        graph = PortalGraph(world_maps, require_explored=True)
+        self.assertIsNotNone(graph.find_path((4, 0), 0, (4, 0), 1))
+        landing_field = graph._tables[1].fields[(0, 0)]
+
+        # Explored beyond the wall: out of the landing's reach
+        world_maps[1].get_tile(7, 0).is_explored = True
+        world_maps[1].get_tile(8, 0).is_explored = True
+        world_maps[1].record_terrain_changes([(7, 0), (8, 0)])
+        self.assertIsNone(graph.find_path((4, 0), 0, (8, 0), 1))
+        self.assertIs(graph._tables[1].fields[(0, 0)], landing_field)
+
+        # Opening the wall reaches it
+        world_maps[1].set_tile_type(5, 0, "floor")
+        world_maps[1].get_tile(6, 0).is_explored = True
+        world_maps[1].record_terrain_changes([(6, 0)])
+        path = graph.find_path((4, 0), 0, (8, 0), 1)
+        self.assertIsNotNone(path)
+        assert path is not None
+        self.assertEqual(len(path), 14)
+        self.assertIsNot(graph._tables[1].fields[(0, 0)], landing_field)
+
+    def test_kept_fields_match_a_fresh_graph(self):
+        rng = random.Random(11)
+        graph = PortalGraph(self.world_maps)
+        for _ in range(200):
+            floor_id = rng.randrange(3)
+            world_map = self.world_maps[floor_id]
+            x, y = rng.randrange(world_map.width), rng.randrange(world_map.height)
+            if not world_map.get_tile(x, y).is_portal:
+                world_map.set_tile_type(x, y, rng.choice(["wall", "floor"]))
+            start = (rng.randrange(7), rng.randrange(3), rng.randrange(3))
+            goal = (rng.randrange(7), rng.randrange(3), rng.randrange(3))
+            path = graph.find_path(start[:2], start[2], goal[:2], goal[2])
+            fresh = PortalGraph(self.world_maps).find_path(
+                start[:2], start[2], goal[:2], goal[2]
+            )
+            self.assertEqual(path, fresh)
+
+    def test_mark_changed_drops_every_field(self):
+        graph = PortalGraph(self.world_maps)
+        graph.find_path((0, 0), 0, (0, 0), 2)
+        self.assertTrue(graph._tables[2].fields)
+        self.world_maps[2].mark_changed()
+        graph._floor_table(2)
+        self.assertEqual(graph._tables[2].fields, {})
+
+    def test_floor_points_include_portal_landings(self):
+        graph = PortalGraph(self.world_maps)
+        self.assertEqual(graph.floor_points(0), ((6, 0), (0, 2)))
+        # Floor 2's own portal and the landing from floor 0 coincide
+        self.assertEqual(graph.floor_points(2), ((0, 2),))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from src.array_world_map import ArrayWorldMap
+from src.map_builders.compact_floor_builder import CompactFloorBuilder
+from src.map_builders.single_floor_builder import SingleFloorBuilder
+from src.map_builders.world_builder import WorldBuilder
+from src.world_map import WorldMap
+
+
+def _names(world_map: WorldMap):
+    """Per tile: type, portal state and the names of its item and monster."""
+    return [
+        (
+            tile.type,
+            tile.is_portal,
+            tile.portal_to_floor_id,
+            tile.item.name if tile.item else None,
+            tile.monster.name if tile.monster else None,
+        )
+        for y, x in world_map.iter_coords()
+        if (tile := world_map.get_tile(x, y))
+    ]
+
+
+def test_builds_on_array_map_and_returns_world_map():
+    builder = CompactFloorBuilder(20, 20, random.Random(1))
+    assert isinstance(builder.world_map, ArrayWorldMap)
+
+    world_map, start, poi = builder.build()
+
+    assert type(world_map) is WorldMap
+    assert world_map.get_tile(*start).type == "floor"
+    assert world_map.get_tile(*poi).type == "floor"
+
+
+def test_existing_map_is_copied_not_modified():
+    existing = WorldMap(20, 20)
+    CompactFloorBuilder(20, 20, random.Random(1), existing_map=existing).build()
+    assert all(tile.type == "floor" for row in existing.grid for tile in row)
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("floor_portion", [0.05, 0.5, 0.8])
+def test_matches_single_floor_builder(seed, floor_portion):
+    results = []
+    for builder_class in (SingleFloorBuilder, CompactFloorBuilder):
+        rng = random.Random(seed)
+        world_map, start, poi = builder_class(
+            25, 22, rng, floor_portion=floor_portion
+        ).build()
+        results.append((_names(world_map), start, poi, rng.random()))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_world_builder_output_does_not_depend_on_compact(seed):
+    results = []
+    for compact in (False, True):
+        rng = random.Random(seed)
+        maps, start, amulet, details = WorldBuilder(
+            20, 20, rng, num_floors=3, compact=compact
+        ).build()
+        assert all(detail["map"] is maps[detail["id"]] for detail in details)
+        results.append(
+            ([_names(maps[fid]) for fid in sorted(maps)], start, amulet, rng.random())
+        )
+    assert results[0] == results[1]
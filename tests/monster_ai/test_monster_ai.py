@@ -1,6 +1,7 @@
 import random
 from unittest.mock import MagicMock
 
+from src.map_algorithms.distance_field import DistanceFieldCache
 from src.monster import Monster
 from src.monster_ai.main import MonsterAILogic
 from src.player import Player
@@ -67,3 +68,18 @@ def test_monster_ai_move_when_in_los_but_not_in_range():
     ai.state = ai._get_state("AttackingState")
     action = ai.get_next_action()
     assert action == ("move", "east")
+
+
+def test_monster_ai_chases_player_with_shared_distance_field():
+    monster = Monster(
+        "test", 10, 1, random.Random(12345), x=5, y=5, line_of_sight=5, attack_range=1
+    )
+    player = Player(x=5, y=8, current_floor_id=0, health=100)
+    world_map = WorldMap(20, 20)
+    distance_fields = DistanceFieldCache()
+    ai = MonsterAILogic(
+        monster, player, world_map, random.Random(), distance_fields=distance_fields
+    )
+    ai.state = ai._get_state("AttackingState")
+    assert ai.get_next_action() == ("move", "south")
+    assert len(distance_fields) == 1
@@ -0,0 +1,86 @@
+import random
+from unittest.mock import patch
+
+from src.map_algorithms.distance_field import DistanceFieldCache
+from src.map_algorithms.line_of_sight import calculate_visible_tiles_shadowcast
+from src.monster import Monster
+from src.monster_ai.main import MonsterAILogic
+from src.monster_ai.turn import MonsterTurn
+from src.player import Player
+from src.world_map import WorldMap
+
+
+def _chaser(x, y, player, world_map):
+    monster = Monster(
+        "test", 10, 1, random.Random(1), x=x, y=y, line_of_sight=6, attack_range=1
+    )
+    return MonsterAILogic(monster, player, world_map, random.Random(1))
+
+
+def test_monsters_share_one_field_of_view():
+    world_map = WorldMap(20, 20)
+    world_map.set_tile_type(5, 7, "wall")
+    turn = MonsterTurn(world_map, 5, 10)
+
+    with patch(
+        "src.monster_ai.turn.calculate_visible_tiles_shadowcast",
+        wraps=calculate_visible_tiles_shadowcast,
+    ) as shadowcast:
+        assert not turn.has_clear_line(5, 5)
+        assert turn.has_clear_line(6, 10)
+        assert turn.has_clear_line(8, 7)
+        # Only a monster beyond the radius seen so far widens the view
+        assert shadowcast.call_count == 1
+        assert turn.has_clear_line(5, 16)
+        assert shadowcast.call_count == 2
+
+
+def test_line_of_sight_is_symmetric():
+    world_map = WorldMap(12, 12)
+    rng = random.Random(3)
+    for _ in range(30):
+        world_map.set_tile_type(rng.randrange(12), rng.randrange(12), "wall")
+    for player_x, player_y in [(1, 1), (6, 5), (10, 9)]:
+        if world_map.get_tile(player_x, player_y).type == "wall":
+            continue
+        turn = MonsterTurn(world_map, player_x, player_y)
+        for y in range(12):
+            for x in range(12):
+                if world_map.get_tile(x, y).type == "wall":
+                    continue
+                seen_from_monster = calculate_visible_tiles_shadowcast(
+                    world_map, x, y, 17
+                )
+                assert turn.has_clear_line(x, y) == (
+                    (player_x, player_y) in seen_from_monster
+                )
+
+
+def test_monsters_share_the_turn_distance_field():
+    world_map = WorldMap(20, 20)
+    player = Player(x=5, y=8, current_floor_id=0, health=10)
+    distance_fields = DistanceFieldCache()
+    turn = MonsterTurn(world_map, player.x, player.y, distance_fields)
+    north = _chaser(5, 5, player, world_map)
+    west = _chaser(2, 8, player, world_map)
+
+    assert north.get_next_action(turn) == ("move", "south")
+    assert west.get_next_action(turn) == ("move", "east")
+    assert len(distance_fields) == 1
+
+
+def test_stale_turn_is_ignored():
+    world_map = WorldMap(20, 20)
+    player = Player(x=5, y=8, current_floor_id=0, health=10)
+    turn = MonsterTurn(world_map, player.x, player.y)
+    assert turn.is_current(world_map, 5, 8)
+
+    player.x = 9  # The player moved after the turn was set up
+    ai = _chaser(5, 5, player, world_map)
+    with patch.object(MonsterTurn, "has_clear_line") as has_clear_line:
+        ai.get_next_action(turn)
+    has_clear_line.assert_not_called()
+    assert ai.turn is None
+
+    world_map.set_tile_type(0, 0, "wall")
+    assert not turn.is_current(world_map, 5, 8)
@@ -0,0 +1,191 @@
+import random
+
+import pytest
+
+from src.array_world_map import (
+    OCCUPANT_ITEM,
+    OCCUPANT_MONSTER,
+    WALL_CODE,
+    ArrayWorldMap,
+    TileView,
+)
+from src.items import ConsumableItem
+from src.monster import Monster
+from src.tile import Tile
+from src.world_map import WorldMap
+
+
+@pytest.fixture
+def sample_item():
+    return ConsumableItem(
+        "Potion", "Heals 10 HP", {"type": "heal", "amount": 10}, effects=[]
+    )
+
+
+@pytest.fixture
+def sample_monster():
+    return Monster("Goblin", 30, 5, random.Random(12345))
+
+
+def test_initialization_defaults_to_floor():
+    w_map = ArrayWorldMap(width=10, height=8)
+    assert len(w_map.tile_types) == 80
+    assert len(w_map.grid) == 8
+    assert len(w_map.grid[0]) == 10
+    tile = w_map.get_tile(9, 7)
+    assert isinstance(tile, Tile)
+    assert tile.type == "floor"
+    assert not tile.is_explored
+    assert not tile.is_portal
+    assert tile.portal_to_floor_id is None
+
+
+def test_get_tile_out_of_bounds():
+    w_map = ArrayWorldMap(width=5, height=5)
+    assert w_map.get_tile(-1, 2) is None
+    assert w_map.get_tile(5, 2) is None
+    assert w_map.get_tile(2, 5) is None
+
+
+def test_tile_view_writes_through_to_buffers():
+    w_map = ArrayWorldMap(width=4, height=3)
+    tile = w_map.get_tile(2, 1)
+    assert tile is not None
+    tile.type = "wall"
+    tile.is_explored = True
+    tile.is_currently_visible = True
+    tile.is_portal = True
+    tile.portal_to_floor_id = 3
+
+    index = w_map.index(2, 1)
+    assert w_map.tile_types[index] == WALL_CODE
+    assert w_map.explored[index] == 1
+    assert w_map.visible[index] == 1
+    assert w_map.portal_flags[index] == 1
+    assert w_map.portal_dest[index] == 3
+
+    # A fresh proxy for the same cell sees the same state and compares equal
+    same_tile = w_map.get_tile(2, 1)
+    assert same_tile == tile
+    assert same_tile is not None and same_tile.portal_to_floor_id == 3
+
+
+def test_unknown_tile_type_is_registered():
+    w_map = ArrayWorldMap(width=2, height=2)
+    assert w_map.set_tile_type(0, 0, "lava") is True
+    tile = w_map.get_tile(0, 0)
+    assert tile is not None and tile.type == "lava"
+
+
+def test_set_tile_type_and_is_valid_move():
+    w_map = ArrayWorldMap(width=3, height=3)
+    assert w_map.set_tile_type(1, 1, "wall") is True
+    assert w_map.set_tile_type(3, 1, "wall") is False
+    assert w_map.is_valid_move(1, 1) is False
+    assert w_map.is_valid_move(0, 0) is True
+    assert w_map.is_valid_move(-1, 0) is False
+
+    tile = w_map.get_tile(1, 1)
+    assert tile is not None
+    tile.is_portal = True
+    assert w_map.is_valid_move(1, 1) is True
+
+
+def test_place_and_remove_item_updates_occupancy(sample_item):
+    w_map = ArrayWorldMap(width=5, height=5)
+    assert w_map.place_item(sample_item, 2, 2) is True
+    assert w_map.occupancy[w_map.index(2, 2)] & OCCUPANT_ITEM
+    assert w_map.place_item(sample_item, 2, 2) is False
+
+    assert w_map.remove_item(2, 2) is sample_item
+    assert w_map.occupancy[w_map.index(2, 2)] == 0
+    tile = w_map.get_tile(2, 2)
+    assert tile is not None and tile.item is None
+
+
+def test_place_and_remove_monster(sample_monster):
+    w_map = ArrayWorldMap(width=5, height=5)
+    assert w_map.place_monster(sample_monster, 3, 1) is True
+    assert (sample_monster.x, sample_monster.y) == (3, 1)
+    assert w_map.occupancy[w_map.index(3, 1)] & OCCUPANT_MONSTER
+    assert w_map.get_monsters() == [sample_monster]
+
+    assert w_map.remove_monster(3, 1) is sample_monster
+    assert w_map.get_monsters() == []
+
+
+def test_display_info_matches_tile(sample_monster):
+    w_map = ArrayWorldMap(width=3, height=1)
+    w_map.set_tile_type(0, 0, "wall")
+    w_map.place_monster(sample_monster, 1, 0)
+    for x in range(3):
+        tile = w_map.get_tile(x, 0)
+        assert tile is not None
+        tile.is_explored = x != 2
+
+    display = [
+        tile.get_display_info(apply_fog=True)
+        for x in range(3)
+        if (tile := w_map.get_tile(x, 0)) is not None
+    ]
+    assert display == [("#", "wall"), ("M", "monster"), (" ", "fog")]
+
+
+def test_from_world_map_copies_cell_state(sample_item, sample_monster):
+    source = WorldMap(4, 3)
+    source.set_tile_type(0, 0, "wall")
+    source.grid[1][2] = Tile(tile_type="portal", portal_to_floor_id=1)
+    source.grid[1][2].is_explored = True
+    source.place_item(sample_item, 1, 1)
+    source.place_monster(sample_monster, 3, 2)
+
+    converted = ArrayWorldMap.from_world_map(source)
+
+    for y, x in source.iter_coords():
+        original = source.get_tile(x, y)
+        view = converted.get_tile(x, y)
+        assert original is not None and isinstance(view, TileView)
+        assert view.type == original.type
+        assert view.is_explored == original.is_explored
+        assert view.is_portal == original.is_portal
+        assert view.portal_to_floor_id == original.portal_to_floor_id
+        assert view.item is original.item
+        assert view.monster is original.monster
+
+
+def test_to_world_map_round_trips_cell_state(sample_item, sample_monster):
+    array_map = ArrayWorldMap(4, 3)
+    array_map.set_tile_type(0, 0, "wall")
+    portal = array_map.get_tile(2, 1)
+    assert portal is not None
+    portal.is_portal = True
+    portal.portal_to_floor_id = 1
+    portal.is_explored = True
+    array_map.place_item(sample_item, 1, 1)
+    array_map.place_monster(sample_monster, 3, 2)
+
+    world_map = array_map.to_world_map()
+
+    assert type(world_map) is WorldMap
+    for y, x in array_map.iter_coords():
+        view = array_map.get_tile(x, y)
+        tile = world_map.get_tile(x, y)
+        assert view is not None and tile is not None
+        assert tile.type == view.type
+        assert tile.is_explored == view.is_explored
+        assert tile.is_portal == view.is_portal
+        assert tile.portal_to_floor_id == view.portal_to_floor_id
+        assert tile.item is view.item
+        assert tile.monster is view.monster
+    assert world_map.get_monster_position(sample_monster) == (3, 2)
+
+
+def test_type_mask_and_coords_in():
+    array_map = ArrayWorldMap(4, 3, "wall")
+    for x, y in [(0, 0), (1, 1), (2, 1), (3, 2)]:
+        array_map.set_tile_type(x, y, "floor")
+
+    mask = array_map.type_mask("floor")
+    assert array_map.coords_in(mask) == [(0, 0), (1, 1), (2, 1), (3, 2)]
+    interior = array_map.type_mask("floor", interior=True)
+    assert array_map.coords_in(interior) == [(1, 1), (2, 1)]
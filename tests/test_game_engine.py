@@ -1,5 +1,8 @@
+import contextlib
 import curses
+import io
 import os
+import random
 import sys
 import unittest
 from unittest.mock import MagicMock, patch
@@ -8,6 +11,7 @@ from src.game_engine import GameEngine
 from src.game_state import GameState
 from src.input_mode import InputMode
 from src.message_log import MessageLog
+from src.run_result import RunLimit
 from src.world_map import WorldMap
 
 
@@ -49,6 +53,8 @@ class TestGameEngine(unittest.TestCase):
         self.mock_world_map_instance = MagicMock(spec=WorldMap)
         self.mock_world_map_instance.width = 20
         self.mock_world_map_instance.height = 10
+        self.mock_world_map_instance.version = 0
+        self.mock_world_map_instance.take_changed_tiles.return_value = set()
         self.mock_world_map_instance.place_player = MagicMock()
 
         self.player_start_coords_f0 = (1, 1)
@@ -77,6 +83,7 @@ class TestGameEngine(unittest.TestCase):
         self.mock_player_instance.current_floor_id = 0
         self.mock_player_instance.health = 100
         self.mock_player_instance.invisibility_turns = 0
+        self.mock_player_instance.get_view_radius.return_value = 5
 
         self.mock_parser_instance = MockParser.return_value
         self.mock_input_handler_instance = MockInputHandler.return_value
@@ -296,6 +303,8 @@ class TestGameEngine(unittest.TestCase):
             mock_wm_inst_debug = MagicMock(spec=WorldMap)
             mock_wm_inst_debug.width = 10
             mock_wm_inst_debug.height = 5
+            mock_wm_inst_debug.version = 0
+            mock_wm_inst_debug.take_changed_tiles.return_value = set()
 
             # Adjust mock for generate_world
             mock_wg_inst_debug.generate_world.return_value = (
@@ -313,6 +322,7 @@ class TestGameEngine(unittest.TestCase):
             mock_player_inst_debug.current_floor_id = 0
             mock_player_inst_debug.health = 100
             mock_player_inst_debug.invisibility_turns = 0
+            mock_player_inst_debug.get_view_radius.return_value = 5
 
             debug_engine = GameEngine(map_width=10, map_height=5, debug_mode=True)
             debug_engine._debug_commands = [("quit", None)]
@@ -427,5 +437,213 @@ class TestGameEngine(unittest.TestCase):
         )
 
 
+class TestIncrementalFogOfWar(unittest.TestCase):
+    """Incremental fog-of-war must give the same visible maps as a full rebuild."""
+
+    @staticmethod
+    def _snapshot(visible_map):
+        return [
+            (
+                tile.type,
+                tile.item,
+                tile.monster,
+                tile.is_explored,
+                tile.is_currently_visible,
+                tile.is_portal,
+            )
+            for row in visible_map.grid
+            for tile in row
+        ]
+
+    @patch("src.game_engine.curses")
+    def test_matches_full_update_while_world_changes(self, mock_curses):
+        for seed in range(3):
+            game = GameEngine(map_width=30, map_height=15, seed=seed, debug_mode=True)
+            reference = GameEngine(
+                map_width=30,
+                map_height=15,
+                seed=seed,
+                debug_mode=True,
+                incremental_fog=False,
+            )
+            # Drive both engines from the same world and player
+            reference.world_maps = game.world_maps
+            reference.player = game.player
+            rng = random.Random(seed)
+
+            for _ in range(150):
+                player = game.player
+                world_map = game.world_maps[player.current_floor_id]
+                roll = rng.random()
+                if roll < 0.6:
+                    dx, dy = rng.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
+                    if world_map.is_valid_move(player.x + dx, player.y + dy):
+                        player.x += dx
+                        player.y += dy
+                elif roll < 0.8:
+                    for x, y, monster in world_map.get_monsters_with_positions():
+                        dx, dy = rng.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
+                        if world_map.is_valid_move(x + dx, y + dy):
+                            world_map.move_monster(monster, x + dx, y + dy)
+                elif roll < 0.9:
+                    items = world_map.get_items()
+                    if items:
+                        x, y, item = rng.choice(items)
+                        world_map.remove_item(x, y)
+                        world_map.place_item(item, player.x, player.y)
+                elif roll < 0.95:
+                    x = rng.randrange(world_map.width)
+                    y = rng.randrange(world_map.height)
+                    world_map.set_tile_type(x, y, rng.choice(["wall", "floor"]))
+                else:
+                    player.current_floor_id = rng.choice(list(game.world_maps))
+
+                game._update_fog_of_war_visibility()
+                reference._update_fog_of_war_visibility()
+                floor_id = player.current_floor_id
+                self.assertEqual(
+                    self._snapshot(game.visible_maps[floor_id]),
+                    self._snapshot(reference.visible_maps[floor_id]),
+                )
+
+    @patch("src.game_engine.curses")
+    def test_visible_map_version_bumps_once_per_update(self, mock_curses):
+        game = GameEngine(map_width=30, map_height=15, seed=1, debug_mode=True)
+        floor_id = game.player.current_floor_id
+        visible_map = game.visible_maps[floor_id]
+        game._update_fog_of_war_visibility()
+        seen = visible_map.version
+
+        # Nothing new in view: the version, and the caches keyed on it, stay
+        game._update_fog_of_war_visibility()
+        self.assertEqual(visible_map.version, seen)
+
+        game.world_maps[floor_id].set_tile_type(game.player.x, game.player.y, "wall")
+        game._update_fog_of_war_visibility()
+        self.assertEqual(visible_map.version, seen + 1)
+        self.assertEqual(
+            visible_map.terrain_changes_since(seen), [(game.player.x, game.player.y)]
+        )
+        self.assertEqual(visible_map.changed_tiles, set())
+
+
+class TestRunLimits(unittest.TestCase):
+    """GameEngine.run budgets and the RunResult they produce."""
+
+    def _make_game(self):
+        with patch("src.game_engine.curses"):
+            return GameEngine(
+                map_width=30,
+                map_height=15,
+                seed=3,
+                debug_mode=True,
+                ai_active=True,
+                ai_sleep_duration=0,
+            )
+
+    def test_turn_budget_stops_game(self):
+        game = self._make_game()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = game.run(max_turns=5)
+        self.assertEqual(result.limit_reached, RunLimit.MAX_TURNS)
+        self.assertEqual(result.turns, 5)
+        self.assertEqual(game.turn_count, 5)
+        self.assertEqual(result.game_state, GameState.GAME_OVER)
+        self.assertFalse(result.player_won)
+
+    def test_turn_budget_is_deterministic(self):
+        positions = []
+        for _ in range(2):
+            game = self._make_game()
+            with contextlib.redirect_stdout(io.StringIO()):
+                game.run(max_turns=15)
+            positions.append((game.player.x, game.player.y, game.player.health))
+        self.assertEqual(positions[0], positions[1])
+
+    @patch("src.game_engine.time")
+    def test_wall_clock_budget_stops_game(self, mock_time):
+        # Every call to time.time() advances the clock by one second
+        mock_time.time.side_effect = iter(range(1000))
+        game = self._make_game()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = game.run(max_seconds=4.5)
+        self.assertEqual(result.limit_reached, RunLimit.MAX_SECONDS)
+        self.assertLess(result.turns, 5)
+
+    def _run_commands(self, game, commands):
+        with (
+            patch.object(game, "_get_next_command", side_effect=commands),
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            return game.run(max_turns=len(commands))
+
+    def test_taking_the_quest_item_is_a_win(self):
+        game = self._make_game()
+        game.player.x, game.player.y, game.player.current_floor_id = (
+            game.winning_full_pos
+        )
+        result = self._run_commands(game, [("take", None)])
+        self.assertEqual(result.game_state, GameState.GAME_OVER)
+        self.assertIsNone(result.limit_reached)
+        self.assertTrue(result.player_won)
+
+    def test_quitting_is_not_a_win(self):
+        game = self._make_game()
+        result = self._run_commands(game, [("quit", None)])
+        self.assertIsNone(result.limit_reached)
+        self.assertGreater(result.player_health, 0)
+        self.assertFalse(result.player_won)
+
+    def test_game_over_from_an_error_is_not_a_win(self):
+        game = self._make_game()
+        game.player.current_floor_id = 99  # "Floor 99 not found" ends the game
+        with patch.object(game, "_update_fog_of_war_visibility"):
+            result = self._run_commands(game, [("look", None)])
+        self.assertEqual(result.game_state, GameState.GAME_OVER)
+        self.assertIsNone(result.limit_reached)
+        self.assertGreater(result.player_health, 0)
+        self.assertFalse(result.player_won)
+
+
+class TestRenderScheduling(unittest.TestCase):
+    """AI games with a target frame rate."""
+
+    @patch("src.game_engine.InputHandler")
+    @patch("src.game_engine.Renderer")
+    @patch("src.game_engine.curses")
+    @patch("src.game_engine.time.sleep")
+    def test_frames_are_skipped_but_final_state_rendered(
+        self, mock_sleep, mock_curses, MockRenderer, MockInputHandler
+    ):
+        game = GameEngine(
+            map_width=30,
+            map_height=15,
+            seed=3,
+            ai_active=True,
+            ai_sleep_duration=0.5,
+            target_fps=30,
+        )
+        assert game.render_scheduler is not None
+        # The clock never advances, so only the first turn's frame is due
+        game.render_scheduler._clock = lambda: 0.0
+
+        result = game.run(max_turns=20)
+
+        mock_sleep.assert_not_called()
+        # Frames are only due after turns that leave the game running, so a
+        # game that ends before the budget has one check fewer
+        checked = result.turns if result.limit_reached else result.turns - 1
+        self.assertGreater(checked, 1)
+        self.assertEqual(game.render_scheduler.frames_rendered, 1)
+        self.assertEqual(game.render_scheduler.frames_skipped, checked - 1)
+        # Initial state, the one due frame and the final state
+        self.assertEqual(MockRenderer.return_value.render_all.call_count, 3)
+
+    def test_no_scheduler_without_ai(self):
+        with patch("src.game_engine.curses"), patch("src.game_engine.Renderer"):
+            game = GameEngine(map_width=30, map_height=15, seed=3, target_fps=30)
+        self.assertIsNone(game.render_scheduler)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from src.render_scheduler import RenderScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRenderScheduler(unittest.TestCase):
+    def test_first_frame_is_due(self):
+        scheduler = RenderScheduler(30, clock=FakeClock())
+        self.assertTrue(scheduler.frame_due())
+
+    def test_frames_within_interval_are_skipped(self):
+        clock = FakeClock()
+        scheduler = RenderScheduler(10, clock=clock)
+        self.assertTrue(scheduler.frame_due())
+        clock.now += 0.05
+        self.assertFalse(scheduler.frame_due())
+        clock.now += 0.05
+        self.assertTrue(scheduler.frame_due())
+        self.assertEqual(scheduler.frames_rendered, 2)
+        self.assertEqual(scheduler.frames_skipped, 1)
+
+    def test_slow_frame_is_not_followed_by_catch_up_frames(self):
+        clock = FakeClock()
+        scheduler = RenderScheduler(10, clock=clock)
+        scheduler.frame_due()
+        clock.now += 1.0  # Ten frame intervals pass without a check
+        self.assertTrue(scheduler.frame_due())
+        clock.now += 0.01
+        self.assertFalse(scheduler.frame_due())
+
+    def test_rejects_non_positive_fps(self):
+        with self.assertRaises(ValueError):
+            RenderScheduler(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
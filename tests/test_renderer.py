@@ -1,10 +1,13 @@
+import random
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.array_world_map import ArrayWorldMap
 from src.input_mode import InputMode
+from src.map_builders.world_builder import WorldBuilder
 from src.message_log import MessageLog
-from src.renderer import Renderer
+from src.renderer import Renderer, _path_overlay
 from src.tile import Tile
 from src.world_map import WorldMap
 
@@ -267,3 +270,152 @@ def test_render_path(setup_renderer):
     assert map_output_section[2][1] == "*"
     assert map_output_section[3][1] == "*"
     assert map_output_section[3][2] == "x"
+
+
+@pytest.fixture
+def curses_renderer():
+    """A curses-mode Renderer drawing to a mock screen."""
+    stdscr = MagicMock()
+    stdscr.getmaxyx.return_value = (24, 80)
+    with (
+        patch("curses.initscr", return_value=stdscr),
+        patch("curses.start_color"),
+        patch("curses.noecho"),
+        patch("curses.cbreak"),
+        patch("curses.curs_set"),
+        patch("curses.init_pair"),
+        patch("curses.LINES", 24, create=True),
+        patch("curses.COLS", 80, create=True),
+        patch("curses.color_pair", side_effect=lambda pair: pair << 8),
+        patch("curses.doupdate") as doupdate,
+    ):
+        renderer = Renderer(
+            debug_mode=False, map_width=10, map_height=5, player_symbol="@"
+        )
+        yield renderer, doupdate
+
+
+def _render_curses(renderer, world_map, player_pos, message_log):
+    renderer.render_all(
+        player_pos[0],
+        player_pos[1],
+        100,
+        world_map,
+        InputMode.MOVEMENT,
+        "",
+        message_log,
+        0,
+    )
+
+
+def test_curses_render_writes_only_changed_cells(curses_renderer):
+    renderer, doupdate = curses_renderer
+    world_map = MockWorldMap(10, 5)
+    message_log = MessageLog()
+
+    _render_curses(renderer, world_map, (5, 2), message_log)
+    stdscr = renderer.stdscr
+    stdscr.erase.assert_called_once()
+    stdscr.clear.assert_not_called()
+    assert doupdate.call_count == 1
+    first_frame_writes = stdscr.addstr.call_count
+    assert first_frame_writes > 0
+
+    stdscr.addstr.reset_mock()
+    _render_curses(renderer, world_map, (5, 2), message_log)
+    stdscr.addstr.assert_not_called()
+    assert doupdate.call_count == 2
+
+    # Moving the player redraws the old and the new position only
+    _render_curses(renderer, world_map, (6, 2), message_log)
+    written = {(c.args[0], c.args[1], c.args[2]) for c in stdscr.addstr.call_args_list}
+    assert written == {(2, 5, "."), (2, 6, "@")}
+    stdscr.erase.assert_called_once()
+
+
+def test_curses_render_blanks_cells_no_longer_drawn(curses_renderer):
+    renderer, _ = curses_renderer
+    world_map = MockWorldMap(10, 5)
+    message_log = MessageLog()
+    message_log.add_message("A long message")
+    _render_curses(renderer, world_map, (5, 2), message_log)
+
+    renderer.stdscr.addstr.reset_mock()
+    message_log.clear()
+    message_log.add_message("Short")
+    _render_curses(renderer, world_map, (5, 2), message_log)
+
+    calls = [c.args for c in renderer.stdscr.addstr.call_args_list]
+    assert calls == [(8, 0, "Short", 6 << 8), (8, 5, "         ", 0)]
+
+
+def test_curses_render_repaints_after_invalidate(curses_renderer):
+    renderer, _ = curses_renderer
+    world_map = MockWorldMap(10, 5)
+    _render_curses(renderer, world_map, (5, 2), MessageLog())
+    first_frame_writes = renderer.stdscr.addstr.call_count
+
+    renderer.invalidate()
+    _render_curses(renderer, world_map, (5, 2), MessageLog())
+    assert renderer.stdscr.erase.call_count == 2
+    assert renderer.stdscr.addstr.call_count == 2 * first_frame_writes
+
+
+def test_render_path_only_draws_current_floor(setup_renderer):
+    renderer, world_map, player_pos, player_health, message_log, *_ = setup_renderer
+    # Starts on floor 1, continues on floor 0 and ends back on floor 1
+    path = [(1, 1, 1), (2, 1, 0), (3, 1, 0), (3, 2, 1)]
+
+    output = renderer.render_all(
+        player_pos[0],
+        player_pos[1],
+        player_health,
+        world_map,
+        InputMode.MOVEMENT,
+        "",
+        message_log,
+        0,
+        debug_render_to_list=True,
+        ai_path=path,
+    )
+
+    assert output[1][1:4] == ".**"
+    assert "x" not in "".join(output[: world_map.height])
+
+
+def test_curses_render_draws_path_in_path_color(curses_renderer):
+    renderer, _ = curses_renderer
+    renderer.render_all(
+        5,
+        2,
+        100,
+        MockWorldMap(10, 5),
+        InputMode.MOVEMENT,
+        "",
+        MessageLog(),
+        0,
+        ai_path=[(1, 1, 0), (2, 1, 0), (3, 1, 0)],
+    )
+
+    calls = [c.args for c in renderer.stdscr.addstr.call_args_list]
+    assert (1, 1, "**x", renderer.PATH_COLOR_PAIR << 8) in calls
+
+
+@pytest.mark.parametrize("apply_fog", [False, True])
+def test_list_render_matches_per_tile_render(apply_fog):
+    rng = random.Random(5)
+    maps, start, *_ = WorldBuilder(30, 20, rng, num_floors=2).build()
+    renderer = Renderer(debug_mode=True, map_width=30, map_height=20, player_symbol="@")
+    path = [(start[0] + 1, start[1], 0), (3, 3, 0), (4, 3, 1)]
+    for world_map in maps.values():
+        for row in world_map.grid:
+            for tile in row:
+                tile.is_explored = rng.random() < 0.5
+        array_map = ArrayWorldMap.from_world_map(world_map)
+        for rendered_map in (world_map, array_map):
+            overlay = _path_overlay(path, 0)
+            assert renderer._map_text_rows(
+                rendered_map, start[0], start[1], overlay, apply_fog
+            ) == renderer._map_text_rows_per_tile(
+                rendered_map, start[0], start[1], overlay, apply_fog
+            )
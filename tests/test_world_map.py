@@ -1,9 +1,10 @@
 import pytest
 
-from src.items import ConsumableItem
+from src.items import ConsumableItem, EquippableItem
+from src.items.categories import HEALING, OTHER, equipment_category
 from src.monster import Monster
 from src.tile import Tile
-from src.world_map import WorldMap
+from src.world_map import TERRAIN_LOG_SIZE, WorldMap
 
 
 # Test Initialization
@@ -187,3 +188,118 @@ def test_remove_monster_invalid_coordinates():
     w_map = WorldMap(width=5, height=5)
     assert w_map.remove_monster(5, 3) is None  # x out of bounds
     assert w_map.remove_monster(3, 5) is None  # y out of bounds
+
+
+# Test the entity index
+def test_get_monsters_is_row_major_and_tracks_moves(sample_monster):
+    import random
+
+    w_map = WorldMap(width=5, height=5)
+    orc = Monster("Orc", 50, 10, random.Random(1))
+    w_map.place_monster(sample_monster, 1, 3)
+    w_map.place_monster(orc, 4, 0)
+    assert w_map.get_monsters() == [orc, sample_monster]
+
+    assert w_map.move_monster(sample_monster, 2, 0) is True
+    assert (sample_monster.x, sample_monster.y) == (2, 0)
+    assert w_map.get_monsters() == [sample_monster, orc]
+    assert w_map.get_tile_by_monster(sample_monster) is w_map.get_tile(2, 0)
+    assert w_map.get_monster_at(1, 3) is None
+    tile = w_map.get_tile(1, 3)
+    assert tile is not None and tile.monster is None
+
+    # Moving onto an occupied tile is refused and leaves both in place
+    assert w_map.move_monster(sample_monster, 4, 0) is False
+    assert w_map.get_monster_position(sample_monster) == (2, 0)
+
+    w_map.remove_monster(2, 0)
+    assert w_map.get_tile_by_monster(sample_monster) is None
+    assert w_map.get_monsters() == [orc]
+
+
+def test_get_items(sample_item):
+    w_map = WorldMap(width=5, height=5)
+    w_map.place_item(sample_item, 3, 2)
+    assert w_map.get_items() == [(3, 2, sample_item)]
+    w_map.remove_item(3, 2)
+    assert w_map.get_items() == []
+
+
+def test_reindex_entities_after_direct_tile_assignment(sample_monster, sample_item):
+    w_map = WorldMap(width=4, height=4)
+    w_map.grid[2][1] = Tile(monster=sample_monster, item=sample_item)
+    assert w_map.get_monsters() == []
+
+    w_map.reindex_entities()
+    assert w_map.get_monsters() == [sample_monster]
+    assert w_map.get_monster_position(sample_monster) == (1, 2)
+    assert w_map.get_items() == [(1, 2, sample_item)]
+
+
+def test_take_changed_tiles_tracks_edits(sample_monster, sample_item):
+    w_map = WorldMap(width=5, height=5)
+    assert w_map.take_changed_tiles() == set()
+
+    w_map.set_tile_type(0, 0, "wall")
+    w_map.place_item(sample_item, 1, 1)
+    w_map.place_monster(sample_monster, 2, 2)
+    w_map.move_monster(sample_monster, 3, 2)
+    assert w_map.take_changed_tiles() == {(0, 0), (1, 1), (2, 2), (3, 2)}
+    assert w_map.take_changed_tiles() == set()
+
+    w_map.remove_item(1, 1)
+    w_map.remove_item(4, 4)  # Nothing there, nothing changed
+    assert w_map.take_changed_tiles() == {(1, 1)}
+
+
+def test_terrain_changes_since_replays_set_tile_type():
+    w_map = WorldMap(width=5, height=5)
+    assert w_map.terrain_changes_since(w_map.version) == []
+
+    w_map.set_tile_type(0, 0, "wall")
+    seen = w_map.version
+    w_map.set_tile_type(1, 0, "wall")
+    w_map.set_tile_type(0, 0, "floor")
+    assert w_map.terrain_changes_since(seen) == [(1, 0), (0, 0)]
+    assert w_map.terrain_changes_since(0) == [(0, 0), (1, 0), (0, 0)]
+
+    # Direct edits cannot be replayed
+    w_map.mark_changed()
+    w_map.set_tile_type(2, 2, "wall")
+    assert w_map.terrain_changes_since(seen) is None
+    assert w_map.terrain_changes_since(w_map.version - 1) == [(2, 2)]
+
+
+def test_record_terrain_changes_logs_one_version():
+    w_map = WorldMap(width=5, height=5)
+    seen = w_map.version
+    w_map.record_terrain_changes([(1, 1), (2, 1)])
+    assert w_map.version == seen + 1
+    assert w_map.terrain_changes_since(seen) == [(1, 1), (2, 1)]
+    assert w_map.take_changed_tiles() == {(1, 1), (2, 1)}
+
+
+def test_terrain_log_drops_whole_versions():
+    w_map = WorldMap(width=5, height=5)
+    w_map.record_terrain_changes([(0, 0)] * (TERRAIN_LOG_SIZE - 1))
+    seen = w_map.version
+    w_map.record_terrain_changes([(1, 1), (2, 2)])
+    # The first version no longer fits, and is not kept in part
+    assert w_map.terrain_changes_since(seen - 1) is None
+    assert w_map.terrain_changes_since(seen) == [(1, 1), (2, 2)]
+
+
+def test_items_are_bucketed_by_category(sample_item):
+    w_map = WorldMap(width=5, height=5)
+    sword = EquippableItem("Sword", "", {"slot": "main_hand"})
+    w_map.place_item(sample_item, 3, 3)
+    w_map.place_item(sword, 4, 0)
+    assert w_map.get_items_in_categories(OTHER) == [(3, 3, sample_item)]
+    assert w_map.get_items_in_categories(HEALING) == []
+    assert w_map.get_items_in_categories(OTHER, equipment_category("main_hand")) == [
+        (4, 0, sword),
+        (3, 3, sample_item),
+    ]
+
+    w_map.remove_item(4, 0)
+    assert w_map.get_items_in_categories(equipment_category("main_hand")) == []